@@ -0,0 +1,88 @@
+"""Growth of the parse time with the size of adversarial records.
+
+Each family builds records of a growing size n aimed at the costly parts of the
+grammar: the IPv6address alternatives, long rua lists, pct-encoded reg-names,
+long paths and runs of whitespace. For each family the time per record and per
+character is reported for every size, with the exponent of the growth between
+the smallest and largest sizes (1 for a linear growth):
+
+    python benchmarks/bench_adversarial.py [--sizes 50 100 200 400] [--rounds N]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dmarcparser.parser import DmarcParser
+
+HEAD = "v=DMARC1; p=none; rua="
+
+FAMILIES: Dict[str, Callable[[int], str]] = {
+    # n IPv6 literals only matched by the last IPv6address alternative
+    "ipv6 literals": lambda n: HEAD
+    + ",".join(f"https://[{i:x}:2:3:4:5:6:7::]" for i in range(n)),
+    # one literal of n groups, longer than any alternative allows (rejected)
+    "ipv6 overlong": lambda n: HEAD + "https://[" + ":".join(["ffff"] * n) + "]",
+    "rua list": lambda n: HEAD
+    + ",".join(f"mailto:dmarc-{i}@example.com!10m" for i in range(n)),
+    "pct-encoded": lambda n: HEAD + "mailto:a@" + "%41" * n + ".example",
+    "long path": lambda n: HEAD + "https://example.com/" + "a/" * n + "!1k",
+    # whitespace runs: a folded line goes through the APG tag-list parser
+    "deep wsp": lambda n: "v=DMARC1;"
+    + " " * n
+    + "p=none;"
+    + "\t" * n
+    + "\r\n "
+    + "rua=mailto:a@example.com"
+    + " " * n,
+    "wsp in rua": lambda n: HEAD
+    + (" " * n + "," + " " * n).join(["mailto:a@example.com"] * 4),
+}
+
+
+def time_record(parser: DmarcParser, record: str, rounds: int) -> float:
+    """Best time of `rounds` parses of `record`, in seconds."""
+    best = math.inf
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parser.parse_result(record)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[50, 100, 200, 400, 800]
+    )
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    arg_parser.add_argument(
+        "--family", action="append", choices=FAMILIES, help="default: all"
+    )
+    args = arg_parser.parse_args()
+    parser = DmarcParser()
+    for name in args.family or FAMILIES:
+        build = FAMILIES[name]
+        timings = []
+        print(name)
+        for size in args.sizes:
+            record = build(size)
+            elapsed = time_record(parser, record, args.rounds)
+            timings.append((len(record), elapsed))
+            print(
+                f"  n={size:<6} {len(record):>7} chars"
+                f"  {elapsed * 1e3:9.2f} ms"
+                f"  {elapsed * 1e6 / len(record):7.2f} us/char"
+            )
+        (first_length, first), (last_length, last) = timings[0], timings[-1]
+        exponent = math.log(last / first) / math.log(last_length / first_length)
+        print(f"  growth exponent {exponent:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Cost of building the APG parsers and callbacks on every parse.
+
+Runs the APG stages of the parser (the tag-list parse and the per-tag DMARC
+syntax check) with the per-thread parsers reused, as DmarcParser does, and with
+new parsers built for each record, as before, reporting the time and the peak
+memory allocated per record:
+
+    python benchmarks/bench_apg_reuse.py [--size N] [--rounds N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import generate_corpus
+from dmarcparser.parser import DmarcParser, _APGParsers
+
+
+def apg_stages(parser: DmarcParser, records: list, fresh: bool) -> None:
+    for record in records:
+        if fresh:
+            parser._apg = _APGParsers(parser.tag_grammar, parser.dmarc_grammar)
+        success, tag_list, tag_spec_list = parser._apg_check_tag_list_syntax(record)
+        if success:
+            parser._check_dmarc_syntax(tag_list, tag_spec_list, record)
+
+
+def peak_per_record(parser: DmarcParser, records: list, fresh: bool) -> float:
+    """Mean peak of the memory allocated while parsing a record, in bytes."""
+    tracemalloc.start()
+    allocated = 0
+    for record in records:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        apg_stages(parser, [record], fresh)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - start
+    tracemalloc.stop()
+    return allocated / len(records)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=200)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    args = arg_parser.parse_args()
+    corpus = generate_corpus(args.size)
+    records = [*corpus["valid"], *corpus["non_dmarc"]]
+    parser = DmarcParser()
+    for name, fresh in (("new parsers", True), ("reused parsers", False)):
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            apg_stages(parser, records, fresh)
+            timings.append((time.perf_counter() - start) / len(records) * 1e6)
+        peak = peak_per_record(parser, records[: args.size // 4 or 1], fresh)
+        print(
+            f"{name:>15}: {min(timings):8.1f} us/record"
+            f"  peak {peak / 1024:8.1f} KiB/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Throughput of DmarcDiscovery against a resolver with a simulated latency.
+
+Builds a zone of organizational domains with a DMARC record taken from the
+generated corpus (a share of them without any), then discovers the policy of
+sender domains spread over their subdomains, in random order, for an increasing
+number of concurrent lookups:
+
+    python benchmarks/bench_discovery.py [--domains N] [--orgs N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import generate_corpus
+from dmarcparser.discovery import DmarcDiscovery, ZoneResolver
+
+
+def build_zone(orgs: int, latency: float) -> ZoneResolver:
+    records = generate_corpus(orgs)["valid"]
+    resolver = ZoneResolver(delay=latency)
+    for i, record in enumerate(records):
+        if i % 4 != 3:
+            resolver.add(f"_dmarc.org{i}.example", record)
+    return resolver
+
+
+async def discover(discovery: DmarcDiscovery, domains: list) -> dict:
+    statuses = {}
+    async for result in discovery.discover_many(domains):
+        statuses[result.status] = statuses.get(result.status, 0) + 1
+    return statuses
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--domains", type=int, default=20000)
+    arg_parser.add_argument("--orgs", type=int, default=2000)
+    arg_parser.add_argument("--latency", type=float, default=0.02)
+    arg_parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[10, 100, 1000]
+    )
+    args = arg_parser.parse_args()
+    rng = random.Random(7489)
+    domains = [
+        f"host{rng.randrange(50)}.org{rng.randrange(args.orgs)}.example"
+        for _ in range(args.domains)
+    ]
+    for concurrency in args.concurrency:
+        resolver = build_zone(args.orgs, args.latency)
+        discovery = DmarcDiscovery(
+            resolver, max_concurrency=concurrency, max_pending=4 * concurrency
+        )
+        start = time.perf_counter()
+        statuses = asyncio.run(discover(discovery, domains))
+        rate = len(domains) / (time.perf_counter() - start)
+        info = discovery.cache_info()
+        print(
+            f"concurrency={concurrency:>5}: {rate:9.0f} domains/s"
+            f"  {rate * 3600 / 1e6:6.2f} M/hour"
+            f"  queries {sum(resolver.queries.values()):>6}"
+            f"  hits {info.hits:>6}  {statuses}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory retained by parse results, DmarcObject against compact DmarcResult.
+
+Parses a corpus of valid records, keeps every result alive and measures the
+memory they hold by walking the objects they reference, each object counted once
+and the records themselves excluded, then extrapolates to a million records:
+
+    python benchmarks/bench_memory.py [--records N] [--category C ...]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import generate_corpus
+from dmarcparser import DmarcParser
+
+MODES = {
+    "DmarcObject": {},
+    "DmarcResult": {"compact_results": True},
+    "DmarcResult+cache": {"compact_results": True, "cache_size": 4096},
+}
+
+
+def retained_size(roots: list, excluded: list) -> int:
+    """Size of the objects reachable from `roots`, classes and `excluded` aside."""
+    seen = {id(obj) for obj in excluded}
+    seen.add(id(roots))
+    stack = list(roots)
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+def measure(parser: DmarcParser, records: list) -> tuple:
+    """Bytes retained by the results of `records` and parse time in seconds."""
+    start = time.perf_counter()
+    results = [parser.parse_outcome(record) for record in records]
+    elapsed = time.perf_counter() - start
+    return retained_size(results, records), elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--records", type=int, default=20000)
+    arg_parser.add_argument(
+        "--category", action="append", help="corpus categories (default: valid)"
+    )
+    args = arg_parser.parse_args()
+    categories = args.category or ["valid"]
+    corpus = generate_corpus(max(1, args.records // len(categories)))
+    records = [record for category in categories for record in corpus[category]]
+    # the grammars and shared default tags are allocated before measuring
+    parsers = {mode: DmarcParser(**options) for mode, options in MODES.items()}
+    for parser in parsers.values():
+        parser.parse_outcome(records[0])
+        parser.cache_clear()
+    print(f"{len(records)} records ({', '.join(categories)})")
+    for mode, parser in parsers.items():
+        retained, elapsed = measure(parser, records)
+        per_record = retained / len(records)
+        print(
+            f"{mode:>18}: {per_record:8.0f} B/record"
+            f"  {per_record * 1e6 / 2**20:8.0f} MiB per 1M records"
+            f"  {elapsed / len(records) * 1e6:8.1f} us/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Throughput of DmarcParser.parse_many for an increasing number of workers.
+
+python benchmarks/bench_parse_many.py [--records N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dmarcparser import DmarcParser
+from tests.corpus import RECORDS, fuzz_records
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--records", type=int, default=5000)
+    arg_parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    arg_parser.add_argument("--chunksize", type=int, default=64)
+    args = arg_parser.parse_args()
+    records = [*RECORDS, *fuzz_records(args.records - len(RECORDS))]
+    parser = DmarcParser()
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        for _ in parser.parse_many(records, workers=workers, chunksize=args.chunksize):
+            pass
+        rate = len(records) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(
+            f"workers={workers:>3}: {rate:10.0f} records/s  speedup {rate / baseline:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
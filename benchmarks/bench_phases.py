@@ -0,0 +1,230 @@
+"""Per-phase timings of DmarcParser over the benchmark corpus.
+
+Times each stage of `DmarcParser.parse` separately for each record category and
+writes the results as JSON, to be compared across commits:
+
+    python benchmarks/bench_phases.py -o before.json
+    python benchmarks/bench_phases.py -o after.json --compare before.json
+
+`--engine compiled` runs the grammars with the generated recognizers, compare
+with a run of the default APG engine to see the speedup.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.corpus import generate_corpus
+from dmarcparser.grammars import GrammarType, load_grammar
+from dmarcparser.parser import (
+    ENGINES,
+    DmarcException,
+    DmarcObject,
+    DmarcParser,
+)
+
+
+def measure(
+    func: Callable, items: int, rounds: int, setup: Optional[Callable] = None
+) -> Dict[str, float]:
+    """Run `func` (processing `items` records) `rounds` times, in us per record.
+
+    If given, `setup` is called before each round, out of the timing, and its
+    result passed to `func`.
+    """
+    timings = []
+    for _ in range(rounds):
+        args = () if setup is None else (setup(),)
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(*args)
+            timings.append((time.perf_counter() - start) / max(items, 1) * 1e6)
+        finally:
+            gc.enable()
+    return {
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "records": items,
+        "rounds": rounds,
+    }
+
+
+def bench_load_grammar(rounds: int) -> Dict[str, float]:
+    def load():
+        load_grammar.cache_clear()
+        for grammar_type in GrammarType:
+            load_grammar(grammar_type)
+
+    return measure(load, 1, rounds)
+
+
+def parse_raise(parser: DmarcParser, records: List[str]) -> None:
+    for record in records:
+        try:
+            parser.parse(record)
+        except DmarcException:
+            pass
+
+
+def bench_category(
+    parser: DmarcParser, records: List[str], rounds: int
+) -> Dict[str, Dict[str, float]]:
+    results = {
+        "parse": measure(
+            lambda: [parser.parse_outcome(record) for record in records],
+            len(records),
+            rounds,
+        ),
+        "parse_raise": measure(
+            lambda: parse_raise(parser, records), len(records), rounds
+        ),
+        "parse_result": measure(
+            lambda: [parser.parse_result(record) for record in records],
+            len(records),
+            rounds,
+        ),
+        "tag_list_syntax": measure(
+            lambda: [parser._check_tag_list_syntax(record) for record in records],
+            len(records),
+            rounds,
+        ),
+    }
+
+    tag_lists = []
+    for record in records:
+        success, tag_list, tag_spec_list = parser._check_tag_list_syntax(record)
+        if success:
+            tag_lists.append((tag_list, tag_spec_list, record))
+    results["dmarc_syntax"] = measure(
+        lambda: [parser._check_dmarc_syntax(*tag_list) for tag_list in tag_lists],
+        len(tag_lists),
+        rounds,
+    )
+
+    parsed = []
+    for tag_list in tag_lists:
+        success, dmarc_tag_parsed, _ = parser._check_dmarc_syntax(*tag_list)
+        if success:
+            parsed.append((dmarc_tag_parsed, tag_list[2]))
+
+    def process():
+        for dmarc_tag_parsed, record in parsed:
+            parser._process(dmarc_tag_parsed, DmarcObject(original_record=record))
+
+    results["process"] = measure(process, len(parsed), rounds)
+
+    uri_values = []
+    for dmarc_tag_parsed, _ in parsed:
+        for abnf_tag_name, tag_value in dmarc_tag_parsed:
+            if abnf_tag_name in ("dmarc-auri", "dmarc-furi"):
+                uri_values.append(tag_value[tag_value.index("=") + 1 :].lower())
+    results["retrieve_mail_list"] = measure(
+        lambda: [parser.retrieve_mail_list(value) for value in uri_values],
+        len(uri_values),
+        rounds,
+    )
+
+    processed = []
+    for dmarc_tag_parsed, record in parsed:
+        dmarc_obj = DmarcObject(original_record=record)
+        parser._process(dmarc_tag_parsed, dmarc_obj)
+        processed.append(dmarc_obj)
+
+    def semantic_check(dmarc_objs):
+        for dmarc_obj in dmarc_objs:
+            parser._dmarc_semantic_check(dmarc_obj, True)
+
+    results["semantic_check"] = measure(
+        semantic_check,
+        len(processed),
+        rounds,
+        setup=lambda: [dmarc_obj.copy() for dmarc_obj in processed],
+    )
+    return {phase: stats for phase, stats in results.items() if stats["records"]}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> int:
+    """Print the change of each benchmark, the best round being the least noisy."""
+    regressions = 0
+    for name, stats in sorted(results["benchmarks"].items()):
+        before = baseline["benchmarks"].get(name)
+        if before is None or before["min_us"] == 0:
+            continue
+        ratio = stats["min_us"] / before["min_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<32} {before['min_us']:10.1f} -> {stats['min_us']:10.1f} us"
+            f"  x{ratio:5.2f}{flag}"
+        )
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=100)
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    arg_parser.add_argument("--seed", type=int, default=7489)
+    arg_parser.add_argument("-o", "--output", help="JSON file to write results to")
+    arg_parser.add_argument("--compare", help="JSON results of a previous run")
+    arg_parser.add_argument("--engine", choices=ENGINES, default="apg")
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default 0.1)",
+    )
+    args = arg_parser.parse_args()
+
+    parser = DmarcParser(engine=args.engine)
+    benchmarks = {"load_grammar": bench_load_grammar(args.rounds)}
+    corpus = generate_corpus(args.size, args.seed)
+    for category, records in corpus.items():
+        for phase, stats in bench_category(parser, records, args.rounds).items():
+            benchmarks[f"{phase}/{category}"] = stats
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "size": args.size,
+        "seed": args.seed,
+        "engine": args.engine,
+        "benchmarks": benchmarks,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        sys.exit(1 if compare(results, baseline, args.threshold) else 0)
+    for name, stats in sorted(benchmarks.items()):
+        print(f"{name:<32} {stats['median_us']:10.1f} us/record ({stats['records']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure the cold start cost of building a DmarcParser in a fresh interpreter.
+
+Compares loading the precompiled grammar tables shipped in
+`dmarcparser/_grammar_tables.py` against generating the grammars from the ABNF
+source with apg at runtime, and reports the cost of `import dmarcparser` alone,
+which does not import apg, validators or NumPy.
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+PRECOMPILED = """
+import time
+start = time.perf_counter()
+from dmarcparser.grammars import load_grammar, GrammarType
+for grammar_type in GrammarType:
+    load_grammar(grammar_type)
+print(time.perf_counter() - start)
+"""
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import dmarcparser
+print(time.perf_counter() - start)
+"""
+
+GENERATED = """
+import time
+start = time.perf_counter()
+from dmarcparser.grammars import _generate_grammar, GrammarType
+for grammar_type in GrammarType:
+    _generate_grammar(grammar_type)
+print(time.perf_counter() - start)
+"""
+
+
+def run(code: str, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", code], text=True)
+        timings.append(float(out.strip()))
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=10)
+    args = arg_parser.parse_args()
+    for name, code in (
+        ("import", IMPORT),
+        ("generated", GENERATED),
+        ("precompiled", PRECOMPILED),
+    ):
+        timings = run(code, args.runs)
+        print(
+            f"{name:>12}: median {statistics.median(timings) * 1000:8.1f} ms"
+            f"  min {min(timings) * 1000:8.1f} ms  ({args.runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Reproducible corpus of TXT records for the benchmarks, by category."""
+
+import random
+from typing import Dict, List
+
+POLICIES = ["none", "quarantine", "reject"]
+DOMAINS = ["example.com", "example.org", "mail.example.net", "dmarc-vendor.io"]
+LOCAL_PARTS = ["dmarc", "rua", "ruf", "reports", "dmarc-reports", "postmaster"]
+IPV6_HOSTS = [
+    "[2001:db8::1]",
+    "[2001:db8:85a3::8a2e:370:7334]",
+    "[::ffff:192.0.2.1]",
+    "[fe80::1:2:3:4]",
+    "[2001:0db8:0000:0000:0000:ff00:0042:8329]",
+]
+
+
+def _mailto(rng: random.Random) -> str:
+    uri = f"mailto:{rng.choice(LOCAL_PARTS)}@{rng.choice(DOMAINS)}"
+    if rng.random() < 0.3:
+        uri += f"!{rng.randint(1, 100)}{rng.choice(['', 'k', 'm', 'g'])}"
+    return uri
+
+
+def valid_record(rng: random.Random) -> str:
+    tags = ["v=DMARC1", f"p={rng.choice(POLICIES)}"]
+    optional = [
+        f"sp={rng.choice(POLICIES)}",
+        f"rua={_mailto(rng)}",
+        f"ruf={_mailto(rng)}",
+        f"pct={rng.randint(0, 100)}",
+        f"fo={':'.join(rng.sample(['0', '1', 'd', 's'], rng.randint(1, 4)))}",
+        f"adkim={rng.choice('rs')}",
+        f"aspf={rng.choice('rs')}",
+        f"ri={rng.choice([3600, 86400])}",
+        "rf=afrf",
+    ]
+    tags.extend(rng.sample(optional, rng.randint(0, len(optional))))
+    return rng.choice(["; ", ";"]).join(tags) + rng.choice(["", ";", "; "])
+
+
+def invalid_record(rng: random.Random) -> str:
+    return rng.choice(
+        [
+            f"v=DMARC1; p={rng.choice(['bob', 'n', 'rejected'])}",
+            f"v=DMARC1; p=none; pct={rng.randint(101, 999)}",
+            f"v=DMARC1; rua={_mailto(rng)}; p=none",
+            f"p=none; v=DMARC1; rua={_mailto(rng)}",
+            "v=DMARC1; p=none; p=reject",
+            f"v=DMARC1; p=none; rua={rng.choice(LOCAL_PARTS)}@{rng.choice(DOMAINS)}",
+            "v=DMARC1; p=none; adkim=x",
+            "v=DMARC1;; p=none",
+            "v=DMARC2; p=none",
+        ]
+    )
+
+
+def long_rua_record(rng: random.Random) -> str:
+    uris = ",".join(_mailto(rng) for _ in range(rng.randint(20, 50)))
+    return f"v=DMARC1; p={rng.choice(POLICIES)}; rua={uris}; ruf={_mailto(rng)}"
+
+
+def ipv6_uri_record(rng: random.Random) -> str:
+    uris = ",".join(
+        f"https://{rng.choice(IPV6_HOSTS)}:{rng.randint(1, 65535)}/dmarc"
+        for _ in range(rng.randint(1, 4))
+    )
+    return f"v=DMARC1; p={rng.choice(POLICIES)}; rua={uris}"
+
+
+def non_dmarc_record(rng: random.Random) -> str:
+    token = "".join(rng.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJ0123456789", k=43))
+    return rng.choice(
+        [
+            f"v=spf1 include:_spf.{rng.choice(DOMAINS)} ip4:192.0.2.0/24 -all",
+            f"google-site-verification={token}",
+            f"MS=ms{rng.randint(10000000, 99999999)}",
+            f"v=DKIM1; k=rsa; p=MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQC{token}",
+            f"{token} {token}",
+            "",
+        ]
+    )
+
+
+GENERATORS = {
+    "valid": valid_record,
+    "invalid": invalid_record,
+    "long_rua": long_rua_record,
+    "ipv6_uri": ipv6_uri_record,
+    "non_dmarc": non_dmarc_record,
+}
+
+
+def generate_corpus(size: int = 200, seed: int = 7489) -> Dict[str, List[str]]:
+    """`size` records of each category, the same for a given seed."""
+    rng = random.Random(seed)
+    return {
+        category: [generator(rng) for _ in range(size)]
+        for category, generator in GENERATORS.items()
+    }
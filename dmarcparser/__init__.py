@@ -1,9 +1,12 @@
 from . import _version
-from .parser import DmarcParser, DmarcException
+from .parser import DmarcParser, DmarcException, ParseOutcome, canonicalize, preload
 
 __version__: str = _version.version
 __all__ = [
     "DmarcParser",
     "DmarcException",
+    "ParseOutcome",
+    "canonicalize",
+    "preload",
     "__version__",
 ]
@@ -0,0 +1,1536 @@
+# Generated by `python -m dmarcparser.grammars`, do not edit.
+GRAMMARS = {'tag-list': {'digest': 'fdc35fee46f40e80d4ee96223b5af10c0a2781b9114a7bd72e1cb333ec40337d',
+              'rules': ({'name': 'ALPHA',
+                         'lower': 'alpha',
+                         'index': 0,
+                         'line': 0,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2)},
+                                     {'type': 5, 'min': 65, 'max': 90},
+                                     {'type': 5, 'min': 97, 'max': 122})},
+                        {'name': 'BIT',
+                         'lower': 'bit',
+                         'index': 1,
+                         'line': 1,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2)},
+                                     {'type': 7, 'string': (48,)},
+                                     {'type': 7, 'string': (49,)})},
+                        {'name': 'CHAR',
+                         'lower': 'char',
+                         'index': 2,
+                         'line': 2,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 5, 'min': 1, 'max': 127},)},
+                        {'name': 'CR',
+                         'lower': 'cr',
+                         'index': 3,
+                         'line': 3,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 6, 'string': (13,)},)},
+                        {'name': 'CRLF',
+                         'lower': 'crlf',
+                         'index': 4,
+                         'line': 4,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 2, 'children': (1, 2)},
+                                     {'type': 4, 'index': 3},
+                                     {'type': 4, 'index': 10})},
+                        {'name': 'CTL',
+                         'lower': 'ctl',
+                         'index': 5,
+                         'line': 5,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2)},
+                                     {'type': 5, 'min': 0, 'max': 31},
+                                     {'type': 6, 'string': (127,)})},
+                        {'name': 'DIGIT',
+                         'lower': 'digit',
+                         'index': 6,
+                         'line': 6,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 5, 'min': 48, 'max': 57},)},
+                        {'name': 'DQUOTE',
+                         'lower': 'dquote',
+                         'index': 7,
+                         'line': 7,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 6, 'string': (34,)},)},
+                        {'name': 'HEXDIG',
+                         'lower': 'hexdig',
+                         'index': 8,
+                         'line': 8,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1,
+                                      'children': (1, 2, 3, 4, 5, 6, 7)},
+                                     {'type': 4, 'index': 6},
+                                     {'type': 7, 'string': (97,)},
+                                     {'type': 7, 'string': (98,)},
+                                     {'type': 7, 'string': (99,)},
+                                     {'type': 7, 'string': (100,)},
+                                     {'type': 7, 'string': (101,)},
+                                     {'type': 7, 'string': (102,)})},
+                        {'name': 'HTAB',
+                         'lower': 'htab',
+                         'index': 9,
+                         'line': 9,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 6, 'string': (9,)},)},
+                        {'name': 'LF',
+                         'lower': 'lf',
+                         'index': 10,
+                         'line': 10,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 6, 'string': (10,)},)},
+                        {'name': 'LWSP',
+                         'lower': 'lwsp',
+                         'index': 11,
+                         'line': 11,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 1, 'children': (2, 3)},
+                                     {'type': 4, 'index': 15},
+                                     {'type': 2, 'children': (4, 5)},
+                                     {'type': 4, 'index': 4},
+                                     {'type': 4, 'index': 15})},
+                        {'name': 'OCTET',
+                         'lower': 'octet',
+                         'index': 12,
+                         'line': 12,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 5, 'min': 0, 'max': 255},)},
+                        {'name': 'SP',
+                         'lower': 'sp',
+                         'index': 13,
+                         'line': 13,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 6, 'string': (32,)},)},
+                        {'name': 'VCHAR',
+                         'lower': 'vchar',
+                         'index': 14,
+                         'line': 14,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 5, 'min': 33, 'max': 126},)},
+                        {'name': 'WSP',
+                         'lower': 'wsp',
+                         'index': 15,
+                         'line': 15,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2)},
+                                     {'type': 4, 'index': 13},
+                                     {'type': 4, 'index': 9})},
+                        {'name': 'tag-list',
+                         'lower': 'tag-list',
+                         'index': 16,
+                         'line': 16,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 2, 'children': (1, 2, 6)},
+                                     {'type': 4, 'index': 17},
+                                     {'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 2, 'children': (4, 5)},
+                                     {'type': 7, 'string': (59,)},
+                                     {'type': 4, 'index': 17},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 2, 'children': (8, 9)},
+                                     {'type': 7, 'string': (59,)},
+                                     {'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 4, 'index': 15})},
+                        {'name': 'tag-spec',
+                         'lower': 'tag-spec',
+                         'index': 17,
+                         'line': 17,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 2,
+                                      'children': (1, 3, 4, 6, 7, 9, 10)},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 4, 'index': 23},
+                                     {'type': 4, 'index': 18},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 4, 'index': 23},
+                                     {'type': 7, 'string': (61,)},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 4, 'index': 23},
+                                     {'type': 4, 'index': 19},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 4, 'index': 23})},
+                        {'name': 'tag-name',
+                         'lower': 'tag-name',
+                         'index': 18,
+                         'line': 18,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 2, 'children': (1, 2)},
+                                     {'type': 4, 'index': 0},
+                                     {'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 4, 'index': 22})},
+                        {'name': 'tag-value',
+                         'lower': 'tag-value',
+                         'index': 19,
+                         'line': 19,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 2, 'children': (2, 3)},
+                                     {'type': 4, 'index': 20},
+                                     {'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 2, 'children': (5, 9)},
+                                     {'type': 3,
+                                      'min': 1,
+                                      'max': 9223372036854775807},
+                                     {'type': 1, 'children': (7, 8)},
+                                     {'type': 4, 'index': 15},
+                                     {'type': 4, 'index': 23},
+                                     {'type': 4, 'index': 20})},
+                        {'name': 'tval',
+                         'lower': 'tval',
+                         'index': 20,
+                         'line': 20,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 3,
+                                      'min': 1,
+                                      'max': 9223372036854775807},
+                                     {'type': 4, 'index': 21})},
+                        {'name': 'VALCHAR',
+                         'lower': 'valchar',
+                         'index': 21,
+                         'line': 21,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2)},
+                                     {'type': 5, 'min': 33, 'max': 58},
+                                     {'type': 5, 'min': 60, 'max': 126})},
+                        {'name': 'ALNUMPUNC',
+                         'lower': 'alnumpunc',
+                         'index': 22,
+                         'line': 22,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 1, 'children': (1, 2, 3)},
+                                     {'type': 4, 'index': 0},
+                                     {'type': 4, 'index': 6},
+                                     {'type': 7, 'string': (95,)})},
+                        {'name': 'FWSDKIM',
+                         'lower': 'fwsdkim',
+                         'index': 23,
+                         'line': 23,
+                         'is_bkru': False,
+                         'is_bkrr': False,
+                         'has_bkrr': False,
+                         'opcodes': ({'type': 2, 'children': (1, 6)},
+                                     {'type': 3, 'min': 0, 'max': 1},
+                                     {'type': 2, 'children': (3, 5)},
+                                     {'type': 3,
+                                      'min': 0,
+                                      'max': 9223372036854775807},
+                                     {'type': 4, 'index': 15},
+                                     {'type': 4, 'index': 4},
+                                     {'type': 3,
+                                      'min': 1,
+                                      'max': 9223372036854775807},
+                                     {'type': 4, 'index': 15})}),
+              'udts': ()},
+ 'dmarc': {'digest': 'bedd8b0b5222be340d515310f24301ea21b0154ab17b0f7c08a1f87625597618',
+           'rules': ({'name': 'ALPHA',
+                      'lower': 'alpha',
+                      'index': 0,
+                      'line': 0,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 5, 'min': 65, 'max': 90},
+                                  {'type': 5, 'min': 97, 'max': 122})},
+                     {'name': 'BIT',
+                      'lower': 'bit',
+                      'index': 1,
+                      'line': 1,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 7, 'string': (48,)},
+                                  {'type': 7, 'string': (49,)})},
+                     {'name': 'CHAR',
+                      'lower': 'char',
+                      'index': 2,
+                      'line': 2,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 5, 'min': 1, 'max': 127},)},
+                     {'name': 'CR',
+                      'lower': 'cr',
+                      'index': 3,
+                      'line': 3,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 6, 'string': (13,)},)},
+                     {'name': 'CRLF',
+                      'lower': 'crlf',
+                      'index': 4,
+                      'line': 4,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 3},
+                                  {'type': 4, 'index': 10})},
+                     {'name': 'CTL',
+                      'lower': 'ctl',
+                      'index': 5,
+                      'line': 5,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 5, 'min': 0, 'max': 31},
+                                  {'type': 6, 'string': (127,)})},
+                     {'name': 'DIGIT',
+                      'lower': 'digit',
+                      'index': 6,
+                      'line': 6,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 5, 'min': 48, 'max': 57},)},
+                     {'name': 'DQUOTE',
+                      'lower': 'dquote',
+                      'index': 7,
+                      'line': 7,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 6, 'string': (34,)},)},
+                     {'name': 'HEXDIG',
+                      'lower': 'hexdig',
+                      'index': 8,
+                      'line': 8,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1,
+                                   'children': (1, 2, 3, 4, 5, 6, 7)},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 7, 'string': (97,)},
+                                  {'type': 7, 'string': (98,)},
+                                  {'type': 7, 'string': (99,)},
+                                  {'type': 7, 'string': (100,)},
+                                  {'type': 7, 'string': (101,)},
+                                  {'type': 7, 'string': (102,)})},
+                     {'name': 'HTAB',
+                      'lower': 'htab',
+                      'index': 9,
+                      'line': 9,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 6, 'string': (9,)},)},
+                     {'name': 'LF',
+                      'lower': 'lf',
+                      'index': 10,
+                      'line': 10,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 6, 'string': (10,)},)},
+                     {'name': 'LWSP',
+                      'lower': 'lwsp',
+                      'index': 11,
+                      'line': 11,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3)},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 4, 'index': 4},
+                                  {'type': 4, 'index': 15})},
+                     {'name': 'OCTET',
+                      'lower': 'octet',
+                      'index': 12,
+                      'line': 12,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 5, 'min': 0, 'max': 255},)},
+                     {'name': 'SP',
+                      'lower': 'sp',
+                      'index': 13,
+                      'line': 13,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 6, 'string': (32,)},)},
+                     {'name': 'VCHAR',
+                      'lower': 'vchar',
+                      'index': 14,
+                      'line': 14,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 5, 'min': 33, 'max': 126},)},
+                     {'name': 'WSP',
+                      'lower': 'wsp',
+                      'index': 15,
+                      'line': 15,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 4, 'index': 13},
+                                  {'type': 4, 'index': 9})},
+                     {'name': 'URI',
+                      'lower': 'uri',
+                      'index': 16,
+                      'line': 16,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 3, 4, 8)},
+                                  {'type': 4, 'index': 22},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 17},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (6, 7)},
+                                  {'type': 7, 'string': (63,)},
+                                  {'type': 4, 'index': 45},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (10, 11)},
+                                  {'type': 7, 'string': (35,)},
+                                  {'type': 4, 'index': 46})},
+                     {'name': 'hier-part',
+                      'lower': 'hier-part',
+                      'index': 17,
+                      'line': 17,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 5, 6, 7)},
+                                  {'type': 2, 'children': (2, 3, 4)},
+                                  {'type': 7, 'string': (47, 47)},
+                                  {'type': 4, 'index': 23},
+                                  {'type': 4, 'index': 36},
+                                  {'type': 4, 'index': 37},
+                                  {'type': 4, 'index': 39},
+                                  {'type': 4, 'index': 40})},
+                     {'name': 'URI-reference',
+                      'lower': 'uri-reference',
+                      'index': 18,
+                      'line': 18,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 4, 'index': 16},
+                                  {'type': 4, 'index': 20})},
+                     {'name': 'absolute-URI',
+                      'lower': 'absolute-uri',
+                      'index': 19,
+                      'line': 19,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 3, 4)},
+                                  {'type': 4, 'index': 22},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 17},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (6, 7)},
+                                  {'type': 7, 'string': (63,)},
+                                  {'type': 4, 'index': 45})},
+                     {'name': 'relative-ref',
+                      'lower': 'relative-ref',
+                      'index': 20,
+                      'line': 20,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 6)},
+                                  {'type': 4, 'index': 21},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 7, 'string': (63,)},
+                                  {'type': 4, 'index': 45},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (8, 9)},
+                                  {'type': 7, 'string': (35,)},
+                                  {'type': 4, 'index': 46})},
+                     {'name': 'relative-part',
+                      'lower': 'relative-part',
+                      'index': 21,
+                      'line': 21,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 5, 6, 7)},
+                                  {'type': 2, 'children': (2, 3, 4)},
+                                  {'type': 7, 'string': (47, 47)},
+                                  {'type': 4, 'index': 23},
+                                  {'type': 4, 'index': 36},
+                                  {'type': 4, 'index': 37},
+                                  {'type': 4, 'index': 38},
+                                  {'type': 4, 'index': 40})},
+                     {'name': 'scheme',
+                      'lower': 'scheme',
+                      'index': 22,
+                      'line': 22,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 0},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (4, 5, 6, 7, 8)},
+                                  {'type': 4, 'index': 0},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 7, 'string': (43,)},
+                                  {'type': 7, 'string': (45,)},
+                                  {'type': 7, 'string': (46,)})},
+                     {'name': 'authority',
+                      'lower': 'authority',
+                      'index': 23,
+                      'line': 23,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 5, 6)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (3, 4)},
+                                  {'type': 4, 'index': 24},
+                                  {'type': 7, 'string': (64,)},
+                                  {'type': 4, 'index': 25},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (8, 9)},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 26})},
+                     {'name': 'userinfo',
+                      'lower': 'userinfo',
+                      'index': 24,
+                      'line': 24,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3, 4, 5)},
+                                  {'type': 4, 'index': 48},
+                                  {'type': 4, 'index': 47},
+                                  {'type': 4, 'index': 51},
+                                  {'type': 7, 'string': (58,)})},
+                     {'name': 'host',
+                      'lower': 'host',
+                      'index': 25,
+                      'line': 25,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2, 3)},
+                                  {'type': 4, 'index': 27},
+                                  {'type': 4, 'index': 32},
+                                  {'type': 4, 'index': 34})},
+                     {'name': 'port',
+                      'lower': 'port',
+                      'index': 26,
+                      'line': 26,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 6})},
+                     {'name': 'IP-literal',
+                      'lower': 'ip-literal',
+                      'index': 27,
+                      'line': 27,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 5)},
+                                  {'type': 7, 'string': (91,)},
+                                  {'type': 1, 'children': (3, 4)},
+                                  {'type': 4, 'index': 29},
+                                  {'type': 4, 'index': 28},
+                                  {'type': 7, 'string': (93,)})},
+                     {'name': 'IPvFuture',
+                      'lower': 'ipvfuture',
+                      'index': 28,
+                      'line': 28,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5)},
+                                  {'type': 7, 'string': (118,)},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 8},
+                                  {'type': 7, 'string': (46,)},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (7, 8, 9)},
+                                  {'type': 4, 'index': 48},
+                                  {'type': 4, 'index': 51},
+                                  {'type': 7, 'string': (58,)})},
+                     {'name': 'IPv6address',
+                      'lower': 'ipv6address',
+                      'index': 29,
+                      'line': 29,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1,
+                                   'children': (1,
+                                                7,
+                                                14,
+                                                23,
+                                                37,
+                                                51,
+                                                63,
+                                                73,
+                                                83)},
+                                  {'type': 2, 'children': (2, 6)},
+                                  {'type': 3, 'min': 6, 'max': 6},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (8, 9, 13)},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 3, 'min': 5, 'max': 5},
+                                  {'type': 2, 'children': (11, 12)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (15, 17, 18, 22)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 3, 'min': 4, 'max': 4},
+                                  {'type': 2, 'children': (20, 21)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (24, 31, 32, 36)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (26, 30)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (28, 29)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 3, 'min': 3, 'max': 3},
+                                  {'type': 2, 'children': (34, 35)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (38, 45, 46, 50)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (40, 44)},
+                                  {'type': 3, 'min': 0, 'max': 2},
+                                  {'type': 2, 'children': (42, 43)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 3, 'min': 2, 'max': 2},
+                                  {'type': 2, 'children': (48, 49)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (52, 59, 60, 61, 62)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (54, 58)},
+                                  {'type': 3, 'min': 0, 'max': 3},
+                                  {'type': 2, 'children': (56, 57)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (64, 71, 72)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (66, 70)},
+                                  {'type': 3, 'min': 0, 'max': 4},
+                                  {'type': 2, 'children': (68, 69)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 4, 'index': 31},
+                                  {'type': 2, 'children': (74, 81, 82)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (76, 80)},
+                                  {'type': 3, 'min': 0, 'max': 5},
+                                  {'type': 2, 'children': (78, 79)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 2, 'children': (84, 91)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (86, 90)},
+                                  {'type': 3, 'min': 0, 'max': 6},
+                                  {'type': 2, 'children': (88, 89)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58, 58)})},
+                     {'name': 'h16',
+                      'lower': 'h16',
+                      'index': 30,
+                      'line': 30,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3, 'min': 1, 'max': 4},
+                                  {'type': 4, 'index': 8})},
+                     {'name': 'ls32',
+                      'lower': 'ls32',
+                      'index': 31,
+                      'line': 31,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 5)},
+                                  {'type': 2, 'children': (2, 3, 4)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 4, 'index': 30},
+                                  {'type': 4, 'index': 32})},
+                     {'name': 'IPv4address',
+                      'lower': 'ipv4address',
+                      'index': 32,
+                      'line': 32,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2,
+                                   'children': (1, 2, 3, 4, 5, 6, 7)},
+                                  {'type': 4, 'index': 33},
+                                  {'type': 7, 'string': (46,)},
+                                  {'type': 4, 'index': 33},
+                                  {'type': 7, 'string': (46,)},
+                                  {'type': 4, 'index': 33},
+                                  {'type': 7, 'string': (46,)},
+                                  {'type': 4, 'index': 33})},
+                     {'name': 'dec-octet',
+                      'lower': 'dec-octet',
+                      'index': 33,
+                      'line': 33,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 4, 8, 12, 15)},
+                                  {'type': 2, 'children': (2, 3)},
+                                  {'type': 7, 'string': (50, 53)},
+                                  {'type': 5, 'min': 48, 'max': 53},
+                                  {'type': 2, 'children': (5, 6, 7)},
+                                  {'type': 7, 'string': (50,)},
+                                  {'type': 5, 'min': 48, 'max': 52},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 2, 'children': (9, 10)},
+                                  {'type': 7, 'string': (49,)},
+                                  {'type': 3, 'min': 2, 'max': 2},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 2, 'children': (13, 14)},
+                                  {'type': 5, 'min': 49, 'max': 57},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 4, 'index': 6})},
+                     {'name': 'reg-name',
+                      'lower': 'reg-name',
+                      'index': 34,
+                      'line': 34,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3, 4)},
+                                  {'type': 4, 'index': 48},
+                                  {'type': 4, 'index': 47},
+                                  {'type': 4, 'index': 51})},
+                     {'name': 'path',
+                      'lower': 'path',
+                      'index': 35,
+                      'line': 35,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2, 3, 4, 5)},
+                                  {'type': 4, 'index': 36},
+                                  {'type': 4, 'index': 37},
+                                  {'type': 4, 'index': 38},
+                                  {'type': 4, 'index': 39},
+                                  {'type': 4, 'index': 40})},
+                     {'name': 'path-abempty',
+                      'lower': 'path-abempty',
+                      'index': 36,
+                      'line': 36,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (2, 3)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 4, 'index': 41})},
+                     {'name': 'path-absolute',
+                      'lower': 'path-absolute',
+                      'index': 37,
+                      'line': 37,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 4, 'index': 42},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (7, 8)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 4, 'index': 41})},
+                     {'name': 'path-noscheme',
+                      'lower': 'path-noscheme',
+                      'index': 38,
+                      'line': 38,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 43},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 4, 'index': 41})},
+                     {'name': 'path-rootless',
+                      'lower': 'path-rootless',
+                      'index': 39,
+                      'line': 39,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 42},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 4, 'index': 41})},
+                     {'name': 'path-empty',
+                      'lower': 'path-empty',
+                      'index': 40,
+                      'line': 40,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 7, 'string': ()},)},
+                     {'name': 'segment',
+                      'lower': 'segment',
+                      'index': 41,
+                      'line': 41,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 44})},
+                     {'name': 'segment-nz',
+                      'lower': 'segment-nz',
+                      'index': 42,
+                      'line': 42,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 44})},
+                     {'name': 'segment-nz-nc',
+                      'lower': 'segment-nz-nc',
+                      'index': 43,
+                      'line': 43,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3, 4, 5)},
+                                  {'type': 4, 'index': 48},
+                                  {'type': 4, 'index': 47},
+                                  {'type': 4, 'index': 51},
+                                  {'type': 7, 'string': (64,)})},
+                     {'name': 'pchar',
+                      'lower': 'pchar',
+                      'index': 44,
+                      'line': 44,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2, 3, 4, 5)},
+                                  {'type': 4, 'index': 48},
+                                  {'type': 4, 'index': 47},
+                                  {'type': 4, 'index': 51},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 7, 'string': (64,)})},
+                     {'name': 'query',
+                      'lower': 'query',
+                      'index': 45,
+                      'line': 45,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3, 4)},
+                                  {'type': 4, 'index': 44},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 7, 'string': (63,)})},
+                     {'name': 'fragment',
+                      'lower': 'fragment',
+                      'index': 46,
+                      'line': 46,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (2, 3, 4)},
+                                  {'type': 4, 'index': 44},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 7, 'string': (63,)})},
+                     {'name': 'pct-encoded',
+                      'lower': 'pct-encoded',
+                      'index': 47,
+                      'line': 47,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 3)},
+                                  {'type': 7, 'string': (37,)},
+                                  {'type': 4, 'index': 8},
+                                  {'type': 4, 'index': 8})},
+                     {'name': 'unreserved',
+                      'lower': 'unreserved',
+                      'index': 48,
+                      'line': 48,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2, 3, 4, 5, 6)},
+                                  {'type': 4, 'index': 0},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 7, 'string': (45,)},
+                                  {'type': 7, 'string': (46,)},
+                                  {'type': 7, 'string': (95,)},
+                                  {'type': 7, 'string': (126,)})},
+                     {'name': 'reserved',
+                      'lower': 'reserved',
+                      'index': 49,
+                      'line': 49,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 4, 'index': 50},
+                                  {'type': 4, 'index': 51})},
+                     {'name': 'gen-delims',
+                      'lower': 'gen-delims',
+                      'index': 50,
+                      'line': 50,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1,
+                                   'children': (1, 2, 3, 4, 5, 6, 7)},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 7, 'string': (47,)},
+                                  {'type': 7, 'string': (63,)},
+                                  {'type': 7, 'string': (35,)},
+                                  {'type': 7, 'string': (91,)},
+                                  {'type': 7, 'string': (93,)},
+                                  {'type': 7, 'string': (64,)})},
+                     {'name': 'sub-delims',
+                      'lower': 'sub-delims',
+                      'index': 51,
+                      'line': 51,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1,
+                                   'children': (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)},
+                                  {'type': 7, 'string': (33,)},
+                                  {'type': 7, 'string': (36,)},
+                                  {'type': 7, 'string': (38,)},
+                                  {'type': 7, 'string': (39,)},
+                                  {'type': 7, 'string': (40,)},
+                                  {'type': 7, 'string': (41,)},
+                                  {'type': 7, 'string': (42,)},
+                                  {'type': 7, 'string': (43,)},
+                                  {'type': 7, 'string': (44,)},
+                                  {'type': 7, 'string': (61,)})},
+                     {'name': 'tag-list',
+                      'lower': 'tag-list',
+                      'index': 52,
+                      'line': 52,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 6)},
+                                  {'type': 4, 'index': 53},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 7, 'string': (59,)},
+                                  {'type': 4, 'index': 53},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (8, 9)},
+                                  {'type': 7, 'string': (59,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15})},
+                     {'name': 'tag-spec',
+                      'lower': 'tag-spec',
+                      'index': 53,
+                      'line': 53,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2,
+                                   'children': (1, 3, 4, 6, 7, 9, 10)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 59},
+                                  {'type': 4, 'index': 54},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 59},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 59},
+                                  {'type': 4, 'index': 55},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 59})},
+                     {'name': 'tag-name',
+                      'lower': 'tag-name',
+                      'index': 54,
+                      'line': 54,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 0},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 58})},
+                     {'name': 'tag-value',
+                      'lower': 'tag-value',
+                      'index': 55,
+                      'line': 55,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (2, 3)},
+                                  {'type': 4, 'index': 56},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (5, 9)},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 1, 'children': (7, 8)},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 59},
+                                  {'type': 4, 'index': 56})},
+                     {'name': 'tval',
+                      'lower': 'tval',
+                      'index': 56,
+                      'line': 56,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 57})},
+                     {'name': 'VALCHAR',
+                      'lower': 'valchar',
+                      'index': 57,
+                      'line': 57,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2)},
+                                  {'type': 5, 'min': 33, 'max': 58},
+                                  {'type': 5, 'min': 60, 'max': 126})},
+                     {'name': 'ALNUMPUNC',
+                      'lower': 'alnumpunc',
+                      'index': 58,
+                      'line': 58,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 1, 'children': (1, 2, 3)},
+                                  {'type': 4, 'index': 0},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 7, 'string': (95,)})},
+                     {'name': 'FWSDKIM',
+                      'lower': 'fwsdkim',
+                      'index': 59,
+                      'line': 59,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 6)},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (3, 5)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 4},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15})},
+                     {'name': 'dmarc-uri',
+                      'lower': 'dmarc-uri',
+                      'index': 60,
+                      'line': 60,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2)},
+                                  {'type': 4, 'index': 16},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 2, 'children': (4, 5, 7)},
+                                  {'type': 7, 'string': (33,)},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 6},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 1, 'children': (9, 10, 11, 12)},
+                                  {'type': 7, 'string': (107,)},
+                                  {'type': 7, 'string': (109,)},
+                                  {'type': 7, 'string': (103,)},
+                                  {'type': 7, 'string': (116,)})},
+                     {'name': 'dmarc-version',
+                      'lower': 'dmarc-version',
+                      'index': 61,
+                      'line': 61,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2,
+                                   'children': (1,
+                                                2,
+                                                4,
+                                                5,
+                                                7,
+                                                8,
+                                                9,
+                                                10,
+                                                11,
+                                                12)},
+                                  {'type': 7, 'string': (118,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 6, 'string': (68,)},
+                                  {'type': 6, 'string': (77,)},
+                                  {'type': 6, 'string': (65,)},
+                                  {'type': 6, 'string': (82,)},
+                                  {'type': 6, 'string': (67,)},
+                                  {'type': 6, 'string': (49,)})},
+                     {'name': 'dmarc-sep',
+                      'lower': 'dmarc-sep',
+                      'index': 62,
+                      'line': 62,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 3, 4)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 6, 'string': (59,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15})},
+                     {'name': 'dmarc-request',
+                      'lower': 'dmarc-request',
+                      'index': 63,
+                      'line': 63,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (112,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 55})},
+                     {'name': 'dmarc-srequest',
+                      'lower': 'dmarc-srequest',
+                      'index': 64,
+                      'line': 64,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (115, 112)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 55})},
+                     {'name': 'dmarc-auri',
+                      'lower': 'dmarc-auri',
+                      'index': 65,
+                      'line': 65,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7, 8)},
+                                  {'type': 7, 'string': (114, 117, 97)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 60},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (10, 12, 13, 15)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (44,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 60})},
+                     {'name': 'dmarc-furi',
+                      'lower': 'dmarc-furi',
+                      'index': 66,
+                      'line': 66,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7, 8)},
+                                  {'type': 7, 'string': (114, 117, 102)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 60},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (10, 12, 13, 15)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (44,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 4, 'index': 60})},
+                     {'name': 'dmarc-adkim',
+                      'lower': 'dmarc-adkim',
+                      'index': 67,
+                      'line': 67,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7,
+                                   'string': (97, 100, 107, 105, 109)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 1, 'children': (8, 9)},
+                                  {'type': 7, 'string': (114,)},
+                                  {'type': 7, 'string': (115,)})},
+                     {'name': 'dmarc-aspf',
+                      'lower': 'dmarc-aspf',
+                      'index': 68,
+                      'line': 68,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (97, 115, 112, 102)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 1, 'children': (8, 9)},
+                                  {'type': 7, 'string': (114,)},
+                                  {'type': 7, 'string': (115,)})},
+                     {'name': 'dmarc-ainterval',
+                      'lower': 'dmarc-ainterval',
+                      'index': 69,
+                      'line': 69,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (114, 105)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 3,
+                                   'min': 1,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 6})},
+                     {'name': 'dmarc-fo',
+                      'lower': 'dmarc-fo',
+                      'index': 70,
+                      'line': 70,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7, 12)},
+                                  {'type': 7, 'string': (102, 111)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 1, 'children': (8, 9, 10, 11)},
+                                  {'type': 7, 'string': (48,)},
+                                  {'type': 7, 'string': (49,)},
+                                  {'type': 7, 'string': (100,)},
+                                  {'type': 7, 'string': (115,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (14, 16, 17, 19)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (58,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 1, 'children': (20, 21, 22, 23)},
+                                  {'type': 7, 'string': (48,)},
+                                  {'type': 7, 'string': (49,)},
+                                  {'type': 7, 'string': (100,)},
+                                  {'type': 7, 'string': (115,)})},
+                     {'name': 'dmarc-rfmt',
+                      'lower': 'dmarc-rfmt',
+                      'index': 71,
+                      'line': 71,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (114, 102)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (97, 102, 114, 102)})},
+                     {'name': 'dmarc-percent',
+                      'lower': 'dmarc-percent',
+                      'index': 72,
+                      'line': 72,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 4, 5, 7)},
+                                  {'type': 7, 'string': (112, 99, 116)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 7, 'string': (61,)},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 4, 'index': 15},
+                                  {'type': 3, 'min': 1, 'max': 3},
+                                  {'type': 4, 'index': 6})},
+                     {'name': 'dmarc-record',
+                      'lower': 'dmarc-record',
+                      'index': 73,
+                      'line': 73,
+                      'is_bkru': False,
+                      'is_bkrr': False,
+                      'has_bkrr': False,
+                      'opcodes': ({'type': 2, 'children': (1, 2, 17)},
+                                  {'type': 4, 'index': 61},
+                                  {'type': 3,
+                                   'min': 0,
+                                   'max': 9223372036854775807},
+                                  {'type': 2, 'children': (4, 5)},
+                                  {'type': 4, 'index': 62},
+                                  {'type': 1,
+                                   'children': (6,
+                                                7,
+                                                8,
+                                                9,
+                                                10,
+                                                11,
+                                                12,
+                                                13,
+                                                14,
+                                                15,
+                                                16)},
+                                  {'type': 4, 'index': 63},
+                                  {'type': 4, 'index': 64},
+                                  {'type': 4, 'index': 65},
+                                  {'type': 4, 'index': 66},
+                                  {'type': 4, 'index': 68},
+                                  {'type': 4, 'index': 67},
+                                  {'type': 4, 'index': 68},
+                                  {'type': 4, 'index': 69},
+                                  {'type': 4, 'index': 70},
+                                  {'type': 4, 'index': 72},
+                                  {'type': 4, 'index': 71},
+                                  {'type': 3, 'min': 0, 'max': 1},
+                                  {'type': 4, 'index': 62})}),
+           'udts': ()}}
@@ -0,0 +1,2330 @@
+# Generated by `python -m dmarcparser.grammars`, do not edit.
+"""Recognizer of the dmarc grammar, see dmarcparser.codegen."""
+
+import re
+
+DIGEST = 'bedd8b0b5222be340d515310f24301ea21b0154ab17b0f7c08a1f87625597618'
+
+_C0 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_C1 = frozenset('01')
+_C2 = frozenset('\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~\x7f')
+_C3 = frozenset('\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x7f')
+_C4 = frozenset('0123456789')
+_C5 = frozenset('0123456789ABCDEFabcdef')
+_C6 = frozenset('\t ')
+_C7 = frozenset('\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~\x7f\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0¡¢£¤¥¦§¨©ª«¬\xad®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ')
+_C8 = frozenset('!"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
+_L9 = ('//',)
+_R10 = re.compile('[\\u002b\\u002d-\\u002e\\u0030-\\u0039\\u0041-\\u005a\\u0061-\\u007a]{0,}')
+_C11 = frozenset('-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~')
+_C12 = frozenset("!$&'()*+,=")
+_R13 = re.compile('[\\u0030-\\u0039]{0,}')
+_C14 = frozenset('Vv')
+_R15 = re.compile('[\\u0030-\\u0039\\u0041-\\u0046\\u0061-\\u0066]{1,}')
+_R16 = re.compile('[\\u0021\\u0024\\u0026-\\u002e\\u0030-\\u003a\\u003d\\u0041-\\u005a\\u005f\\u0061-\\u007a\\u007e]{1,}')
+_L17 = ('::',)
+_R18 = re.compile('[\\u0030-\\u0039\\u0041-\\u0046\\u0061-\\u0066]{1,4}')
+_L19 = ('25',)
+_C20 = frozenset('012345')
+_C21 = frozenset('01234')
+_R22 = re.compile('[\\u0030-\\u0039]{2,2}')
+_C23 = frozenset('123456789')
+_C24 = frozenset("!#$&'()*+,/:=?@[]")
+_C25 = frozenset('#/:?@[]')
+_R26 = re.compile('[\\u0009\\u0020]{0,}')
+_R27 = re.compile('[\\u0030-\\u0039\\u0041-\\u005a\\u005f\\u0061-\\u007a]{0,}')
+_R28 = re.compile('[\\u0021-\\u003a\\u003c-\\u007e]{1,}')
+_C29 = frozenset('!"#$%&\'()*+,-./0123456789:<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
+_C30 = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
+_R31 = re.compile('[\\u0009\\u0020]{1,}')
+_R32 = re.compile('[\\u0030-\\u0039]{1,}')
+_R33 = re.compile('[\\u0047\\u004b\\u004d\\u0054\\u0067\\u006b\\u006d\\u0074]{0,1}')
+_C34 = frozenset('Pp')
+_L35 = ('sp', 'sP', 'Sp', 'SP')
+_L36 = ('rua', 'ruA', 'rUa', 'rUA', 'Rua', 'RuA', 'RUa', 'RUA')
+_L37 = ('ruf', 'ruF', 'rUf', 'rUF', 'Ruf', 'RuF', 'RUf', 'RUF')
+_L38 = ('adkim', 'adkiM', 'adkIm', 'adkIM', 'adKim', 'adKiM', 'adKIm', 'adKIM', 'aDkim', 'aDkiM', 'aDkIm', 'aDkIM', 'aDKim', 'aDKiM', 'aDKIm', 'aDKIM', 'Adkim', 'AdkiM', 'AdkIm', 'AdkIM', 'AdKim', 'AdKiM', 'AdKIm', 'AdKIM', 'ADkim', 'ADkiM', 'ADkIm', 'ADkIM', 'ADKim', 'ADKiM', 'ADKIm', 'ADKIM')
+_C39 = frozenset('RSrs')
+_L40 = ('aspf', 'aspF', 'asPf', 'asPF', 'aSpf', 'aSpF', 'aSPf', 'aSPF', 'Aspf', 'AspF', 'AsPf', 'AsPF', 'ASpf', 'ASpF', 'ASPf', 'ASPF')
+_L41 = ('ri', 'rI', 'Ri', 'RI')
+_L42 = ('fo', 'fO', 'Fo', 'FO')
+_C43 = frozenset('01DSds')
+_L44 = ('rf', 'rF', 'Rf', 'RF')
+_L45 = ('afrf', 'afrF', 'afRf', 'afRF', 'aFrf', 'aFrF', 'aFRf', 'aFRF', 'Afrf', 'AfrF', 'AfRf', 'AfRF', 'AFrf', 'AFrF', 'AFRf', 'AFRF')
+_L46 = ('pct', 'pcT', 'pCt', 'pCT', 'Pct', 'PcT', 'PCt', 'PCT')
+_R47 = re.compile('[\\u0030-\\u0039]{1,3}')
+
+
+def _r_alpha(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C0 else -1
+    f = cb[0]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_bit(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C1 else -1
+    f = cb[1]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_char(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C2 else -1
+    f = cb[2]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_cr(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\r' else -1
+    f = cb[3]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_crlf(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] == '\r' else -1
+        if p0 < 0:
+            e = -1
+            break
+        e = p0 + 1 if p0 < n and s[p0] == '\n' else -1
+        break
+    f = cb[4]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ctl(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C3 else -1
+    f = cb[5]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_digit(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C4 else -1
+    f = cb[6]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dquote(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '"' else -1
+    f = cb[7]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_hexdig(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C5 else -1
+    f = cb[8]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_htab(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\t' else -1
+    f = cb[9]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_lf(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\n' else -1
+    f = cb[10]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_lwsp(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = p0 + 1 if p0 < n and s[p0] in _C6 else -1
+            if p1 >= 0:
+                break
+            while True:
+                p3 = _r_crlf(s, n, p0, cb, ud)
+                if p3 < 0:
+                    p1 = -1
+                    break
+                p1 = p3 + 1 if p3 < n and s[p3] in _C6 else -1
+                break
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[11]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_octet(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C7 else -1
+    f = cb[12]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_sp(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == ' ' else -1
+    f = cb[13]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_vchar(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C8 else -1
+    f = cb[14]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_wsp(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C6 else -1
+    f = cb[15]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_uri(s, n, p, cb, ud):
+    while True:
+        p0 = _r_scheme(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0 + 1 if p0 < n and s[p0] == ':' else -1
+        if p1 < 0:
+            e = -1
+            break
+        p2 = _r_hier_part(s, n, p1, cb, ud)
+        if p2 < 0:
+            e = -1
+            break
+        p4 = p2
+        p6 = 0
+        while p4 < n:
+            while True:
+                p7 = p4 + 1 if p4 < n and s[p4] == '?' else -1
+                if p7 < 0:
+                    p5 = -1
+                    break
+                p5 = _r_query(s, n, p7, cb, ud)
+                break
+            if p5 < 0:
+                break
+            if p5 == p4:
+                p6 = 0
+                break
+            p4 = p5
+            p6 += 1
+            if p6 == 1:
+                break
+        p3 = p4
+        p8 = p3
+        p10 = 0
+        while p8 < n:
+            while True:
+                p11 = p8 + 1 if p8 < n and s[p8] == '#' else -1
+                if p11 < 0:
+                    p9 = -1
+                    break
+                p9 = _r_fragment(s, n, p11, cb, ud)
+                break
+            if p9 < 0:
+                break
+            if p9 == p8:
+                p10 = 0
+                break
+            p8 = p9
+            p10 += 1
+            if p10 == 1:
+                break
+        e = p8
+        break
+    f = cb[16]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_hier_part(s, n, p, cb, ud):
+    while True:
+        while True:
+            p0 = p + 2 if s.startswith(_L9, p) else -1
+            if p0 < 0:
+                e = -1
+                break
+            p1 = _r_authority(s, n, p0, cb, ud)
+            if p1 < 0:
+                e = -1
+                break
+            e = _r_path_abempty(s, n, p1, cb, ud)
+            break
+        if e >= 0:
+            break
+        e = _r_path_absolute(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_rootless(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_empty(s, n, p, cb, ud)
+        break
+    f = cb[17]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_uri_reference(s, n, p, cb, ud):
+    while True:
+        e = _r_uri(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_relative_ref(s, n, p, cb, ud)
+        break
+    f = cb[18]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_absolute_uri(s, n, p, cb, ud):
+    while True:
+        p0 = _r_scheme(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0 + 1 if p0 < n and s[p0] == ':' else -1
+        if p1 < 0:
+            e = -1
+            break
+        p2 = _r_hier_part(s, n, p1, cb, ud)
+        if p2 < 0:
+            e = -1
+            break
+        p3 = p2
+        p5 = 0
+        while p3 < n:
+            while True:
+                p6 = p3 + 1 if p3 < n and s[p3] == '?' else -1
+                if p6 < 0:
+                    p4 = -1
+                    break
+                p4 = _r_query(s, n, p6, cb, ud)
+                break
+            if p4 < 0:
+                break
+            if p4 == p3:
+                p5 = 0
+                break
+            p3 = p4
+            p5 += 1
+            if p5 == 1:
+                break
+        e = p3
+        break
+    f = cb[19]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_relative_ref(s, n, p, cb, ud):
+    while True:
+        p0 = _r_relative_part(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p2 = p0
+        p4 = 0
+        while p2 < n:
+            while True:
+                p5 = p2 + 1 if p2 < n and s[p2] == '?' else -1
+                if p5 < 0:
+                    p3 = -1
+                    break
+                p3 = _r_query(s, n, p5, cb, ud)
+                break
+            if p3 < 0:
+                break
+            if p3 == p2:
+                p4 = 0
+                break
+            p2 = p3
+            p4 += 1
+            if p4 == 1:
+                break
+        p1 = p2
+        p6 = p1
+        p8 = 0
+        while p6 < n:
+            while True:
+                p9 = p6 + 1 if p6 < n and s[p6] == '#' else -1
+                if p9 < 0:
+                    p7 = -1
+                    break
+                p7 = _r_fragment(s, n, p9, cb, ud)
+                break
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        e = p6
+        break
+    f = cb[20]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_relative_part(s, n, p, cb, ud):
+    while True:
+        while True:
+            p0 = p + 2 if s.startswith(_L9, p) else -1
+            if p0 < 0:
+                e = -1
+                break
+            p1 = _r_authority(s, n, p0, cb, ud)
+            if p1 < 0:
+                e = -1
+                break
+            e = _r_path_abempty(s, n, p1, cb, ud)
+            break
+        if e >= 0:
+            break
+        e = _r_path_absolute(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_noscheme(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_empty(s, n, p, cb, ud)
+        break
+    f = cb[21]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_scheme(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C0 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p1 = _R10.match(s, p0)
+        e = p1.end() if p1 is not None else -1
+        break
+    f = cb[22]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_authority(s, n, p, cb, ud):
+    while True:
+        p1 = p
+        p3 = 0
+        while p1 < n:
+            while True:
+                p4 = _r_userinfo(s, n, p1, cb, ud)
+                if p4 < 0:
+                    p2 = -1
+                    break
+                p2 = p4 + 1 if p4 < n and s[p4] == '@' else -1
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        p0 = p1
+        p5 = _r_host(s, n, p0, cb, ud)
+        if p5 < 0:
+            e = -1
+            break
+        p6 = p5
+        p8 = 0
+        while p6 < n:
+            while True:
+                p9 = p6 + 1 if p6 < n and s[p6] == ':' else -1
+                if p9 < 0:
+                    p7 = -1
+                    break
+                p7 = _r_port(s, n, p9, cb, ud)
+                break
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        e = p6
+        break
+    f = cb[23]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_userinfo(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = p0 + 1 if p0 < n and s[p0] in _C11 else -1
+            if p1 >= 0:
+                break
+            p1 = _r_pct_encoded(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] in _C12 else -1
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == ':' else -1
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[24]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_host(s, n, p, cb, ud):
+    while True:
+        e = _r_ip_literal(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_ipv4address(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_reg_name(s, n, p, cb, ud)
+        break
+    f = cb[25]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_port(s, n, p, cb, ud):
+    p0 = _R13.match(s, p)
+    e = p0.end() if p0 is not None else -1
+    f = cb[26]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ip_literal(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] == '[' else -1
+        if p0 < 0:
+            e = -1
+            break
+        while True:
+            p1 = _r_ipv6address(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = _r_ipvfuture(s, n, p0, cb, ud)
+            break
+        if p1 < 0:
+            e = -1
+            break
+        e = p1 + 1 if p1 < n and s[p1] == ']' else -1
+        break
+    f = cb[27]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ipvfuture(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C14 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R15.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        if p1 < 0:
+            e = -1
+            break
+        p3 = p1 + 1 if p1 < n and s[p1] == '.' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p4 = _R16.match(s, p3)
+        e = p4.end() if p4 is not None else -1
+        break
+    f = cb[28]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ipv6address(s, n, p, cb, ud):
+    while True:
+        while True:
+            p1 = p
+            p3 = 0
+            while p1 < n:
+                while True:
+                    p4 = _r_h16(s, n, p1, cb, ud)
+                    if p4 < 0:
+                        p2 = -1
+                        break
+                    p2 = p4 + 1 if p4 < n and s[p4] == ':' else -1
+                    break
+                if p2 < 0:
+                    break
+                if p2 == p1:
+                    p3 = 6
+                    break
+                p1 = p2
+                p3 += 1
+                if p3 == 6:
+                    break
+            p0 = p1 if p3 >= 6 else -1
+            if p0 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p0, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p5 = p + 2 if s.startswith(_L17, p) else -1
+            if p5 < 0:
+                e = -1
+                break
+            p7 = p5
+            p9 = 0
+            while p7 < n:
+                while True:
+                    p10 = _r_h16(s, n, p7, cb, ud)
+                    if p10 < 0:
+                        p8 = -1
+                        break
+                    p8 = p10 + 1 if p10 < n and s[p10] == ':' else -1
+                    break
+                if p8 < 0:
+                    break
+                if p8 == p7:
+                    p9 = 5
+                    break
+                p7 = p8
+                p9 += 1
+                if p9 == 5:
+                    break
+            p6 = p7 if p9 >= 5 else -1
+            if p6 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p6, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p12 = p
+            p14 = 0
+            while p12 < n:
+                p13 = _r_h16(s, n, p12, cb, ud)
+                if p13 < 0:
+                    break
+                if p13 == p12:
+                    p14 = 0
+                    break
+                p12 = p13
+                p14 += 1
+                if p14 == 1:
+                    break
+            p11 = p12
+            p15 = p11 + 2 if s.startswith(_L17, p11) else -1
+            if p15 < 0:
+                e = -1
+                break
+            p17 = p15
+            p19 = 0
+            while p17 < n:
+                while True:
+                    p20 = _r_h16(s, n, p17, cb, ud)
+                    if p20 < 0:
+                        p18 = -1
+                        break
+                    p18 = p20 + 1 if p20 < n and s[p20] == ':' else -1
+                    break
+                if p18 < 0:
+                    break
+                if p18 == p17:
+                    p19 = 4
+                    break
+                p17 = p18
+                p19 += 1
+                if p19 == 4:
+                    break
+            p16 = p17 if p19 >= 4 else -1
+            if p16 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p16, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p22 = p
+            p24 = 0
+            while p22 < n:
+                while True:
+                    p26 = p22
+                    p28 = 0
+                    while p26 < n:
+                        while True:
+                            p29 = _r_h16(s, n, p26, cb, ud)
+                            if p29 < 0:
+                                p27 = -1
+                                break
+                            p27 = p29 + 1 if p29 < n and s[p29] == ':' else -1
+                            break
+                        if p27 < 0:
+                            break
+                        if p27 == p26:
+                            p28 = 0
+                            break
+                        p26 = p27
+                        p28 += 1
+                        if p28 == 1:
+                            break
+                    p25 = p26
+                    p23 = _r_h16(s, n, p25, cb, ud)
+                    break
+                if p23 < 0:
+                    break
+                if p23 == p22:
+                    p24 = 0
+                    break
+                p22 = p23
+                p24 += 1
+                if p24 == 1:
+                    break
+            p21 = p22
+            p30 = p21 + 2 if s.startswith(_L17, p21) else -1
+            if p30 < 0:
+                e = -1
+                break
+            p32 = p30
+            p34 = 0
+            while p32 < n:
+                while True:
+                    p35 = _r_h16(s, n, p32, cb, ud)
+                    if p35 < 0:
+                        p33 = -1
+                        break
+                    p33 = p35 + 1 if p35 < n and s[p35] == ':' else -1
+                    break
+                if p33 < 0:
+                    break
+                if p33 == p32:
+                    p34 = 3
+                    break
+                p32 = p33
+                p34 += 1
+                if p34 == 3:
+                    break
+            p31 = p32 if p34 >= 3 else -1
+            if p31 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p31, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p37 = p
+            p39 = 0
+            while p37 < n:
+                while True:
+                    p41 = p37
+                    p43 = 0
+                    while p41 < n:
+                        while True:
+                            p44 = _r_h16(s, n, p41, cb, ud)
+                            if p44 < 0:
+                                p42 = -1
+                                break
+                            p42 = p44 + 1 if p44 < n and s[p44] == ':' else -1
+                            break
+                        if p42 < 0:
+                            break
+                        if p42 == p41:
+                            p43 = 0
+                            break
+                        p41 = p42
+                        p43 += 1
+                        if p43 == 2:
+                            break
+                    p40 = p41
+                    p38 = _r_h16(s, n, p40, cb, ud)
+                    break
+                if p38 < 0:
+                    break
+                if p38 == p37:
+                    p39 = 0
+                    break
+                p37 = p38
+                p39 += 1
+                if p39 == 1:
+                    break
+            p36 = p37
+            p45 = p36 + 2 if s.startswith(_L17, p36) else -1
+            if p45 < 0:
+                e = -1
+                break
+            p47 = p45
+            p49 = 0
+            while p47 < n:
+                while True:
+                    p50 = _r_h16(s, n, p47, cb, ud)
+                    if p50 < 0:
+                        p48 = -1
+                        break
+                    p48 = p50 + 1 if p50 < n and s[p50] == ':' else -1
+                    break
+                if p48 < 0:
+                    break
+                if p48 == p47:
+                    p49 = 2
+                    break
+                p47 = p48
+                p49 += 1
+                if p49 == 2:
+                    break
+            p46 = p47 if p49 >= 2 else -1
+            if p46 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p46, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p52 = p
+            p54 = 0
+            while p52 < n:
+                while True:
+                    p56 = p52
+                    p58 = 0
+                    while p56 < n:
+                        while True:
+                            p59 = _r_h16(s, n, p56, cb, ud)
+                            if p59 < 0:
+                                p57 = -1
+                                break
+                            p57 = p59 + 1 if p59 < n and s[p59] == ':' else -1
+                            break
+                        if p57 < 0:
+                            break
+                        if p57 == p56:
+                            p58 = 0
+                            break
+                        p56 = p57
+                        p58 += 1
+                        if p58 == 3:
+                            break
+                    p55 = p56
+                    p53 = _r_h16(s, n, p55, cb, ud)
+                    break
+                if p53 < 0:
+                    break
+                if p53 == p52:
+                    p54 = 0
+                    break
+                p52 = p53
+                p54 += 1
+                if p54 == 1:
+                    break
+            p51 = p52
+            p60 = p51 + 2 if s.startswith(_L17, p51) else -1
+            if p60 < 0:
+                e = -1
+                break
+            p61 = _r_h16(s, n, p60, cb, ud)
+            if p61 < 0:
+                e = -1
+                break
+            p62 = p61 + 1 if p61 < n and s[p61] == ':' else -1
+            if p62 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p62, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p64 = p
+            p66 = 0
+            while p64 < n:
+                while True:
+                    p68 = p64
+                    p70 = 0
+                    while p68 < n:
+                        while True:
+                            p71 = _r_h16(s, n, p68, cb, ud)
+                            if p71 < 0:
+                                p69 = -1
+                                break
+                            p69 = p71 + 1 if p71 < n and s[p71] == ':' else -1
+                            break
+                        if p69 < 0:
+                            break
+                        if p69 == p68:
+                            p70 = 0
+                            break
+                        p68 = p69
+                        p70 += 1
+                        if p70 == 4:
+                            break
+                    p67 = p68
+                    p65 = _r_h16(s, n, p67, cb, ud)
+                    break
+                if p65 < 0:
+                    break
+                if p65 == p64:
+                    p66 = 0
+                    break
+                p64 = p65
+                p66 += 1
+                if p66 == 1:
+                    break
+            p63 = p64
+            p72 = p63 + 2 if s.startswith(_L17, p63) else -1
+            if p72 < 0:
+                e = -1
+                break
+            e = _r_ls32(s, n, p72, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p74 = p
+            p76 = 0
+            while p74 < n:
+                while True:
+                    p78 = p74
+                    p80 = 0
+                    while p78 < n:
+                        while True:
+                            p81 = _r_h16(s, n, p78, cb, ud)
+                            if p81 < 0:
+                                p79 = -1
+                                break
+                            p79 = p81 + 1 if p81 < n and s[p81] == ':' else -1
+                            break
+                        if p79 < 0:
+                            break
+                        if p79 == p78:
+                            p80 = 0
+                            break
+                        p78 = p79
+                        p80 += 1
+                        if p80 == 5:
+                            break
+                    p77 = p78
+                    p75 = _r_h16(s, n, p77, cb, ud)
+                    break
+                if p75 < 0:
+                    break
+                if p75 == p74:
+                    p76 = 0
+                    break
+                p74 = p75
+                p76 += 1
+                if p76 == 1:
+                    break
+            p73 = p74
+            p82 = p73 + 2 if s.startswith(_L17, p73) else -1
+            if p82 < 0:
+                e = -1
+                break
+            e = _r_h16(s, n, p82, cb, ud)
+            break
+        if e >= 0:
+            break
+        while True:
+            p84 = p
+            p86 = 0
+            while p84 < n:
+                while True:
+                    p88 = p84
+                    p90 = 0
+                    while p88 < n:
+                        while True:
+                            p91 = _r_h16(s, n, p88, cb, ud)
+                            if p91 < 0:
+                                p89 = -1
+                                break
+                            p89 = p91 + 1 if p91 < n and s[p91] == ':' else -1
+                            break
+                        if p89 < 0:
+                            break
+                        if p89 == p88:
+                            p90 = 0
+                            break
+                        p88 = p89
+                        p90 += 1
+                        if p90 == 6:
+                            break
+                    p87 = p88
+                    p85 = _r_h16(s, n, p87, cb, ud)
+                    break
+                if p85 < 0:
+                    break
+                if p85 == p84:
+                    p86 = 0
+                    break
+                p84 = p85
+                p86 += 1
+                if p86 == 1:
+                    break
+            p83 = p84
+            e = p83 + 2 if s.startswith(_L17, p83) else -1
+            break
+        break
+    f = cb[29]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_h16(s, n, p, cb, ud):
+    p0 = _R18.match(s, p)
+    e = p0.end() if p0 is not None else -1
+    f = cb[30]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ls32(s, n, p, cb, ud):
+    while True:
+        while True:
+            p0 = _r_h16(s, n, p, cb, ud)
+            if p0 < 0:
+                e = -1
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == ':' else -1
+            if p1 < 0:
+                e = -1
+                break
+            e = _r_h16(s, n, p1, cb, ud)
+            break
+        if e >= 0:
+            break
+        e = _r_ipv4address(s, n, p, cb, ud)
+        break
+    f = cb[31]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ipv4address(s, n, p, cb, ud):
+    while True:
+        p0 = _r_dec_octet(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0 + 1 if p0 < n and s[p0] == '.' else -1
+        if p1 < 0:
+            e = -1
+            break
+        p2 = _r_dec_octet(s, n, p1, cb, ud)
+        if p2 < 0:
+            e = -1
+            break
+        p3 = p2 + 1 if p2 < n and s[p2] == '.' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p4 = _r_dec_octet(s, n, p3, cb, ud)
+        if p4 < 0:
+            e = -1
+            break
+        p5 = p4 + 1 if p4 < n and s[p4] == '.' else -1
+        if p5 < 0:
+            e = -1
+            break
+        e = _r_dec_octet(s, n, p5, cb, ud)
+        break
+    f = cb[32]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dec_octet(s, n, p, cb, ud):
+    while True:
+        while True:
+            p0 = p + 2 if s.startswith(_L19, p) else -1
+            if p0 < 0:
+                e = -1
+                break
+            e = p0 + 1 if p0 < n and s[p0] in _C20 else -1
+            break
+        if e >= 0:
+            break
+        while True:
+            p1 = p + 1 if p < n and s[p] == '2' else -1
+            if p1 < 0:
+                e = -1
+                break
+            p2 = p1 + 1 if p1 < n and s[p1] in _C21 else -1
+            if p2 < 0:
+                e = -1
+                break
+            e = p2 + 1 if p2 < n and s[p2] in _C4 else -1
+            break
+        if e >= 0:
+            break
+        while True:
+            p3 = p + 1 if p < n and s[p] == '1' else -1
+            if p3 < 0:
+                e = -1
+                break
+            p4 = _R22.match(s, p3)
+            e = p4.end() if p4 is not None else -1
+            break
+        if e >= 0:
+            break
+        while True:
+            p5 = p + 1 if p < n and s[p] in _C23 else -1
+            if p5 < 0:
+                e = -1
+                break
+            e = p5 + 1 if p5 < n and s[p5] in _C4 else -1
+            break
+        if e >= 0:
+            break
+        e = p + 1 if p < n and s[p] in _C4 else -1
+        break
+    f = cb[33]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_reg_name(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = p0 + 1 if p0 < n and s[p0] in _C11 else -1
+            if p1 >= 0:
+                break
+            p1 = _r_pct_encoded(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] in _C12 else -1
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[34]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path(s, n, p, cb, ud):
+    while True:
+        e = _r_path_abempty(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_absolute(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_noscheme(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_rootless(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = _r_path_empty(s, n, p, cb, ud)
+        break
+    f = cb[35]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path_abempty(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p3 = p0 + 1 if p0 < n and s[p0] == '/' else -1
+            if p3 < 0:
+                p1 = -1
+                break
+            p1 = _r_segment(s, n, p3, cb, ud)
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[36]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path_absolute(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] == '/' else -1
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0
+        p3 = 0
+        while p1 < n:
+            while True:
+                p4 = _r_segment_nz(s, n, p1, cb, ud)
+                if p4 < 0:
+                    p2 = -1
+                    break
+                p5 = p4
+                while p5 < n:
+                    while True:
+                        p8 = p5 + 1 if p5 < n and s[p5] == '/' else -1
+                        if p8 < 0:
+                            p6 = -1
+                            break
+                        p6 = _r_segment(s, n, p8, cb, ud)
+                        break
+                    if p6 < 0:
+                        break
+                    if p6 == p5:
+                        break
+                    p5 = p6
+                p2 = p5
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        e = p1
+        break
+    f = cb[37]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path_noscheme(s, n, p, cb, ud):
+    while True:
+        p0 = _r_segment_nz_nc(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0
+        while p1 < n:
+            while True:
+                p4 = p1 + 1 if p1 < n and s[p1] == '/' else -1
+                if p4 < 0:
+                    p2 = -1
+                    break
+                p2 = _r_segment(s, n, p4, cb, ud)
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                break
+            p1 = p2
+        e = p1
+        break
+    f = cb[38]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path_rootless(s, n, p, cb, ud):
+    while True:
+        p0 = _r_segment_nz(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0
+        while p1 < n:
+            while True:
+                p4 = p1 + 1 if p1 < n and s[p1] == '/' else -1
+                if p4 < 0:
+                    p2 = -1
+                    break
+                p2 = _r_segment(s, n, p4, cb, ud)
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                break
+            p1 = p2
+        e = p1
+        break
+    f = cb[39]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_path_empty(s, n, p, cb, ud):
+    e = p
+    f = cb[40]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_segment(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        p1 = _r_pchar(s, n, p0, cb, ud)
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[41]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_segment_nz(s, n, p, cb, ud):
+    p0 = p
+    p2 = 0
+    while p0 < n:
+        p1 = _r_pchar(s, n, p0, cb, ud)
+        if p1 < 0:
+            break
+        if p1 == p0:
+            p2 = 1
+            break
+        p0 = p1
+        p2 += 1
+    e = p0 if p2 >= 1 else -1
+    f = cb[42]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_segment_nz_nc(s, n, p, cb, ud):
+    p0 = p
+    p2 = 0
+    while p0 < n:
+        while True:
+            p1 = p0 + 1 if p0 < n and s[p0] in _C11 else -1
+            if p1 >= 0:
+                break
+            p1 = _r_pct_encoded(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] in _C12 else -1
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == '@' else -1
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            p2 = 1
+            break
+        p0 = p1
+        p2 += 1
+    e = p0 if p2 >= 1 else -1
+    f = cb[43]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_pchar(s, n, p, cb, ud):
+    while True:
+        e = p + 1 if p < n and s[p] in _C11 else -1
+        if e >= 0:
+            break
+        e = _r_pct_encoded(s, n, p, cb, ud)
+        if e >= 0:
+            break
+        e = p + 1 if p < n and s[p] in _C12 else -1
+        if e >= 0:
+            break
+        e = p + 1 if p < n and s[p] == ':' else -1
+        if e >= 0:
+            break
+        e = p + 1 if p < n and s[p] == '@' else -1
+        break
+    f = cb[44]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_query(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = _r_pchar(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == '/' else -1
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == '?' else -1
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[45]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_fragment(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = _r_pchar(s, n, p0, cb, ud)
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == '/' else -1
+            if p1 >= 0:
+                break
+            p1 = p0 + 1 if p0 < n and s[p0] == '?' else -1
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[46]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_pct_encoded(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] == '%' else -1
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0 + 1 if p0 < n and s[p0] in _C5 else -1
+        if p1 < 0:
+            e = -1
+            break
+        e = p1 + 1 if p1 < n and s[p1] in _C5 else -1
+        break
+    f = cb[47]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_unreserved(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C11 else -1
+    f = cb[48]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_reserved(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C24 else -1
+    f = cb[49]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_gen_delims(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C25 else -1
+    f = cb[50]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_sub_delims(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C12 else -1
+    f = cb[51]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_list(s, n, p, cb, ud):
+    while True:
+        p0 = _r_tag_spec(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p2 = p0
+        while p2 < n:
+            while True:
+                p5 = p2 + 1 if p2 < n and s[p2] == ';' else -1
+                if p5 < 0:
+                    p3 = -1
+                    break
+                p3 = _r_tag_spec(s, n, p5, cb, ud)
+                break
+            if p3 < 0:
+                break
+            if p3 == p2:
+                break
+            p2 = p3
+        p1 = p2
+        p6 = p1
+        p8 = 0
+        while p6 < n:
+            while True:
+                p9 = p6 + 1 if p6 < n and s[p6] == ';' else -1
+                if p9 < 0:
+                    p7 = -1
+                    break
+                p10 = _R26.match(s, p9)
+                p7 = p10.end() if p10 is not None else -1
+                break
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        e = p6
+        break
+    f = cb[52]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_spec(s, n, p, cb, ud):
+    while True:
+        p1 = p
+        p3 = 0
+        while p1 < n:
+            p2 = _r_fwsdkim(s, n, p1, cb, ud)
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        p0 = p1
+        p4 = _r_tag_name(s, n, p0, cb, ud)
+        if p4 < 0:
+            e = -1
+            break
+        p6 = p4
+        p8 = 0
+        while p6 < n:
+            p7 = _r_fwsdkim(s, n, p6, cb, ud)
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        p5 = p6
+        p9 = p5 + 1 if p5 < n and s[p5] == '=' else -1
+        if p9 < 0:
+            e = -1
+            break
+        p11 = p9
+        p13 = 0
+        while p11 < n:
+            p12 = _r_fwsdkim(s, n, p11, cb, ud)
+            if p12 < 0:
+                break
+            if p12 == p11:
+                p13 = 0
+                break
+            p11 = p12
+            p13 += 1
+            if p13 == 1:
+                break
+        p10 = p11
+        p14 = _r_tag_value(s, n, p10, cb, ud)
+        if p14 < 0:
+            e = -1
+            break
+        p15 = p14
+        p17 = 0
+        while p15 < n:
+            p16 = _r_fwsdkim(s, n, p15, cb, ud)
+            if p16 < 0:
+                break
+            if p16 == p15:
+                p17 = 0
+                break
+            p15 = p16
+            p17 += 1
+            if p17 == 1:
+                break
+        e = p15
+        break
+    f = cb[53]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_name(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C0 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p1 = _R27.match(s, p0)
+        e = p1.end() if p1 is not None else -1
+        break
+    f = cb[54]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_value(s, n, p, cb, ud):
+    p0 = p
+    p2 = 0
+    while p0 < n:
+        while True:
+            p3 = _r_tval(s, n, p0, cb, ud)
+            if p3 < 0:
+                p1 = -1
+                break
+            p4 = p3
+            while p4 < n:
+                while True:
+                    p8 = p4
+                    p10 = 0
+                    while p8 < n:
+                        while True:
+                            p9 = p8 + 1 if p8 < n and s[p8] in _C6 else -1
+                            if p9 >= 0:
+                                break
+                            p9 = _r_fwsdkim(s, n, p8, cb, ud)
+                            break
+                        if p9 < 0:
+                            break
+                        if p9 == p8:
+                            p10 = 1
+                            break
+                        p8 = p9
+                        p10 += 1
+                    p7 = p8 if p10 >= 1 else -1
+                    if p7 < 0:
+                        p5 = -1
+                        break
+                    p5 = _r_tval(s, n, p7, cb, ud)
+                    break
+                if p5 < 0:
+                    break
+                if p5 == p4:
+                    break
+                p4 = p5
+            p1 = p4
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            p2 = 0
+            break
+        p0 = p1
+        p2 += 1
+        if p2 == 1:
+            break
+    e = p0
+    f = cb[55]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tval(s, n, p, cb, ud):
+    p0 = _R28.match(s, p)
+    e = p0.end() if p0 is not None else -1
+    f = cb[56]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_valchar(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C29 else -1
+    f = cb[57]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_alnumpunc(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C30 else -1
+    f = cb[58]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_fwsdkim(s, n, p, cb, ud):
+    while True:
+        p1 = p
+        p3 = 0
+        while p1 < n:
+            while True:
+                p5 = _R26.match(s, p1)
+                p4 = p5.end() if p5 is not None else -1
+                p2 = _r_crlf(s, n, p4, cb, ud)
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        p0 = p1
+        p6 = _R31.match(s, p0)
+        e = p6.end() if p6 is not None else -1
+        break
+    f = cb[59]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_uri(s, n, p, cb, ud):
+    while True:
+        p0 = _r_uri(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p1 = p0
+        p3 = 0
+        while p1 < n:
+            while True:
+                p4 = p1 + 1 if p1 < n and s[p1] == '!' else -1
+                if p4 < 0:
+                    p2 = -1
+                    break
+                p6 = _R32.match(s, p4)
+                p5 = p6.end() if p6 is not None else -1
+                if p5 < 0:
+                    p2 = -1
+                    break
+                p7 = _R33.match(s, p5)
+                p2 = p7.end() if p7 is not None else -1
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        e = p1
+        break
+    f = cb[60]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_version(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C14 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = p4 + 1 if p4 < n and s[p4] == 'D' else -1
+        if p6 < 0:
+            e = -1
+            break
+        p7 = p6 + 1 if p6 < n and s[p6] == 'M' else -1
+        if p7 < 0:
+            e = -1
+            break
+        p8 = p7 + 1 if p7 < n and s[p7] == 'A' else -1
+        if p8 < 0:
+            e = -1
+            break
+        p9 = p8 + 1 if p8 < n and s[p8] == 'R' else -1
+        if p9 < 0:
+            e = -1
+            break
+        p10 = p9 + 1 if p9 < n and s[p9] == 'C' else -1
+        if p10 < 0:
+            e = -1
+            break
+        e = p10 + 1 if p10 < n and s[p10] == '1' else -1
+        break
+    f = cb[61]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_sep(s, n, p, cb, ud):
+    while True:
+        p1 = _R26.match(s, p)
+        p0 = p1.end() if p1 is not None else -1
+        p2 = p0 + 1 if p0 < n and s[p0] == ';' else -1
+        if p2 < 0:
+            e = -1
+            break
+        p3 = _R26.match(s, p2)
+        e = p3.end() if p3 is not None else -1
+        break
+    f = cb[62]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_request(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C34 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        e = _r_tag_value(s, n, p4, cb, ud)
+        break
+    f = cb[63]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_srequest(s, n, p, cb, ud):
+    while True:
+        p0 = p + 2 if s.startswith(_L35, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        e = _r_tag_value(s, n, p4, cb, ud)
+        break
+    f = cb[64]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_auri(s, n, p, cb, ud):
+    while True:
+        p0 = p + 3 if s.startswith(_L36, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = _r_dmarc_uri(s, n, p4, cb, ud)
+        if p6 < 0:
+            e = -1
+            break
+        p7 = p6
+        while p7 < n:
+            while True:
+                p11 = _R26.match(s, p7)
+                p10 = p11.end() if p11 is not None else -1
+                p12 = p10 + 1 if p10 < n and s[p10] == ',' else -1
+                if p12 < 0:
+                    p8 = -1
+                    break
+                p14 = _R26.match(s, p12)
+                p13 = p14.end() if p14 is not None else -1
+                p8 = _r_dmarc_uri(s, n, p13, cb, ud)
+                break
+            if p8 < 0:
+                break
+            if p8 == p7:
+                break
+            p7 = p8
+        e = p7
+        break
+    f = cb[65]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_furi(s, n, p, cb, ud):
+    while True:
+        p0 = p + 3 if s.startswith(_L37, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = _r_dmarc_uri(s, n, p4, cb, ud)
+        if p6 < 0:
+            e = -1
+            break
+        p7 = p6
+        while p7 < n:
+            while True:
+                p11 = _R26.match(s, p7)
+                p10 = p11.end() if p11 is not None else -1
+                p12 = p10 + 1 if p10 < n and s[p10] == ',' else -1
+                if p12 < 0:
+                    p8 = -1
+                    break
+                p14 = _R26.match(s, p12)
+                p13 = p14.end() if p14 is not None else -1
+                p8 = _r_dmarc_uri(s, n, p13, cb, ud)
+                break
+            if p8 < 0:
+                break
+            if p8 == p7:
+                break
+            p7 = p8
+        e = p7
+        break
+    f = cb[66]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_adkim(s, n, p, cb, ud):
+    while True:
+        p0 = p + 5 if s.startswith(_L38, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        e = p4 + 1 if p4 < n and s[p4] in _C39 else -1
+        break
+    f = cb[67]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_aspf(s, n, p, cb, ud):
+    while True:
+        p0 = p + 4 if s.startswith(_L40, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        e = p4 + 1 if p4 < n and s[p4] in _C39 else -1
+        break
+    f = cb[68]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_ainterval(s, n, p, cb, ud):
+    while True:
+        p0 = p + 2 if s.startswith(_L41, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = _R32.match(s, p4)
+        e = p6.end() if p6 is not None else -1
+        break
+    f = cb[69]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_fo(s, n, p, cb, ud):
+    while True:
+        p0 = p + 2 if s.startswith(_L42, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = p4 + 1 if p4 < n and s[p4] in _C43 else -1
+        if p6 < 0:
+            e = -1
+            break
+        p7 = p6
+        while p7 < n:
+            while True:
+                p11 = _R26.match(s, p7)
+                p10 = p11.end() if p11 is not None else -1
+                p12 = p10 + 1 if p10 < n and s[p10] == ':' else -1
+                if p12 < 0:
+                    p8 = -1
+                    break
+                p14 = _R26.match(s, p12)
+                p13 = p14.end() if p14 is not None else -1
+                p8 = p13 + 1 if p13 < n and s[p13] in _C43 else -1
+                break
+            if p8 < 0:
+                break
+            if p8 == p7:
+                break
+            p7 = p8
+        e = p7
+        break
+    f = cb[70]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_rfmt(s, n, p, cb, ud):
+    while True:
+        p0 = p + 2 if s.startswith(_L44, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        e = p4 + 4 if s.startswith(_L45, p4) else -1
+        break
+    f = cb[71]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_percent(s, n, p, cb, ud):
+    while True:
+        p0 = p + 3 if s.startswith(_L46, p) else -1
+        if p0 < 0:
+            e = -1
+            break
+        p2 = _R26.match(s, p0)
+        p1 = p2.end() if p2 is not None else -1
+        p3 = p1 + 1 if p1 < n and s[p1] == '=' else -1
+        if p3 < 0:
+            e = -1
+            break
+        p5 = _R26.match(s, p3)
+        p4 = p5.end() if p5 is not None else -1
+        p6 = _R47.match(s, p4)
+        e = p6.end() if p6 is not None else -1
+        break
+    f = cb[72]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dmarc_record(s, n, p, cb, ud):
+    while True:
+        p0 = _r_dmarc_version(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p2 = p0
+        while p2 < n:
+            while True:
+                p5 = _r_dmarc_sep(s, n, p2, cb, ud)
+                if p5 < 0:
+                    p3 = -1
+                    break
+                while True:
+                    p3 = _r_dmarc_request(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_srequest(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_auri(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_furi(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_aspf(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_adkim(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_aspf(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_ainterval(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_fo(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_percent(s, n, p5, cb, ud)
+                    if p3 >= 0:
+                        break
+                    p3 = _r_dmarc_rfmt(s, n, p5, cb, ud)
+                    break
+                break
+            if p3 < 0:
+                break
+            if p3 == p2:
+                break
+            p2 = p3
+        p1 = p2
+        p6 = p1
+        p8 = 0
+        while p6 < n:
+            p7 = _r_dmarc_sep(s, n, p6, cb, ud)
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        e = p6
+        break
+    f = cb[73]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+RULES = {
+    'alpha': (_r_alpha, 0),
+    'bit': (_r_bit, 1),
+    'char': (_r_char, 2),
+    'cr': (_r_cr, 3),
+    'crlf': (_r_crlf, 4),
+    'ctl': (_r_ctl, 5),
+    'digit': (_r_digit, 6),
+    'dquote': (_r_dquote, 7),
+    'hexdig': (_r_hexdig, 8),
+    'htab': (_r_htab, 9),
+    'lf': (_r_lf, 10),
+    'lwsp': (_r_lwsp, 11),
+    'octet': (_r_octet, 12),
+    'sp': (_r_sp, 13),
+    'vchar': (_r_vchar, 14),
+    'wsp': (_r_wsp, 15),
+    'uri': (_r_uri, 16),
+    'hier-part': (_r_hier_part, 17),
+    'uri-reference': (_r_uri_reference, 18),
+    'absolute-uri': (_r_absolute_uri, 19),
+    'relative-ref': (_r_relative_ref, 20),
+    'relative-part': (_r_relative_part, 21),
+    'scheme': (_r_scheme, 22),
+    'authority': (_r_authority, 23),
+    'userinfo': (_r_userinfo, 24),
+    'host': (_r_host, 25),
+    'port': (_r_port, 26),
+    'ip-literal': (_r_ip_literal, 27),
+    'ipvfuture': (_r_ipvfuture, 28),
+    'ipv6address': (_r_ipv6address, 29),
+    'h16': (_r_h16, 30),
+    'ls32': (_r_ls32, 31),
+    'ipv4address': (_r_ipv4address, 32),
+    'dec-octet': (_r_dec_octet, 33),
+    'reg-name': (_r_reg_name, 34),
+    'path': (_r_path, 35),
+    'path-abempty': (_r_path_abempty, 36),
+    'path-absolute': (_r_path_absolute, 37),
+    'path-noscheme': (_r_path_noscheme, 38),
+    'path-rootless': (_r_path_rootless, 39),
+    'path-empty': (_r_path_empty, 40),
+    'segment': (_r_segment, 41),
+    'segment-nz': (_r_segment_nz, 42),
+    'segment-nz-nc': (_r_segment_nz_nc, 43),
+    'pchar': (_r_pchar, 44),
+    'query': (_r_query, 45),
+    'fragment': (_r_fragment, 46),
+    'pct-encoded': (_r_pct_encoded, 47),
+    'unreserved': (_r_unreserved, 48),
+    'reserved': (_r_reserved, 49),
+    'gen-delims': (_r_gen_delims, 50),
+    'sub-delims': (_r_sub_delims, 51),
+    'tag-list': (_r_tag_list, 52),
+    'tag-spec': (_r_tag_spec, 53),
+    'tag-name': (_r_tag_name, 54),
+    'tag-value': (_r_tag_value, 55),
+    'tval': (_r_tval, 56),
+    'valchar': (_r_valchar, 57),
+    'alnumpunc': (_r_alnumpunc, 58),
+    'fwsdkim': (_r_fwsdkim, 59),
+    'dmarc-uri': (_r_dmarc_uri, 60),
+    'dmarc-version': (_r_dmarc_version, 61),
+    'dmarc-sep': (_r_dmarc_sep, 62),
+    'dmarc-request': (_r_dmarc_request, 63),
+    'dmarc-srequest': (_r_dmarc_srequest, 64),
+    'dmarc-auri': (_r_dmarc_auri, 65),
+    'dmarc-furi': (_r_dmarc_furi, 66),
+    'dmarc-adkim': (_r_dmarc_adkim, 67),
+    'dmarc-aspf': (_r_dmarc_aspf, 68),
+    'dmarc-ainterval': (_r_dmarc_ainterval, 69),
+    'dmarc-fo': (_r_dmarc_fo, 70),
+    'dmarc-rfmt': (_r_dmarc_rfmt, 71),
+    'dmarc-percent': (_r_dmarc_percent, 72),
+    'dmarc-record': (_r_dmarc_record, 73),
+}
+RULE_COUNT = 74
+# rules inlined as character classes, their matches cannot be reported
+INLINED_RULES = frozenset(('alnumpunc', 'alpha', 'bit', 'char', 'cr', 'ctl', 'digit', 'dquote', 'gen-delims', 'hexdig', 'htab', 'lf', 'octet', 'reserved', 'sp', 'sub-delims', 'unreserved', 'valchar', 'vchar', 'wsp'))
+NO_CALLBACKS = (None,) * RULE_COUNT
+
+
+def callback_table(callbacks):
+    """Table of `callbacks`, a mapping from rule names to functions called as
+    `callback(user_data, phrase_index, phrase_length)` for each non-empty match
+    of the rule, to be passed to `parse`."""
+    table = [None] * RULE_COUNT
+    for name, callback in callbacks.items():
+        lower = name.lower()
+        if lower not in RULES or lower in INLINED_RULES:
+            raise ValueError(f"no callback can be set on rule {name}")
+        table[RULES[lower][1]] = callback
+    return tuple(table)
+
+
+def parse(text, start_rule, callbacks=NO_CALLBACKS, user_data=None):
+    """Whether `start_rule` matches the whole of `text`, like the APG parser."""
+    rule = RULES.get(start_rule.lower())
+    if rule is None:
+        raise ValueError(f"start rule not a valid rule name {start_rule}")
+    n = len(text)
+    return rule[0](text, n, 0, callbacks, user_data) == n
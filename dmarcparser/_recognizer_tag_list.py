@@ -0,0 +1,480 @@
+# Generated by `python -m dmarcparser.grammars`, do not edit.
+"""Recognizer of the tag-list grammar, see dmarcparser.codegen."""
+
+import re
+
+DIGEST = 'fdc35fee46f40e80d4ee96223b5af10c0a2781b9114a7bd72e1cb333ec40337d'
+
+_C0 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_C1 = frozenset('01')
+_C2 = frozenset('\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~\x7f')
+_C3 = frozenset('\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x7f')
+_C4 = frozenset('0123456789')
+_C5 = frozenset('0123456789ABCDEFabcdef')
+_C6 = frozenset('\t ')
+_C7 = frozenset('\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~\x7f\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0¡¢£¤¥¦§¨©ª«¬\xad®¯°±²³´µ¶·¸¹º»¼½¾¿ÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖ×ØÙÚÛÜÝÞßàáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿ')
+_C8 = frozenset('!"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
+_R9 = re.compile('[\\u0009\\u0020]{0,}')
+_R10 = re.compile('[\\u0030-\\u0039\\u0041-\\u005a\\u005f\\u0061-\\u007a]{0,}')
+_R11 = re.compile('[\\u0021-\\u003a\\u003c-\\u007e]{1,}')
+_C12 = frozenset('!"#$%&\'()*+,-./0123456789:<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~')
+_C13 = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
+_R14 = re.compile('[\\u0009\\u0020]{1,}')
+
+
+def _r_alpha(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C0 else -1
+    f = cb[0]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_bit(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C1 else -1
+    f = cb[1]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_char(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C2 else -1
+    f = cb[2]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_cr(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\r' else -1
+    f = cb[3]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_crlf(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] == '\r' else -1
+        if p0 < 0:
+            e = -1
+            break
+        e = p0 + 1 if p0 < n and s[p0] == '\n' else -1
+        break
+    f = cb[4]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_ctl(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C3 else -1
+    f = cb[5]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_digit(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C4 else -1
+    f = cb[6]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_dquote(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '"' else -1
+    f = cb[7]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_hexdig(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C5 else -1
+    f = cb[8]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_htab(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\t' else -1
+    f = cb[9]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_lf(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == '\n' else -1
+    f = cb[10]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_lwsp(s, n, p, cb, ud):
+    p0 = p
+    while p0 < n:
+        while True:
+            p1 = p0 + 1 if p0 < n and s[p0] in _C6 else -1
+            if p1 >= 0:
+                break
+            while True:
+                p3 = _r_crlf(s, n, p0, cb, ud)
+                if p3 < 0:
+                    p1 = -1
+                    break
+                p1 = p3 + 1 if p3 < n and s[p3] in _C6 else -1
+                break
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            break
+        p0 = p1
+    e = p0
+    f = cb[11]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_octet(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C7 else -1
+    f = cb[12]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_sp(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] == ' ' else -1
+    f = cb[13]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_vchar(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C8 else -1
+    f = cb[14]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_wsp(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C6 else -1
+    f = cb[15]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_list(s, n, p, cb, ud):
+    while True:
+        p0 = _r_tag_spec(s, n, p, cb, ud)
+        if p0 < 0:
+            e = -1
+            break
+        p2 = p0
+        while p2 < n:
+            while True:
+                p5 = p2 + 1 if p2 < n and s[p2] == ';' else -1
+                if p5 < 0:
+                    p3 = -1
+                    break
+                p3 = _r_tag_spec(s, n, p5, cb, ud)
+                break
+            if p3 < 0:
+                break
+            if p3 == p2:
+                break
+            p2 = p3
+        p1 = p2
+        p6 = p1
+        p8 = 0
+        while p6 < n:
+            while True:
+                p9 = p6 + 1 if p6 < n and s[p6] == ';' else -1
+                if p9 < 0:
+                    p7 = -1
+                    break
+                p10 = _R9.match(s, p9)
+                p7 = p10.end() if p10 is not None else -1
+                break
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        e = p6
+        break
+    f = cb[16]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_spec(s, n, p, cb, ud):
+    while True:
+        p1 = p
+        p3 = 0
+        while p1 < n:
+            p2 = _r_fwsdkim(s, n, p1, cb, ud)
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        p0 = p1
+        p4 = _r_tag_name(s, n, p0, cb, ud)
+        if p4 < 0:
+            e = -1
+            break
+        p6 = p4
+        p8 = 0
+        while p6 < n:
+            p7 = _r_fwsdkim(s, n, p6, cb, ud)
+            if p7 < 0:
+                break
+            if p7 == p6:
+                p8 = 0
+                break
+            p6 = p7
+            p8 += 1
+            if p8 == 1:
+                break
+        p5 = p6
+        p9 = p5 + 1 if p5 < n and s[p5] == '=' else -1
+        if p9 < 0:
+            e = -1
+            break
+        p11 = p9
+        p13 = 0
+        while p11 < n:
+            p12 = _r_fwsdkim(s, n, p11, cb, ud)
+            if p12 < 0:
+                break
+            if p12 == p11:
+                p13 = 0
+                break
+            p11 = p12
+            p13 += 1
+            if p13 == 1:
+                break
+        p10 = p11
+        p14 = _r_tag_value(s, n, p10, cb, ud)
+        if p14 < 0:
+            e = -1
+            break
+        p15 = p14
+        p17 = 0
+        while p15 < n:
+            p16 = _r_fwsdkim(s, n, p15, cb, ud)
+            if p16 < 0:
+                break
+            if p16 == p15:
+                p17 = 0
+                break
+            p15 = p16
+            p17 += 1
+            if p17 == 1:
+                break
+        e = p15
+        break
+    f = cb[17]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_name(s, n, p, cb, ud):
+    while True:
+        p0 = p + 1 if p < n and s[p] in _C0 else -1
+        if p0 < 0:
+            e = -1
+            break
+        p1 = _R10.match(s, p0)
+        e = p1.end() if p1 is not None else -1
+        break
+    f = cb[18]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tag_value(s, n, p, cb, ud):
+    p0 = p
+    p2 = 0
+    while p0 < n:
+        while True:
+            p3 = _r_tval(s, n, p0, cb, ud)
+            if p3 < 0:
+                p1 = -1
+                break
+            p4 = p3
+            while p4 < n:
+                while True:
+                    p8 = p4
+                    p10 = 0
+                    while p8 < n:
+                        while True:
+                            p9 = p8 + 1 if p8 < n and s[p8] in _C6 else -1
+                            if p9 >= 0:
+                                break
+                            p9 = _r_fwsdkim(s, n, p8, cb, ud)
+                            break
+                        if p9 < 0:
+                            break
+                        if p9 == p8:
+                            p10 = 1
+                            break
+                        p8 = p9
+                        p10 += 1
+                    p7 = p8 if p10 >= 1 else -1
+                    if p7 < 0:
+                        p5 = -1
+                        break
+                    p5 = _r_tval(s, n, p7, cb, ud)
+                    break
+                if p5 < 0:
+                    break
+                if p5 == p4:
+                    break
+                p4 = p5
+            p1 = p4
+            break
+        if p1 < 0:
+            break
+        if p1 == p0:
+            p2 = 0
+            break
+        p0 = p1
+        p2 += 1
+        if p2 == 1:
+            break
+    e = p0
+    f = cb[19]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_tval(s, n, p, cb, ud):
+    p0 = _R11.match(s, p)
+    e = p0.end() if p0 is not None else -1
+    f = cb[20]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_valchar(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C12 else -1
+    f = cb[21]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_alnumpunc(s, n, p, cb, ud):
+    e = p + 1 if p < n and s[p] in _C13 else -1
+    f = cb[22]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+
+def _r_fwsdkim(s, n, p, cb, ud):
+    while True:
+        p1 = p
+        p3 = 0
+        while p1 < n:
+            while True:
+                p5 = _R9.match(s, p1)
+                p4 = p5.end() if p5 is not None else -1
+                p2 = _r_crlf(s, n, p4, cb, ud)
+                break
+            if p2 < 0:
+                break
+            if p2 == p1:
+                p3 = 0
+                break
+            p1 = p2
+            p3 += 1
+            if p3 == 1:
+                break
+        p0 = p1
+        p6 = _R14.match(s, p0)
+        e = p6.end() if p6 is not None else -1
+        break
+    f = cb[23]
+    if f is not None and e > p:
+        f(ud, p, e - p)
+    return e
+
+RULES = {
+    'alpha': (_r_alpha, 0),
+    'bit': (_r_bit, 1),
+    'char': (_r_char, 2),
+    'cr': (_r_cr, 3),
+    'crlf': (_r_crlf, 4),
+    'ctl': (_r_ctl, 5),
+    'digit': (_r_digit, 6),
+    'dquote': (_r_dquote, 7),
+    'hexdig': (_r_hexdig, 8),
+    'htab': (_r_htab, 9),
+    'lf': (_r_lf, 10),
+    'lwsp': (_r_lwsp, 11),
+    'octet': (_r_octet, 12),
+    'sp': (_r_sp, 13),
+    'vchar': (_r_vchar, 14),
+    'wsp': (_r_wsp, 15),
+    'tag-list': (_r_tag_list, 16),
+    'tag-spec': (_r_tag_spec, 17),
+    'tag-name': (_r_tag_name, 18),
+    'tag-value': (_r_tag_value, 19),
+    'tval': (_r_tval, 20),
+    'valchar': (_r_valchar, 21),
+    'alnumpunc': (_r_alnumpunc, 22),
+    'fwsdkim': (_r_fwsdkim, 23),
+}
+RULE_COUNT = 24
+# rules inlined as character classes, their matches cannot be reported
+INLINED_RULES = frozenset(('alnumpunc', 'alpha', 'bit', 'char', 'cr', 'ctl', 'digit', 'dquote', 'hexdig', 'htab', 'lf', 'octet', 'sp', 'valchar', 'vchar', 'wsp'))
+NO_CALLBACKS = (None,) * RULE_COUNT
+
+
+def callback_table(callbacks):
+    """Table of `callbacks`, a mapping from rule names to functions called as
+    `callback(user_data, phrase_index, phrase_length)` for each non-empty match
+    of the rule, to be passed to `parse`."""
+    table = [None] * RULE_COUNT
+    for name, callback in callbacks.items():
+        lower = name.lower()
+        if lower not in RULES or lower in INLINED_RULES:
+            raise ValueError(f"no callback can be set on rule {name}")
+        table[RULES[lower][1]] = callback
+    return tuple(table)
+
+
+def parse(text, start_rule, callbacks=NO_CALLBACKS, user_data=None):
+    """Whether `start_rule` matches the whole of `text`, like the APG parser."""
+    rule = RULES.get(start_rule.lower())
+    if rule is None:
+        raise ValueError(f"start rule not a valid rule name {start_rule}")
+    n = len(text)
+    return rule[0](text, n, 0, callbacks, user_data) == n
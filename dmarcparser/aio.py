@@ -0,0 +1,241 @@
+import asyncio
+from collections import deque
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+
+from dmarcparser.parser import (
+    DmarcException,
+    DmarcObject,
+    DmarcParser,
+    _init_worker_parser,
+    _parse_chunk,
+)
+
+TOutcome = Union[DmarcObject, DmarcException]
+
+
+class AsyncDmarcParser:
+    """Parse DMARC records from asyncio code without blocking the event loop.
+
+    Records passed to `parse` are queued, grouped in batches of up to
+    `batch_size` records (waiting at most `batch_delay` seconds to fill a batch)
+    and each batch is parsed by one executor call. At most `max_pending` records
+    wait in the queue, further calls to `parse` are suspended until there is room.
+
+    The queue and the batching task belong to the event loop of the last call,
+    an instance can be reused by successive `asyncio.run` calls but not by two
+    loops at once.
+    """
+
+    def __init__(
+        self,
+        executor: Union[str, Executor] = "thread",
+        workers: int = 1,
+        batch_size: int = 32,
+        batch_delay: float = 0.001,
+        max_pending: int = 1024,
+        **parser_options,
+    ):
+        """
+        :param executor: "thread", "process", or an existing executor. The
+            executors created for "thread"/"process" have `workers` workers and
+            are shut down by `aclose`.
+        :param workers: also the number of batches submitted concurrently.
+        :param parser_options: passed to the DmarcParser of each worker. Not
+            supported with an existing ProcessPoolExecutor, whose workers parse
+            with a default DmarcParser (ValueError).
+        """
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self._owns_executor = isinstance(executor, str)
+        if executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=workers)
+        elif executor == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_parser,
+                initargs=(parser_options,),
+            )
+        elif isinstance(executor, str):
+            raise ValueError(f"unknown executor {executor}")
+        elif isinstance(executor, ProcessPoolExecutor) and parser_options:
+            # its workers were started without _init_worker_parser(parser_options)
+            raise ValueError(
+                "parser_options cannot be applied to an existing process pool"
+            )
+        self._executor = executor
+        self._in_process = not isinstance(executor, ProcessPoolExecutor)
+        if self._in_process:
+            # the parser is shared by the executor threads
+            self._parser = DmarcParser(**parser_options)
+        self._max_batches = workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._batch_tasks = set()
+
+    async def __aenter__(self) -> "AsyncDmarcParser":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Cancel the records not parsed yet and shut down an owned executor."""
+        self._bind_loop()
+        if self._batcher is not None:
+            # cancels the records of the batch being filled
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+            # callers still waiting for room in the queue see it replaced
+            self._queue = None
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def parse(self, record: str, follow_downgrade: bool = True) -> DmarcObject:
+        outcome = await self.parse_outcome(record, follow_downgrade)
+        if isinstance(outcome, DmarcException):
+            raise outcome
+        return outcome
+
+    async def parse_outcome(
+        self, record: str, follow_downgrade: bool = True
+    ) -> TOutcome:
+        """Same as `parse`, but returns the DmarcException instead of raising it."""
+        self._bind_loop()
+        if self._batcher is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._batcher = asyncio.ensure_future(self._run_batcher())
+        queue = self._queue
+        future = self._loop.create_future()
+        await queue.put((record, follow_downgrade, future))
+        if self._queue is not queue:
+            # closed while waiting for room in the queue
+            future.cancel()
+        return await future
+
+    async def parse_many(
+        self,
+        records: Union[Iterable[str], AsyncIterable[str]],
+        follow_downgrade: bool = True,
+    ) -> AsyncIterator[TOutcome]:
+        """Yield the outcome of each record, in input order.
+
+        At most `max_pending` records are read ahead of the outcomes.
+        """
+        pending = deque()
+        async for record in _as_async_iterable(records):
+            pending.append(
+                asyncio.ensure_future(self.parse_outcome(record, follow_downgrade))
+            )
+            if len(pending) >= self.max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # the tasks of the previous loop were cancelled when it ended
+            self._loop = loop
+            self._queue = None
+            self._batcher = None
+            self._batch_tasks = set()
+
+    async def _run_batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self._max_batches)
+        batch = []
+        try:
+            while True:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.batch_delay
+                while len(batch) < self.batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await slots.acquire()
+                task = asyncio.ensure_future(self._parse_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+                task.add_done_callback(lambda _: slots.release())
+                batch = []
+        finally:
+            _cancel(batch)
+
+    async def _parse_batch(self, batch: list) -> None:
+        loop = asyncio.get_running_loop()
+        groups = {}
+        for item in batch:
+            groups.setdefault(bool(item[1]), []).append(item)
+        try:
+            for follow_downgrade, items in groups.items():
+                records = [record for record, _, _ in items]
+                try:
+                    if self._in_process:
+                        outcomes = await loop.run_in_executor(
+                            self._executor,
+                            self._parse_records,
+                            records,
+                            follow_downgrade,
+                        )
+                    else:
+                        outcomes = await loop.run_in_executor(
+                            self._executor, _parse_chunk, records, follow_downgrade
+                        )
+                except (BrokenExecutor, RuntimeError) as e:
+                    # the pool died or was shut down: the callers get the error
+                    for _, _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, _, future), outcome in zip(items, outcomes):
+                    if not future.done():
+                        future.set_result(outcome)
+        finally:
+            # cancelled, or an unexpected error left to the task
+            _cancel(batch)
+
+    def _parse_records(
+        self, records: List[str], follow_downgrade: bool
+    ) -> List[TOutcome]:
+        return [
+            self._parser.parse_outcome(record, follow_downgrade) for record in records
+        ]
+
+
+def _cancel(batch: list) -> None:
+    """Cancel the futures of a batch which have no outcome."""
+    for _, _, future in batch:
+        future.cancel()
+
+
+async def _as_async_iterable(records: Union[Iterable[str], AsyncIterable[str]]):
+    if hasattr(records, "__aiter__"):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
@@ -0,0 +1,178 @@
+"""Bulk validation of DMARC records from the command line.
+
+Reads one record per line, either the record alone or `domain<TAB>record`, and
+writes one JSON object per line with the parsed tag values or the error.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import ContextManager, Iterable, Iterator, Optional, TextIO, Tuple, Union
+
+from dmarcparser.parser import (
+    VALID_DMARC_TAGS,
+    DmarcException,
+    DmarcObject,
+    DmarcParser,
+)
+from dmarcparser.tags import RUTag
+
+
+def read_records(lines: Iterable[str]) -> Iterator[Tuple[Optional[str], str]]:
+    """Yield `(domain, record)` pairs, domain is None for lines without one.
+
+    The text before the first tab is taken as the domain if it cannot be part of
+    a tag-spec, i.e. it contains no "=". Empty lines are skipped.
+    """
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.endswith("\r"):
+            line = line[:-1]
+        if not line:
+            continue
+        domain, sep, record = line.partition("\t")
+        if sep and "=" not in domain:
+            yield domain, record
+        else:
+            yield None, line
+
+
+def tag_to_json(tag):
+    if isinstance(tag, RUTag):
+        return {
+            "valid": [{"email": e.email, "limit": e.limit} for e in tag.valid],
+            "other": tag.other,
+        }
+    return tag.effective_value
+
+
+def outcome_to_json(
+    domain: Optional[str], record: str, outcome: Union[DmarcObject, DmarcException]
+) -> dict:
+    result = {}
+    if domain is not None:
+        result["domain"] = domain
+    result["record"] = record
+    if isinstance(outcome, DmarcException):
+        result["valid"] = False
+        result["error"] = {"code": outcome.code, "message": outcome.value}
+        return result
+    result["valid"] = True
+    result["tags"] = {
+        tag_name: tag_to_json(outcome[tag_name]) for tag_name in VALID_DMARC_TAGS
+    }
+    result["p_downgraded"] = outcome.p.downgraded
+    result["ignored_tags"] = outcome.ignored_tags
+    return result
+
+
+def validate(
+    parser: DmarcParser,
+    pairs: Iterable[Tuple[Optional[str], str]],
+    follow_downgrade: bool = True,
+    workers: int = 1,
+    chunksize: int = 64,
+) -> Iterator[dict]:
+    # records are handed to parse_many while their domains wait here, outcomes
+    # come back in order so the queue only holds the records in flight
+    domains = deque()
+
+    def records():
+        for domain, record in pairs:
+            domains.append((domain, record))
+            yield record
+
+    outcomes = parser.parse_many(
+        records(), follow_downgrade, workers=workers, chunksize=chunksize
+    )
+    for outcome in outcomes:
+        domain, record = domains.popleft()
+        yield outcome_to_json(domain, record, outcome)
+
+
+@contextlib.contextmanager
+def _open_input(path: str) -> Iterator[TextIO]:
+    if path != "-":
+        with open(path, encoding="utf-8", errors="surrogateescape") as input_file:
+            yield input_file
+        return
+    input_file = io.TextIOWrapper(
+        sys.stdin.buffer, encoding="utf-8", errors="surrogateescape"
+    )
+    try:
+        yield input_file
+    finally:
+        # leaves sys.stdin open
+        input_file.detach()
+
+
+def _open_output(path: str) -> ContextManager[TextIO]:
+    if path == "-":
+        return contextlib.nullcontext(sys.stdout)
+    return open(path, "w")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog="dmarcparser", description=__doc__)
+    arg_parser.add_argument(
+        "input", nargs="?", default="-", help="input file, stdin if omitted or -"
+    )
+    arg_parser.add_argument(
+        "-o", "--output", default="-", help="output file, stdout if omitted or -"
+    )
+    arg_parser.add_argument("-w", "--workers", type=int, default=1)
+    arg_parser.add_argument("--chunksize", type=int, default=64)
+    arg_parser.add_argument(
+        "--no-downgrade",
+        action="store_true",
+        help="do not downgrade p to none for invalid or missing p with a rua tag",
+    )
+    arg_parser.add_argument("--cache-size", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    parser = DmarcParser(cache_size=args.cache_size)
+    count = 0
+    valid = 0
+    start = time.perf_counter()
+    try:
+        with _open_input(args.input) as input_file, _open_output(
+            args.output
+        ) as output_file:
+            results = validate(
+                parser,
+                read_records(input_file),
+                follow_downgrade=not args.no_downgrade,
+                workers=args.workers,
+                chunksize=args.chunksize,
+            )
+            for result in results:
+                output_file.write(json.dumps(result) + "\n")
+                count += 1
+                valid += result["valid"]
+            output_file.flush()
+    except BrokenPipeError:
+        # the reader of the output went away (`| head`): stop quietly, and keep
+        # the interpreter from failing again when it flushes stdout at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except OSError as e:
+        print(f"dmarcparser: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{count} records ({valid} valid, {count - valid} invalid) "
+        f"in {elapsed:.2f}s, {rate:.0f} records/s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""Compile the APG grammars into dedicated Python recognizers.
+
+The APG parser interprets the opcode tables of a grammar for every character of
+the input. `generate_recognizer` translates the same opcodes into one Python
+function per rule, with the PEG semantics of APG: ordered alternatives, greedy
+repetitions that never give back what they matched, a repetition stopping on an
+empty match. Rules and repetitions reducing to a single character class are
+turned into set lookups and regular expressions, exact since such a repetition
+cannot backtrack either.
+
+The recognizers are generated along with the grammar tables, shipped in
+`dmarcparser/_recognizer_*.py`, by running `python -m dmarcparser.grammars`.
+"""
+
+import itertools
+import os
+import types
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from apg_py.api.api import Grammar
+from apg_py.lib import identifiers as apg_id
+
+from dmarcparser.grammars import (
+    GrammarType,
+    generate_parser,
+    grammar_digest,
+    grammar_source,
+    load_grammar,
+)
+
+RECOGNIZER_MODULES = {
+    GrammarType.DKIM_TAG_LIST_ABNF: "_recognizer_tag_list",
+    GrammarType.DMARC_ABNF: "_recognizer_dmarc",
+}
+
+# character classes above this size are tested with comparisons, not a set
+MAX_SET_SIZE = 256
+# a case-insensitive literal is matched against all its case variants with
+# str.startswith up to this number of variants, with a regular expression above
+MAX_LITERAL_VARIANTS = 64
+
+TRanges = List[Tuple[int, int]]
+
+HEADER = '''\
+# Generated by `python -m dmarcparser.grammars`, do not edit.
+"""Recognizer of the {name} grammar, see dmarcparser.codegen."""
+
+import re
+
+DIGEST = {digest!r}
+
+'''
+
+FOOTER = '''
+RULES = {{
+{rules}
+}}
+RULE_COUNT = {rule_count}
+# rules inlined as character classes, their matches cannot be reported
+INLINED_RULES = frozenset({inlined!r})
+NO_CALLBACKS = (None,) * RULE_COUNT
+
+
+def callback_table(callbacks):
+    """Table of `callbacks`, a mapping from rule names to functions called as
+    `callback(user_data, phrase_index, phrase_length)` for each non-empty match
+    of the rule, to be passed to `parse`."""
+    table = [None] * RULE_COUNT
+    for name, callback in callbacks.items():
+        lower = name.lower()
+        if lower not in RULES or lower in INLINED_RULES:
+            raise ValueError(f"no callback can be set on rule {{name}}")
+        table[RULES[lower][1]] = callback
+    return tuple(table)
+
+
+def parse(text, start_rule, callbacks=NO_CALLBACKS, user_data=None):
+    """Whether `start_rule` matches the whole of `text`, like the APG parser."""
+    rule = RULES.get(start_rule.lower())
+    if rule is None:
+        raise ValueError(f"start rule not a valid rule name {{start_rule}}")
+    n = len(text)
+    return rule[0](text, n, 0, callbacks, user_data) == n
+'''
+
+
+def _merge(ranges: TRanges) -> TRanges:
+    merged: TRanges = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+def _literal_chars(code: int) -> List[int]:
+    """Input characters matching `code` in a case-insensitive literal: APG lowers
+    the input letters A-Z before comparing."""
+    if 97 <= code <= 122:
+        return [code, code - 32]
+    if 65 <= code <= 90:
+        return []
+    return [code]
+
+
+def _regex_char(code: int) -> str:
+    return f"\\u{code:04x}" if code < 0x10000 else f"\\U{code:08x}"
+
+
+def _regex_class(ranges: TRanges) -> str:
+    parts = []
+    for low, high in ranges:
+        parts.append(
+            _regex_char(low)
+            if low == high
+            else f"{_regex_char(low)}-{_regex_char(high)}"
+        )
+    return "[" + "".join(parts) + "]"
+
+
+class _RecognizerGenerator:
+    def __init__(self, grammar: Grammar):
+        self.rules = grammar.rules
+        self.constants: List[str] = []
+        self._constant_names: Dict[str, str] = {}
+        self._rule_classes: Dict[int, Optional[TRanges]] = {}
+        self._lines: List[str] = []
+        self._variables = itertools.count()
+
+    @staticmethod
+    def function_name(rule: dict) -> str:
+        return "_r_" + rule["lower"].replace("-", "_")
+
+    def constant(self, prefix: str, source: str) -> str:
+        """Name of a module constant holding `source`, defined once."""
+        name = self._constant_names.get(source)
+        if name is None:
+            name = self._constant_names[source] = f"{prefix}{len(self.constants)}"
+            self.constants.append(f"{name} = {source}")
+        return name
+
+    def rule_class(self, rule_index: int) -> Optional[TRanges]:
+        """Characters matched by the rule if it always matches exactly one."""
+        if rule_index not in self._rule_classes:
+            # None while computed, a recursive rule is not a character class
+            self._rule_classes[rule_index] = None
+            self._rule_classes[rule_index] = self.op_class(
+                self.rules[rule_index]["opcodes"], 0
+            )
+        return self._rule_classes[rule_index]
+
+    def op_class(self, ops: Sequence[dict], index: int) -> Optional[TRanges]:
+        op = ops[index]
+        op_type = op["type"]
+        if op_type == apg_id.TRG:
+            return [(op["min"], op["max"])]
+        if op_type == apg_id.TBS and len(op["string"]) == 1:
+            return [(op["string"][0], op["string"][0])]
+        if op_type == apg_id.TLS and len(op["string"]) == 1:
+            chars = _literal_chars(op["string"][0])
+            return _merge([(char, char) for char in chars]) if chars else None
+        if op_type == apg_id.RNM:
+            return self.rule_class(op["index"])
+        if op_type == apg_id.ALT:
+            ranges: TRanges = []
+            for child in op["children"]:
+                child_ranges = self.op_class(ops, child)
+                if child_ranges is None:
+                    return None
+                ranges.extend(child_ranges)
+            return _merge(ranges)
+        return None
+
+    def can_fail(self, ops: Sequence[dict], index: int) -> bool:
+        op = ops[index]
+        if op["type"] == apg_id.REP:
+            return op["min"] > 0
+        if op["type"] == apg_id.TLS:
+            return len(op["string"]) > 0
+        return True
+
+    def class_test(self, ranges: TRanges, char: str) -> str:
+        size = sum(high - low + 1 for low, high in ranges)
+        if size == 1:
+            return f"{char} == {chr(ranges[0][0])!r}"
+        if size <= MAX_SET_SIZE:
+            chars = "".join(
+                chr(code) for low, high in ranges for code in range(low, high + 1)
+            )
+            return f"{char} in {self.constant('_C', f'frozenset({chars!r})')}"
+        tests = []
+        for low, high in ranges:
+            if low == high:
+                tests.append(f"{char} == {chr(low)!r}")
+            else:
+                tests.append(f"{chr(low)!r} <= {char} <= {chr(high)!r}")
+        return "(" + " or ".join(tests) + ")"
+
+    def variable(self) -> str:
+        return f"p{next(self._variables)}"
+
+    def line(self, depth: int, code: str) -> None:
+        self._lines.append("    " * depth + code)
+
+    def emit(self, ops: Sequence[dict], index: int, src: str, dst: str, depth: int):
+        """Code setting `dst` to the end of the match of ops[index] starting at
+        `src`, or -1."""
+        op = ops[index]
+        op_type = op["type"]
+        ranges = self.op_class(ops, index)
+        if ranges is not None:
+            test = self.class_test(ranges, f"s[{src}]")
+            self.line(depth, f"{dst} = {src} + 1 if {src} < n and {test} else -1")
+        elif op_type == apg_id.RNM:
+            rule = self.rules[op["index"]]
+            self.line(depth, f"{dst} = {self.function_name(rule)}(s, n, {src}, cb, ud)")
+        elif op_type == apg_id.TBS:
+            literal = "".join(chr(code) for code in op["string"])
+            length = len(literal)
+            self.line(
+                depth,
+                f"{dst} = {src} + {length} if s.startswith({literal!r}, {src}) else -1",
+            )
+        elif op_type == apg_id.TLS:
+            self.emit_literal(op["string"], src, dst, depth)
+        elif op_type == apg_id.REP:
+            self.emit_repetition(ops, index, src, dst, depth)
+        elif op_type == apg_id.ALT:
+            self.line(depth, "while True:")
+            children = op["children"]
+            for child in children[:-1]:
+                self.emit(ops, child, src, dst, depth + 1)
+                self.line(depth + 1, f"if {dst} >= 0:")
+                self.line(depth + 2, "break")
+            self.emit(ops, children[-1], src, dst, depth + 1)
+            self.line(depth + 1, "break")
+        elif op_type == apg_id.CAT:
+            self.line(depth, "while True:")
+            children = op["children"]
+            current = src
+            for child in children[:-1]:
+                end = self.variable()
+                self.emit(ops, child, current, end, depth + 1)
+                if self.can_fail(ops, child):
+                    self.line(depth + 1, f"if {end} < 0:")
+                    self.line(depth + 2, f"{dst} = -1")
+                    self.line(depth + 2, "break")
+                current = end
+            self.emit(ops, children[-1], current, dst, depth + 1)
+            self.line(depth + 1, "break")
+        else:
+            raise ValueError(f"APG opcode {op_type} is not supported")
+
+    def emit_literal(self, string: Sequence[int], src: str, dst: str, depth: int):
+        if len(string) == 0:
+            self.line(depth, f"{dst} = {src}")
+            return
+        choices = [_literal_chars(code) for code in string]
+        if not all(choices):
+            self.line(depth, f"{dst} = -1")
+            return
+        count = 1
+        for chars in choices:
+            count *= len(chars)
+        if count <= MAX_LITERAL_VARIANTS:
+            variants = tuple(
+                "".join(chr(code) for code in variant)
+                for variant in itertools.product(*choices)
+            )
+            variants_name = self.constant("_L", repr(variants))
+            self.line(
+                depth,
+                f"{dst} = {src} + {len(string)} "
+                f"if s.startswith({variants_name}, {src}) else -1",
+            )
+            return
+        pattern = "".join(
+            _regex_class(_merge([(code, code) for code in chars])) for chars in choices
+        )
+        regex_name = self.constant("_R", f"re.compile({pattern!r})")
+        self.line(
+            depth,
+            f"{dst} = {src} + {len(string)} "
+            f"if {regex_name}.match(s, {src}) is not None else -1",
+        )
+
+    def emit_repetition(
+        self, ops: Sequence[dict], index: int, src: str, dst: str, depth: int
+    ):
+        op = ops[index]
+        minimum = op["min"]
+        maximum = op["max"]
+        bounded = maximum != apg_id.MAX_INT
+        child_ranges = self.op_class(ops, index + 1)
+        if child_ranges is not None:
+            # the greedy match of the regex is the match of the repetition
+            quantifier = f"{{{minimum},{maximum if bounded else ''}}}"
+            pattern = _regex_class(child_ranges) + quantifier
+            regex_name = self.constant("_R", f"re.compile({pattern!r})")
+            match = self.variable()
+            self.line(depth, f"{match} = {regex_name}.match(s, {src})")
+            self.line(depth, f"{dst} = {match}.end() if {match} is not None else -1")
+            return
+        position = self.variable()
+        end = self.variable()
+        counted = minimum > 0 or bounded
+        count = self.variable()
+        self.line(depth, f"{position} = {src}")
+        if counted:
+            self.line(depth, f"{count} = 0")
+        self.line(depth, f"while {position} < n:")
+        self.emit(ops, index + 1, position, end, depth + 1)
+        self.line(depth + 1, f"if {end} < 0:")
+        self.line(depth + 2, "break")
+        self.line(depth + 1, f"if {end} == {position}:")
+        if counted:
+            # a repetition always succeeds on an empty match
+            self.line(depth + 2, f"{count} = {minimum}")
+        self.line(depth + 2, "break")
+        self.line(depth + 1, f"{position} = {end}")
+        if counted:
+            self.line(depth + 1, f"{count} += 1")
+        if bounded:
+            self.line(depth + 1, f"if {count} == {maximum}:")
+            self.line(depth + 2, "break")
+        if minimum > 0:
+            self.line(depth, f"{dst} = {position} if {count} >= {minimum} else -1")
+        else:
+            self.line(depth, f"{dst} = {position}")
+
+    def emit_rule(self, rule: dict) -> List[str]:
+        self._lines = []
+        self._variables = itertools.count()
+        self.line(0, f"def {self.function_name(rule)}(s, n, p, cb, ud):")
+        self.emit(rule["opcodes"], 0, "p", "e", 1)
+        self.line(1, f"f = cb[{rule['index']}]")
+        self.line(1, "if f is not None and e > p:")
+        self.line(2, "f(ud, p, e - p)")
+        self.line(1, "return e")
+        return self._lines
+
+    def generate(self, name: str, digest: str) -> str:
+        functions = []
+        for rule in self.rules:
+            functions.append("\n".join(self.emit_rule(rule)) + "\n")
+        inlined = sorted(
+            rule["lower"]
+            for rule in self.rules
+            if self.rule_class(rule["index"]) is not None
+        )
+        rules = "\n".join(
+            f"    {rule['lower']!r}: ({self.function_name(rule)}, {rule['index']}),"
+            for rule in self.rules
+        )
+        return (
+            HEADER.format(name=name, digest=digest)
+            + "\n".join(self.constants)
+            + "\n\n\n"
+            + "\n\n".join(functions)
+            + FOOTER.format(
+                rules=rules, rule_count=len(self.rules), inlined=tuple(inlined)
+            )
+        )
+
+
+def generate_recognizer(grammar: Grammar, name: str, digest: str) -> str:
+    """Source of the recognizer module of `grammar`.
+
+    The module has a `parse(text, start_rule, callbacks, user_data)` function
+    matching `text` as the APG parser does, and `callback_table` to build its
+    callbacks.
+    """
+    return _RecognizerGenerator(grammar).generate(name, digest)
+
+
+def write_recognizers(directory: str = os.path.dirname(__file__)):
+    for grammar_type, module_name in RECOGNIZER_MODULES.items():
+        abnf_str = grammar_source(grammar_type)
+        source = generate_recognizer(
+            generate_parser(abnf_str), grammar_type.value, grammar_digest(abnf_str)
+        )
+        with open(os.path.join(directory, f"{module_name}.py"), "w") as f:
+            f.write(source)
+
+
+@lru_cache
+def load_recognizer(grammar_type: GrammarType) -> types.ModuleType:
+    """Recognizer module of a grammar, compiled at runtime if the shipped one is
+    missing or outdated."""
+    abnf_str = grammar_source(grammar_type)
+    digest = grammar_digest(abnf_str)
+    module_name = RECOGNIZER_MODULES[grammar_type]
+    try:
+        module = __import__(f"dmarcparser.{module_name}", fromlist=["DIGEST"])
+    except ImportError:
+        module = None
+    if module is not None and module.DIGEST == digest:
+        return module
+    source = generate_recognizer(load_grammar(grammar_type), grammar_type.value, digest)
+    module = types.ModuleType(f"dmarcparser.{module_name}")
+    exec(compile(source, f"<{module_name}>", "exec"), module.__dict__)
+    return module
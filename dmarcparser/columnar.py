@@ -0,0 +1,163 @@
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# categorical columns hold the index of the effective value in their category,
+# 0 standing for an invalid record (or an unexpected value)
+CATEGORIES: Dict[str, Sequence[str]] = {
+    "p": ("", "none", "quarantine", "reject"),
+    "sp": ("", "none", "quarantine", "reject"),
+    "adkim": ("", "r", "s"),
+    "aspf": ("", "r", "s"),
+}
+# the fo column is a bit mask, FO_FLAGS[i] being bit i
+FO_FLAGS: Sequence[str] = ("0", "1", "d", "s")
+URI_TAGS = ("rua", "ruf")
+
+INT64_MAX = 2**63 - 1
+
+# typecodes of the array module, also understood as numpy dtypes
+COLUMN_TYPES = {
+    "error": "B",
+    "p_downgraded": "B",
+    **{name: "B" for name in CATEGORIES},
+    "pct": "b",
+    "ri": "q",
+    "fo": "B",
+    **{f"{tag}_count": "I" for tag in URI_TAGS},
+    **{f"{tag}_offsets": "q" for tag in URI_TAGS},
+    **{f"{tag}_limit": "q" for tag in URI_TAGS},
+}
+
+TColumn = Union[array, list, "numpy.ndarray"]
+
+
+class DmarcColumns:
+    """Parse outcomes of a batch of records, one column per field.
+
+    Row i of each column describes records[i]:
+
+    - `error`: error code of an invalid record, 0 for a valid one. The other
+      columns of an invalid record hold 0 (or -1 for `pct` and `ri`).
+    - `p_downgraded`: whether p was downgraded to none.
+    - `p`, `sp`, `adkim`, `aspf`: index of the effective value in CATEGORIES.
+    - `pct`, `ri`: effective values, `ri` saturated to the int64 range.
+    - `fo`: bit mask of the effective fo options, see FO_FLAGS.
+    - `rua_count`, `ruf_count`: number of valid mailto addresses.
+    - `rua_offsets`, `ruf_offsets`: the addresses of row i are
+      `rua_address[rua_offsets[i]:rua_offsets[i + 1]]`, with their size limit
+      (-1 if none) in `rua_limit` at the same positions.
+
+    Columns are NumPy arrays when NumPy is installed (`rua_address` and
+    `ruf_address` then have an object dtype), `array.array` buffers and lists of
+    strings otherwise.
+    """
+
+    def __init__(self, columns: Dict[str, TColumn]):
+        self.columns = columns
+
+    def __getitem__(self, name: str) -> TColumn:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns["error"])
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def decode(self, name: str) -> List[str]:
+        """Values of a categorical column, "" for invalid records."""
+        category = CATEGORIES[name]
+        return [category[code] for code in self.columns[name]]
+
+    def distribution(self, name: str) -> Dict[str, int]:
+        """Number of valid records for each value of a categorical column."""
+        category = CATEGORIES[name]
+        column = self.columns[name]
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            counts = numpy.bincount(column, minlength=len(category)).tolist()
+        else:
+            counter = Counter(column)
+            counts = [counter[code] for code in range(len(category))]
+        return {value: count for value, count in zip(category[1:], counts[1:])}
+
+
+class ColumnBuilder:
+    """Appends parse outcomes to growing column buffers, see DmarcColumns."""
+
+    def __init__(self):
+        self._columns = {name: array(code) for name, code in COLUMN_TYPES.items()}
+        self._addresses: Dict[str, List[str]] = {tag: [] for tag in URI_TAGS}
+        for tag in URI_TAGS:
+            self._columns[f"{tag}_offsets"].append(0)
+        self._codes = {
+            name: {value: code for code, value in enumerate(category) if code}
+            for name, category in CATEGORIES.items()
+        }
+        self._fo_bits = {flag: 1 << bit for bit, flag in enumerate(FO_FLAGS)}
+
+    def add_error(self, code: int) -> None:
+        columns = self._columns
+        columns["error"].append(code)
+        columns["p_downgraded"].append(0)
+        for name in CATEGORIES:
+            columns[name].append(0)
+        columns["pct"].append(-1)
+        columns["ri"].append(-1)
+        columns["fo"].append(0)
+        for tag in URI_TAGS:
+            columns[f"{tag}_count"].append(0)
+            columns[f"{tag}_offsets"].append(len(self._addresses[tag]))
+
+    def add_result(self, result) -> None:
+        """Append a DmarcObject or DmarcResult."""
+        columns = self._columns
+        columns["error"].append(0)
+        columns["p_downgraded"].append(1 if result.p.downgraded else 0)
+        for name, codes in self._codes.items():
+            columns[name].append(codes.get(result[name].effective_value, 0))
+        columns["pct"].append(result.pct.effective_value)
+        columns["ri"].append(min(result.ri.effective_value, INT64_MAX))
+        fo = 0
+        for flag in result.fo.effective_value:
+            fo |= self._fo_bits.get(flag, 0)
+        columns["fo"].append(fo)
+        for tag in URI_TAGS:
+            addresses = self._addresses[tag]
+            limits = columns[f"{tag}_limit"]
+            valid = result[tag].valid
+            for email_obj in valid:
+                addresses.append(email_obj.email)
+                limit = email_obj.limit
+                limits.append(-1 if limit is None else min(limit, INT64_MAX))
+            columns[f"{tag}_count"].append(len(valid))
+            columns[f"{tag}_offsets"].append(len(addresses))
+
+    def build(self, use_numpy: Optional[bool] = None) -> DmarcColumns:
+        """Columns of the outcomes added so far.
+
+        NumPy arrays share the memory of the buffers, the builder must not be
+        used afterwards. `use_numpy` defaults to whether NumPy is installed.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        if use_numpy and numpy is None:
+            raise ImportError("numpy is not installed")
+        columns: Dict[str, TColumn] = dict(self._columns)
+        for tag in URI_TAGS:
+            columns[f"{tag}_address"] = self._addresses[tag]
+        if use_numpy:
+            for name, column in columns.items():
+                if isinstance(column, array):
+                    columns[name] = numpy.frombuffer(column, dtype=column.typecode)
+                else:
+                    addresses = numpy.empty(len(column), dtype=object)
+                    addresses[:] = column
+                    columns[name] = addresses
+            columns["p_downgraded"] = columns["p_downgraded"].view(bool)
+        return DmarcColumns(columns)
@@ -0,0 +1,584 @@
+"""DMARC policy discovery, RFC 7489 6.6.3, from asyncio code.
+
+`DmarcDiscovery` queries the TXT records of `_dmarc.<domain>` with a pluggable
+`Resolver`, falls back to the organizational domain when the domain has no DMARC
+record, and parses the record found with a DmarcParser. Lookups run concurrently
+up to a limit, the same name is looked up once at a time, and the parsed records
+and empty answers (NXDOMAIN included) are cached for their TTL.
+"""
+
+import asyncio
+import re
+import time
+from collections import Counter, deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from dmarcparser.aio import _as_async_iterable
+from dmarcparser.cache import MISSING, CacheInfo, LRUCache
+from dmarcparser.parser import (
+    DmarcException,
+    DmarcParser,
+    TDmarcResult,
+    TRecord,
+    select_dmarc_record,
+)
+
+TOutcome = Union[TDmarcResult, DmarcException]
+# a TXT record, as a string or as the sequence of its character-strings
+TTxt = Union[TRecord, Sequence[TRecord]]
+T = TypeVar("T")
+
+STATUS_POLICY = "policy"
+STATUS_INVALID = "invalid"
+STATUS_NONE = "none"
+STATUS_TEMPERROR = "temperror"
+
+
+class ResolverError(Exception):
+    """Transient failure of a lookup (timeout, SERVFAIL...), never cached."""
+
+
+class TxtAnswer(NamedTuple):
+    """TXT RRset of a name and the number of seconds it can be cached.
+
+    An NXDOMAIN or NODATA answer has no records, its `ttl` is the negative
+    caching TTL of the zone (RFC 2308).
+    """
+
+    records: Tuple[TTxt, ...]
+    ttl: float
+
+
+class Resolver:
+    """Interface of the DNS backends of DmarcDiscovery."""
+
+    async def resolve_txt(self, name: str) -> TxtAnswer:
+        """TXT records of `name`, raises ResolverError on a transient failure."""
+        raise NotImplementedError
+
+
+class ZoneResolver(Resolver):
+    """Resolver answering from TXT records held in memory.
+
+    Stands in for DNS in tests and benchmarks, or serves a zone file. The
+    queries answered are counted by name in `queries`, and each answer is
+    delayed by `delay` seconds to simulate the network.
+    """
+
+    def __init__(
+        self,
+        records: Optional[Mapping[str, Iterable[TTxt]]] = None,
+        ttl: float = 3600,
+        negative_ttl: float = 300,
+        delay: float = 0,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.delay = delay
+        self.queries = Counter()
+        self._zone: Dict[str, Tuple[List[TTxt], float]] = {}
+        for name, txt_records in (records or {}).items():
+            for txt in txt_records:
+                self.add(name, txt)
+
+    def add(self, name: str, txt: TTxt, ttl: Optional[float] = None) -> None:
+        """Add a TXT record to the RRset of `name`, which takes the lowest TTL."""
+        name = normalize_domain(name)
+        ttl = self.ttl if ttl is None else ttl
+        txt_records, rrset_ttl = self._zone.get(name, ([], ttl))
+        txt_records.append(txt)
+        self._zone[name] = (txt_records, min(ttl, rrset_ttl))
+
+    @classmethod
+    def from_zone_file(
+        cls, text: str, origin: str = "", ttl: float = 3600, **kwargs
+    ) -> "ZoneResolver":
+        """Resolver serving the TXT records of a master file (RFC 1035 5.1).
+
+        `$ORIGIN`, `$TTL`, `@`, relative owner names, blank owners and
+        parentheses are handled; records of other types are ignored.
+        """
+        resolver = cls(ttl=ttl, **kwargs)
+        for name, record_ttl, strings in _zone_file_txt(text, origin, ttl):
+            resolver.add(name, strings, record_ttl)
+        return resolver
+
+    async def resolve_txt(self, name: str) -> TxtAnswer:
+        name = normalize_domain(name)
+        self.queries[name] += 1
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        txt_records, ttl = self._zone.get(name, ((), self.negative_ttl))
+        return TxtAnswer(tuple(txt_records), ttl)
+
+
+class DnsPythonResolver(Resolver):
+    """Resolver querying DNS with dnspython (`pip install dmarcparser[dns]`).
+
+    :param resolver: a `dns.asyncresolver.Resolver`, the system configuration
+        is used by default.
+    :param negative_ttl: TTL of an NXDOMAIN answer without SOA record, and of
+        a name that is not a valid domain name (empty or too long label...).
+    """
+
+    def __init__(self, resolver=None, negative_ttl: float = 300):
+        import dns.asyncresolver
+
+        self.resolver = resolver or dns.asyncresolver.Resolver()
+        self.negative_ttl = negative_ttl
+
+    async def resolve_txt(self, name: str) -> TxtAnswer:
+        import dns.exception
+        import dns.name
+        import dns.resolver
+
+        try:
+            answer = await self.resolver.resolve(name, "TXT", raise_on_no_answer=False)
+        except dns.resolver.NXDOMAIN as e:
+            return TxtAnswer((), self._nxdomain_ttl(e))
+        except (
+            dns.name.EmptyLabel,
+            dns.name.LabelTooLong,
+            dns.name.NameTooLong,
+            dns.name.BadEscape,
+            dns.name.IDNAException,
+        ):
+            # a name that cannot be queried has no records either
+            return TxtAnswer((), self.negative_ttl)
+        except dns.exception.DNSException as e:
+            # NoNameservers, Timeout, YXDOMAIN...
+            raise ResolverError(str(e)) from e
+        if answer.rrset is None:
+            # NODATA, cached until the expiration dnspython derives from the SOA
+            return TxtAnswer((), max(0.0, answer.expiration - time.time()))
+        return TxtAnswer(
+            tuple(tuple(rdata.strings) for rdata in answer.rrset), answer.rrset.ttl
+        )
+
+    def _nxdomain_ttl(self, e) -> float:
+        import dns.exception
+
+        try:
+            response = e.response(e.qnames()[0])
+            return response.resolve_chaining().minimum_ttl
+        except (IndexError, KeyError, AttributeError, dns.exception.DNSException):
+            # no response kept for the name, or no SOA record in it
+            return self.negative_ttl
+
+
+class DiscoveryResult(NamedTuple):
+    """Outcome of the policy discovery of a domain.
+
+    `policy_domain` is the domain whose DMARC record was found, the domain itself
+    or its organizational domain; `outcome` is the parse outcome of the record,
+    or the DmarcException of an RRset with several DMARC records. `dns_error` is
+    the ResolverError which interrupted the discovery.
+    """
+
+    domain: str
+    org_domain: Optional[str]
+    policy_domain: Optional[str]
+    record: Optional[str]
+    outcome: Optional[TOutcome]
+    dns_error: Optional[ResolverError] = None
+
+    @property
+    def status(self) -> str:
+        """STATUS_POLICY, STATUS_INVALID, STATUS_NONE or STATUS_TEMPERROR."""
+        if self.dns_error is not None:
+            return STATUS_TEMPERROR
+        if self.outcome is None:
+            return STATUS_NONE
+        if isinstance(self.outcome, DmarcException):
+            return STATUS_INVALID
+        return STATUS_POLICY
+
+    @property
+    def policy(self) -> Optional[str]:
+        """Policy requested for the domain: `sp` (or `p` without `sp`) when found
+        at the organizational domain, `p` otherwise; None without a valid record.
+        """
+        if self.status != STATUS_POLICY:
+            return None
+        if self.policy_domain != self.domain:
+            return self.outcome.sp.effective_value
+        return self.outcome.p.effective_value
+
+
+class _Lookup(NamedTuple):
+    # DMARC record of a `_dmarc` name and its outcome, None without record
+    record: Optional[str]
+    outcome: Optional[TOutcome]
+
+
+class _TxtLookups(Generic[T]):
+    """TXT lookups through a resolver, interpreted and cached for their TTL.
+
+    At most `max_concurrency` lookups are in flight, concurrent lookups of the
+    same name share one query, cancelled with the last of its callers, and the
+    value `interpret` derives from an answer is cached until the TTL of the
+    answer, bounded by `min_ttl` and `max_ttl`, expires. ResolverError is raised
+    to the callers and never cached.
+    """
+
+    def __init__(
+        self,
+        resolver: Resolver,
+        interpret: Callable[[TxtAnswer], T],
+        max_concurrency: int,
+        cache_size: int,
+        min_ttl: float,
+        max_ttl: float,
+        clock: Callable[[], float],
+    ):
+        self.resolver = resolver
+        self.interpret = interpret
+        self.max_concurrency = max_concurrency
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._cache = LRUCache(cache_size) if cache_size > 0 else None
+        # the semaphore and the futures belong to the event loop of the lookups
+        # in flight, they are replaced when another loop runs them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._waiters: Counter = Counter()
+
+    def cache_info(self) -> CacheInfo:
+        """Hits and misses of the lookups, expired entries count as misses."""
+        maxsize = self._cache.maxsize if self._cache is not None else 0
+        currsize = len(self._cache) if self._cache is not None else 0
+        return CacheInfo(self.hits, self.misses, maxsize, currsize)
+
+    def cache_clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, name: str) -> T:
+        if self._cache is not None:
+            entry = self._cache.get(name)
+            if entry is not MISSING and entry[1] > self.clock():
+                self.hits += 1
+                return entry[0]
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._in_flight = {}
+            self._waiters = Counter()
+        future = self._in_flight.get(name)
+        if future is None:
+            future = asyncio.ensure_future(self._resolve(name))
+            self._in_flight[name] = future
+            future.add_done_callback(lambda _: self._forget(name, future))
+        self._waiters[future] += 1
+        try:
+            # a cancelled caller does not cancel the lookup others are waiting for
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._waiters[future] == 1:
+                # callers arriving from now on start a new lookup
+                self._forget(name, future)
+                future.cancel()
+            raise
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+
+    def _forget(self, name: str, future: asyncio.Future) -> None:
+        if self._in_flight.get(name) is future:
+            del self._in_flight[name]
+
+    async def _resolve(self, name: str) -> T:
+        async with self._slots:
+            answer = await self.resolver.resolve_txt(name)
+        value = self.interpret(answer)
+        if self._cache is not None:
+            ttl = min(max(answer.ttl, self.min_ttl), self.max_ttl)
+            self._cache.put(name, (value, self.clock() + ttl))
+        return value
+
+
+class DmarcDiscovery:
+    """Discover and parse the DMARC policy of domains, RFC 7489 6.6.3.
+
+    The DMARC record is looked up at `_dmarc.<domain>`, then, if the domain has
+    none, at `_dmarc.<organizational domain>`. An RRset with several DMARC
+    records ends the discovery. Lookups are deduplicated while in flight and
+    their outcome cached for the TTL of the answer, bounded by `min_ttl` and
+    `max_ttl`, so that the subdomains of an organization share the lookup of
+    its record.
+    """
+
+    def __init__(
+        self,
+        resolver: Resolver,
+        parser: Optional[DmarcParser] = None,
+        public_suffixes: Optional["PublicSuffixList"] = None,
+        max_concurrency: int = 100,
+        max_pending: int = 1024,
+        cache_size: int = 100_000,
+        min_ttl: float = 0,
+        max_ttl: float = 86400,
+        follow_downgrade: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param parser: parses the records found, by default a DmarcParser with
+            compact results (shared by the domains of a cached record) and a cache.
+        :param public_suffixes: determines the organizational domains, by default
+            the last two labels of a domain (see PublicSuffixList).
+        :param max_concurrency: maximum number of lookups in flight.
+        :param max_pending: domains read ahead of the results by `discover_many`.
+        :param cache_size: number of `_dmarc` names cached. Disabled with 0.
+        """
+        self.resolver = resolver
+        self.parser = parser or DmarcParser(cache_size=4096, compact_results=True)
+        self.public_suffixes = public_suffixes or PublicSuffixList()
+        self.max_pending = max_pending
+        self.follow_downgrade = follow_downgrade
+        self._lookups = _TxtLookups(
+            resolver,
+            self._interpret,
+            max_concurrency,
+            cache_size,
+            min_ttl,
+            max_ttl,
+            clock,
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """Hits and misses of the lookups, expired entries count as misses."""
+        return self._lookups.cache_info()
+
+    def cache_clear(self) -> None:
+        self._lookups.cache_clear()
+
+    async def discover(self, domain: str) -> DiscoveryResult:
+        domain = normalize_domain(domain)
+        org_domain = self.public_suffixes.organizational_domain(domain)
+        policy_domain = domain
+        try:
+            lookup = await self._lookups.get(f"_dmarc.{domain}")
+            if lookup.outcome is None and org_domain not in (None, domain):
+                policy_domain = org_domain
+                lookup = await self._lookups.get(f"_dmarc.{org_domain}")
+        except ResolverError as e:
+            return DiscoveryResult(domain, org_domain, None, None, None, e)
+        if lookup.outcome is None:
+            policy_domain = None
+        return DiscoveryResult(
+            domain, org_domain, policy_domain, lookup.record, lookup.outcome
+        )
+
+    async def discover_many(
+        self, domains: Union[Iterable[str], AsyncIterable[str]]
+    ) -> AsyncIterator[DiscoveryResult]:
+        """Yield the result of each domain, in input order.
+
+        At most `max_pending` domains are read ahead of the results. The
+        lookups still pending are cancelled when the generator is closed before
+        its end, or when one of them raises.
+        """
+        pending = deque()
+        try:
+            async for domain in _as_async_iterable(domains):
+                pending.append(asyncio.ensure_future(self.discover(domain)))
+                if len(pending) >= self.max_pending:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _interpret(self, answer: TxtAnswer) -> _Lookup:
+        try:
+            record = select_dmarc_record(answer.records)
+        except DmarcException as e:
+            return _Lookup(None, e)
+        if record is None:
+            return _Lookup(None, None)
+        return _Lookup(record, self.parser.parse_outcome(record, self.follow_downgrade))
+
+
+class PublicSuffixList:
+    """Public suffixes of the Public Suffix List, to find organizational domains.
+
+    Follows the algorithm of https://publicsuffix.org/list/ (wildcard and
+    exception rules, default rule `*`). Without rules, the public suffix of a
+    domain is its last label and its organizational domain its last two labels;
+    load the list with `from_file` for domains under suffixes like `co.uk`.
+    """
+
+    def __init__(self, rules: Iterable[str] = ()):
+        self._rules = set()
+        self._wildcards = set()
+        self._exceptions = set()
+        for rule in rules:
+            rule = _idna(rule.strip().lower())
+            if rule.startswith("!"):
+                self._exceptions.add(rule[1:])
+            elif rule.startswith("*."):
+                self._wildcards.add(rule[2:])
+            elif rule:
+                self._rules.add(rule)
+
+    @classmethod
+    def from_file(cls, path: str) -> "PublicSuffixList":
+        """Load a list in the format of public_suffix_list.dat."""
+        with open(path, encoding="utf-8") as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, text: str) -> "PublicSuffixList":
+        return cls(
+            line.split()[0]
+            for line in text.splitlines()
+            if line.strip() and not line.startswith("//")
+        )
+
+    def public_suffix(self, domain: str) -> str:
+        labels = normalize_domain(domain).split(".")
+        suffixes = [".".join(labels[i:]) for i in range(len(labels))]
+        for i, suffix in enumerate(suffixes):
+            if suffix in self._exceptions:
+                return ".".join(labels[i + 1 :])
+        for i, suffix in enumerate(suffixes):
+            if suffix in self._rules:
+                return suffix
+            if i + 1 < len(suffixes) and suffixes[i + 1] in self._wildcards:
+                return suffix
+        return labels[-1]
+
+    def organizational_domain(self, domain: str) -> Optional[str]:
+        """The public suffix and one more label, None for a public suffix."""
+        domain = normalize_domain(domain)
+        suffix = self.public_suffix(domain)
+        if domain == suffix:
+            return None
+        labels = domain[: -len(suffix) - 1].split(".")
+        return f"{labels[-1]}.{suffix}"
+
+
+def normalize_domain(domain: str) -> str:
+    return domain.rstrip(".").lower()
+
+
+def _idna(name: str) -> str:
+    if name.isascii():
+        return name
+    return ".".join(
+        label if label.isascii() else label.encode("idna").decode("ascii")
+        for label in name.split(".")
+    )
+
+
+_ZONE_TOKEN_REGEX = re.compile(
+    r'(?P<quoted>"(?:[^"\\]|\\.)*")|(?P<blank>[ \t]+)|(?P<comment>;[^\n]*)'
+    r'|(?P<newline>\r?\n)|(?P<paren>[()])|(?P<word>[^\s";()]+)',
+    re.DOTALL,
+)
+_ZONE_ESCAPE_REGEX = re.compile(rb"\\([0-9]{3}|.)", re.DOTALL)
+_ZONE_CLASSES = {"in", "ch", "hs", "cs"}
+
+
+def _zone_file_lines(text: str) -> Iterator[Tuple[bool, List[Tuple[str, str]]]]:
+    """Entries of a master file: whether the owner is blank, and the tokens."""
+    tokens = []
+    blank_owner = False
+    depth = 0
+    line_start = True
+    for match in _ZONE_TOKEN_REGEX.finditer(text):
+        kind = match.lastgroup
+        if kind == "newline":
+            if depth == 0:
+                if tokens:
+                    yield blank_owner, tokens
+                tokens = []
+            line_start = True
+            continue
+        if line_start and depth == 0 and not tokens:
+            blank_owner = kind == "blank"
+        line_start = False
+        if kind == "paren":
+            depth += 1 if match.group() == "(" else -1
+        elif kind in ("quoted", "word"):
+            tokens.append((kind, match.group()))
+    if tokens:
+        yield blank_owner, tokens
+
+
+def _zone_string(kind: str, token: str) -> bytes:
+    if kind == "quoted":
+        token = token[1:-1]
+
+    def unescape(match):
+        escaped = match.group(1)
+        return bytes([int(escaped)]) if escaped.isdigit() else escaped
+
+    return _ZONE_ESCAPE_REGEX.sub(unescape, token.encode("utf-8"))
+
+
+def _zone_file_txt(
+    text: str, origin: str, ttl: float
+) -> Iterator[Tuple[str, float, Tuple[bytes, ...]]]:
+    """Owner, TTL and character-strings of the TXT records of a master file."""
+    origin = normalize_domain(origin)
+    owner = origin
+
+    def absolute(name: str) -> str:
+        if name == "@":
+            return origin
+        if name.endswith("."):
+            return normalize_domain(name)
+        return normalize_domain(f"{name}.{origin}" if origin else name)
+
+    for blank_owner, tokens in _zone_file_lines(text):
+        words = [token for _, token in tokens]
+        if words[0].upper() == "$ORIGIN":
+            origin = normalize_domain(words[1])
+            continue
+        if words[0].upper() == "$TTL":
+            ttl = float(words[1])
+            continue
+        if words[0].startswith("$"):
+            # $INCLUDE and other directives
+            continue
+        if not blank_owner:
+            owner = absolute(words[0])
+            tokens = tokens[1:]
+        record_ttl = ttl
+        while tokens and tokens[0][0] == "word":
+            word = tokens[0][1].lower()
+            if word.isdigit():
+                record_ttl = float(word)
+            elif word not in _ZONE_CLASSES:
+                break
+            tokens = tokens[1:]
+        if not tokens or tokens[0][1].upper() != "TXT":
+            continue
+        yield owner, record_ttl, tuple(_zone_string(*token) for token in tokens[1:])
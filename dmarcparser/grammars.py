@@ -1,8 +1,7 @@
 import enum
+import os
 from functools import lru_cache
 
-from apg_py.api.api import Api
-
 core_rules = [
     "ALPHA          =  %x41-5A / %x61-7A",
     'BIT            =  "0" / "1"',
@@ -118,6 +117,8 @@ def _load_dmarc_grammar():
 
 
 def generate_parser(grammar: str):
+    from apg_py.api.api import Api
+
     grammar_api = Api()
     grammar_obj = grammar_api.generate(grammar)
     # print()
@@ -127,17 +128,79 @@ def generate_parser(grammar: str):
     return grammar_obj
 
 
+def grammar_source(grammar_type: GrammarType) -> str:
+    if grammar_type == GrammarType.DMARC_ABNF:
+        return _load_dmarc_grammar()
+    elif grammar_type == GrammarType.DKIM_TAG_LIST_ABNF:
+        return _load_tag_grammar()
+    else:
+        raise Exception(f"unknown grammar type {grammar_type}")
+
+
+def grammar_digest(abnf_str: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(abnf_str.encode("utf-8")).hexdigest()
+
+
 @lru_cache
 def load_grammar(grammar_type: GrammarType):
-    return _generate_grammar(grammar_type)
+    abnf_str = grammar_source(grammar_type)
+    grammar = _load_precompiled_grammar(grammar_type, abnf_str)
+    if grammar is None:
+        # the shipped tables are missing or outdated, generate from source
+        grammar = generate_parser(abnf_str)
+    return grammar
+
+
+def _load_precompiled_grammar(grammar_type: GrammarType, abnf_str: str):
+    try:
+        from dmarcparser import _grammar_tables
+    except ImportError:
+        return None
+    table = _grammar_tables.GRAMMARS.get(grammar_type.value)
+    if table is None or table["digest"] != grammar_digest(abnf_str):
+        return None
+    from apg_py.api.api import Grammar
+
+    return Grammar(table["rules"], table["udts"], abnf_str)
 
 
 def _generate_grammar(grammar_type):
-    if grammar_type == GrammarType.DMARC_ABNF:
-        abnf_str = _load_dmarc_grammar()
-    elif grammar_type == GrammarType.DKIM_TAG_LIST_ABNF:
-        abnf_str = _load_tag_grammar()
-    else:
-        raise Exception(f"unknown grammar type {grammar_type}")
+    abnf_str = grammar_source(grammar_type)
     grammar = generate_parser(abnf_str)
     return grammar
+
+
+GRAMMAR_TABLES_PATH = os.path.join(os.path.dirname(__file__), "_grammar_tables.py")
+
+
+def write_grammar_tables(path: str = GRAMMAR_TABLES_PATH):
+    """Serialize the generated grammars into a python module.
+
+    The module is shipped with the package so that `load_grammar` does not have
+    to run the apg generator at runtime. Run `python -m dmarcparser.grammars`
+    whenever one of the grammars above is modified, it also regenerates the
+    recognizers of `dmarcparser.codegen`.
+    """
+    import pprint
+
+    tables = {}
+    for grammar_type in GrammarType:
+        abnf_str = grammar_source(grammar_type)
+        grammar = generate_parser(abnf_str)
+        tables[grammar_type.value] = {
+            "digest": grammar_digest(abnf_str),
+            "rules": grammar.rules,
+            "udts": grammar.udts,
+        }
+    with open(path, "w") as f:
+        f.write("# Generated by `python -m dmarcparser.grammars`, do not edit.\n")
+        f.write("GRAMMARS = " + pprint.pformat(tables, sort_dicts=False) + "\n")
+
+
+if __name__ == "__main__":
+    from dmarcparser.codegen import write_recognizers
+
+    write_grammar_tables()
+    write_recognizers()
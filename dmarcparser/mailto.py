@@ -0,0 +1,46 @@
+import re
+
+# Same checks as validators.email of validators 0.36 with its default options
+# (no IP address domain, no simple hostname, no trailing dot, no underscore),
+# with the regular expressions compiled once and without the validator
+# decorator overhead. Nothing is imported from validators: with an older
+# version installed, the two may disagree on corner cases.
+# The local-part expression is kept as is, including its quirks: the first
+# alternative only checks the first character and "$" accepts a trailing "\n".
+_EXTENDED_LATIN = r"\u0100-\u017F\u0180-\u024F\u00A0-\u00FF"
+LOCAL_PART_REGEX = re.compile(
+    rf"(^[{_EXTENDED_LATIN}]"
+    rf"|[{_EXTENDED_LATIN}0-9a-z!#$%&'*+/=?^_`{{}}|~\-]+"
+    rf"(\.[{_EXTENDED_LATIN}0-9a-z!#$%&'*+/=?^_`{{}}|~\-]+)*$"
+    r'|^"('
+    rf"[{_EXTENDED_LATIN}\001-\010\013\014\016-\037"
+    r"!#-\[\]-\177]|\\[\011.]"
+    r')*")$',
+    re.IGNORECASE,
+)
+DOMAIN_REGEX = re.compile(
+    r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z0-9][a-z0-9-]{0,61}[a-z]$",
+    re.IGNORECASE,
+)
+DOMAIN_REJECT_REGEX = re.compile(r"\s|__+")
+
+
+def is_valid_email(value: str) -> bool:
+    """Equivalent of `validators.email(value) is True`."""
+    if not value or value.count("@") != 1:
+        return False
+    local_part, domain = value.split("@")
+    if len(local_part) > 64 or len(domain) > 253 or not domain:
+        return False
+    if LOCAL_PART_REGEX.match(local_part) is None:
+        return False
+    try:
+        encoded = domain.encode("idna").decode("utf-8")
+    except UnicodeError:
+        return False
+    if len(encoded.rstrip(".")) > 253:
+        return False
+    return (
+        DOMAIN_REJECT_REGEX.search(domain) is None
+        and DOMAIN_REGEX.match(encoded) is not None
+    )
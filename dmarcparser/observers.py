@@ -0,0 +1,110 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence
+
+PHASE_TAG_LIST_SYNTAX = "tag_list_syntax"
+PHASE_DMARC_SYNTAX = "dmarc_syntax"
+PHASE_PROCESS = "process"
+PHASE_SEMANTIC_CHECK = "semantic_check"
+PHASES = (
+    PHASE_TAG_LIST_SYNTAX,
+    PHASE_DMARC_SYNTAX,
+    PHASE_PROCESS,
+    PHASE_SEMANTIC_CHECK,
+)
+
+DEFAULT_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+
+
+class ParseObserver:
+    """Receives the events of DmarcParser.parse, override the methods of interest."""
+
+    def on_phase(self, phase: str, duration: float) -> None:
+        """Called after each phase of a parse with its duration in seconds.
+
+        Phases are one of PHASES, only those actually run are reported.
+        """
+
+    def on_outcome(self, code: Optional[int]) -> None:
+        """Called once per parse call with the DmarcException code, None if valid."""
+
+
+class PrometheusObserver(ParseObserver):
+    """Aggregates phase durations in histograms and outcomes in counters."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._phase_counts: Dict[str, List[int]] = {}
+        self._phase_sums: Dict[str, float] = {}
+        self._outcomes: Dict[Optional[int], int] = {}
+
+    def on_phase(self, phase: str, duration: float) -> None:
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            counts = self._phase_counts.get(phase)
+            if counts is None:
+                counts = self._phase_counts[phase] = [0] * (len(self.buckets) + 1)
+                self._phase_sums[phase] = 0.0
+            counts[bucket] += 1
+            self._phase_sums[phase] += duration
+
+    def on_outcome(self, code: Optional[int]) -> None:
+        with self._lock:
+            self._outcomes[code] = self._outcomes.get(code, 0) + 1
+
+    def to_prometheus(self, prefix: str = "dmarcparser") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_phase_duration_seconds "
+            f"Duration of the phases of DmarcParser.parse.",
+            f"# TYPE {prefix}_phase_duration_seconds histogram",
+        ]
+        with self._lock:
+            for phase, counts in self._phase_counts.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(
+                        f"{prefix}_phase_duration_seconds_bucket"
+                        f'{{phase="{phase}",le="{bound}"}} {cumulative}'
+                    )
+                cumulative += counts[-1]
+                lines.append(
+                    f"{prefix}_phase_duration_seconds_bucket"
+                    f'{{phase="{phase}",le="+Inf"}} {cumulative}'
+                )
+                lines.append(
+                    f"{prefix}_phase_duration_seconds_sum"
+                    f'{{phase="{phase}"}} {self._phase_sums[phase]}'
+                )
+                lines.append(
+                    f"{prefix}_phase_duration_seconds_count"
+                    f'{{phase="{phase}"}} {cumulative}'
+                )
+            lines.append(f"# HELP {prefix}_records_total Records parsed, by outcome.")
+            lines.append(f"# TYPE {prefix}_records_total counter")
+            for code, count in sorted(
+                self._outcomes.items(),
+                key=lambda item: -1 if item[0] is None else item[0],
+            ):
+                if code is None:
+                    labels = 'outcome="valid"'
+                else:
+                    labels = f'outcome="error",code="{code}"'
+                lines.append(f"{prefix}_records_total{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
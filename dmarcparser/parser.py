@@ -1,14 +1,37 @@
 import functools
+import gc
+import itertools
 import re
-from typing import Union, Optional, Tuple, List
+import sys
+import threading
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Union,
+    Optional,
+    Tuple,
+    List,
+    Iterable,
+    Iterator,
+    Dict,
+    NamedTuple,
+    Sequence,
+)
 
-import validators
-from apg_py.api.api import Grammar
-from apg_py.lib import utilities as apg_util
 from apg_py.lib.identifiers import MATCH
-from apg_py.lib.parser import Parser as APGParser
 
+from dmarcparser.cache import LRUCache, CacheInfo, MISSING
 from dmarcparser.grammars import load_grammar, GrammarType
+from dmarcparser.mailto import is_valid_email
+from dmarcparser.observers import (
+    ParseObserver,
+    PHASE_TAG_LIST_SYNTAX,
+    PHASE_DMARC_SYNTAX,
+    PHASE_PROCESS,
+    PHASE_SEMANTIC_CHECK,
+)
+from dmarcparser.tokenizer import scan_tag_list
 from dmarcparser.tags import (
     FOTag,
     RUFTag,
@@ -26,6 +49,13 @@ from dmarcparser.tags import (
     EmailObj,
 )
 
+# the APG parser, validators, NumPy and the process pool are only imported once
+# a DmarcParser is built or used, importing the package stays cheap
+if TYPE_CHECKING:
+    from apg_py.api.api import Grammar
+
+    from dmarcparser.columnar import DmarcColumns
+
 POLICY_VALUES = {"none", "reject", "quarantine"}
 
 CHAR_TO_BYTE_MAP = {"k": 2**10, "m": 2**20, "g": 2**30, "t": 2**40}
@@ -46,6 +76,11 @@ VALID_DMARC_TAGS_SET = set(VALID_DMARC_TAGS)
 
 SKIP_WSP_REGEX = re.compile(r"\s")
 SIZE_LIMIT_REGEX = re.compile(r"!(?P<limit>[0-9]+)(?P<mult_byte>[KMGTkmgt]?)$")
+TRecord = Union[str, bytes]
+ENGINES = ("apg", "compiled")
+
+# a record starting with the dmarc-version tag, as required by RFC 7489 6.6.3
+DMARC_CANDIDATE_REGEX = re.compile(r"[ \t]*[vV][ \t]*=[ \t]*DMARC1[ \t]*(;|$)")
 
 
 class DmarcException(Exception):
@@ -63,12 +98,16 @@ class DmarcException(Exception):
     NOT_VALID_RECORD = 1
     TAG_ALLREADY_EXIST = 2
     FO_ERRORS = 3
+    MULTIPLE_RECORDS = 94
+    LIMIT_EXCEEDED = 96
 
     ErrorString = {
         1: "This Dmarc records is not valid",
         2: "The tag allready exist",
         0: "\\0 is not allowed",
         3: "Error in the fo parameters",
+        94: "The RRset contains several DMARC records",
+        96: "The record exceeds the parser limits",
     }
 
     def __init__(self, code, value, plus=""):
@@ -89,6 +128,59 @@ class DmarcParserException(Exception):
     pass
 
 
+class ParseOutcome:
+    """Outcome of DmarcParser.parse_result, a result or an error but never raised.
+
+    The error message is only formatted when `message` is read.
+    """
+
+    __slots__ = ("result", "error_code", "_template", "_args")
+
+    def __init__(
+        self,
+        result: Optional["TDmarcResult"] = None,
+        error_code: Optional[int] = None,
+        template: str = "",
+        args: tuple = (),
+    ):
+        self.result = result
+        self.error_code = error_code
+        self._template = template
+        self._args = args
+
+    @classmethod
+    def error(cls, code: int, template: str, *args) -> "ParseOutcome":
+        """Failed outcome, `template.format(*args)` being the message."""
+        return cls(None, code, template, args)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_code is None
+
+    def __bool__(self) -> bool:
+        return self.error_code is None
+
+    @property
+    def message(self) -> Optional[str]:
+        """`value` of the equivalent DmarcException, None for a result."""
+        if self.error_code is None:
+            return None
+        if self._args:
+            return self._template.format(*self._args)
+        return self._template
+
+    def exception(self) -> Optional[DmarcException]:
+        """DmarcException the raising API reports for this outcome."""
+        if self.error_code is None:
+            return None
+        return DmarcException(self.error_code, self.message)
+
+    def __repr__(self) -> str:
+        if self.error_code is None:
+            return f"ParseOutcome(ok=True, result={self.result!r})"
+        return f"ParseOutcome(ok=False, error_code={self.error_code})"
+
+
 class DmarcObject:
     __slots__ = (
         "v",
@@ -132,10 +224,144 @@ class DmarcObject:
         else:
             return getattr(self, item)
 
+    def copy(self) -> "DmarcObject":
+        dmarc_obj = DmarcObject.__new__(DmarcObject)
+        for tag_name in VALID_DMARC_TAGS:
+            setattr(dmarc_obj, tag_name, self[tag_name].copy())
+        dmarc_obj.current_index = self.current_index
+        dmarc_obj.ignored_tags = list(self.ignored_tags)
+        dmarc_obj.original_record = self.original_record
+        dmarc_obj.effective_value = self.effective_value
+        return dmarc_obj
+
+    def freeze(self) -> "DmarcResult":
+        """Read-only and compact copy of the object.
+
+        The tags of this object are frozen in place and shared with the result,
+        it must not be modified afterwards.
+        """
+        tags = [
+            DEFAULT_TAGS[tag_name] if tag.is_default() else tag.freeze()
+            for tag_name, tag in ((name, self[name]) for name in VALID_DMARC_TAGS)
+        ]
+        effective_value = self.effective_value
+        if effective_value == self.original_record:
+            # record without whitespace nor unknown tags, keep a single string
+            effective_value = self.original_record
+        return DmarcResult(
+            tags, tuple(self.ignored_tags), self.original_record, effective_value
+        )
+
     def validate(self):
         pass
 
 
+DEFAULT_TAGS = {
+    tag_class.name(): tag_class().freeze()
+    for tag_class in (
+        DMARC1Tag,
+        PTag,
+        SPTag,
+        ADKIMTag,
+        ASPFTag,
+        FOTag,
+        RFTag,
+        RITag,
+        RUATag,
+        RUFTag,
+        PCTTag,
+    )
+}
+
+
+class DmarcResult:
+    """Read-only form of a DmarcObject, with the same attributes.
+
+    Tags are frozen (lists become tuples) and the tags not found in the record
+    are shared by all results. Built with DmarcObject.freeze, see also
+    DmarcParser(compact_results=True).
+    """
+
+    __slots__ = (
+        *VALID_DMARC_TAGS,
+        "ignored_tags",
+        "original_record",
+        "effective_value",
+    )
+
+    def __init__(
+        self,
+        tags: List[DmarcTag],
+        ignored_tags: Tuple[str, ...],
+        original_record: str,
+        effective_value: Optional[str],
+    ):
+        for tag in tags:
+            object.__setattr__(self, tag.name(), tag)
+        object.__setattr__(self, "ignored_tags", ignored_tags)
+        object.__setattr__(self, "original_record", original_record)
+        object.__setattr__(self, "effective_value", effective_value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DmarcResult is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("DmarcResult is read-only")
+
+    def __getitem__(self, item: Union[str, DmarcTag]) -> Optional[TDmarcAttr]:
+        if item not in VALID_DMARC_TAGS_SET:
+            raise DmarcParserException("this tag does not exist in DMARC")
+        return getattr(self, item)
+
+    def __reduce__(self):
+        # default tags are restored as the shared instances
+        tags = tuple(
+            None if self[tag_name] is DEFAULT_TAGS[tag_name] else self[tag_name]
+            for tag_name in VALID_DMARC_TAGS
+        )
+        return _unpickle_dmarc_result, (
+            tags,
+            self.ignored_tags,
+            self.original_record,
+            self.effective_value,
+        )
+
+    def copy(self) -> "DmarcResult":
+        return self
+
+    def replace_record(
+        self,
+        original_record: str,
+        effective_value: Optional[str],
+        ignored_tags: Tuple[str, ...],
+    ) -> "DmarcResult":
+        """Same tags, for another record with the same outcome."""
+        tags = [self[tag_name] for tag_name in VALID_DMARC_TAGS]
+        return DmarcResult(tags, ignored_tags, original_record, effective_value)
+
+    def to_dmarc_object(self) -> DmarcObject:
+        """Modifiable DmarcObject with copies of the tags."""
+        dmarc_obj = DmarcObject.__new__(DmarcObject)
+        for tag_name in VALID_DMARC_TAGS:
+            setattr(dmarc_obj, tag_name, self[tag_name].copy())
+        dmarc_obj.current_index = 0
+        dmarc_obj.ignored_tags = list(self.ignored_tags)
+        dmarc_obj.original_record = self.original_record
+        dmarc_obj.effective_value = self.effective_value
+        return dmarc_obj
+
+
+TDmarcResult = Union[DmarcObject, DmarcResult]
+
+
+def _unpickle_dmarc_result(tags, ignored_tags, original_record, effective_value):
+    tags = [
+        DEFAULT_TAGS[tag_name] if tag is None else tag
+        for tag_name, tag in zip(VALID_DMARC_TAGS, tags)
+    ]
+    return DmarcResult(tags, ignored_tags, original_record, effective_value)
+
+
 ABNF_to_option = {
     "dmarc-version": DMARC1Tag.name(),
     "dmarc-request": PTag.name(),
@@ -149,88 +375,399 @@ ABNF_to_option = {
     "dmarc-auri": RUATag.name(),
     "dmarc-furi": RUFTag.name(),
 }
+OPTION_to_ABNF = {option: abnf for abnf, option in ABNF_to_option.items()}
 
 
-class DmarcParser:
-    def __init__(self):
-        self.tag_grammar: Grammar = load_grammar(GrammarType.DKIM_TAG_LIST_ABNF)
-        self.dmarc_grammar: Grammar = load_grammar(GrammarType.DMARC_ABNF)
+def canonicalize(record: str) -> str:
+    """Normalized form of a record, equal for records with the same parse outcome.
 
-    @staticmethod
-    def extract_value(apg_res):
-        phrase_index = apg_res["phrase_index"]
-        phrase_length = apg_res["phrase_length"]
-        value = apg_res["input"][phrase_index : phrase_index + phrase_length]
-        str_val = apg_util.tuple_to_string(value)
-        return str_val
+    Only the DKIM tag-list is scanned, no DMARC grammar is run. The whitespace
+    in tag-specs is removed, the values are lowercased (except the case
+    sensitive `DMARC1`) and the values of unknown tags dropped. Tag names are
+    lowercased unless that would create duplicates the parser does not see as
+    such. Records which are not a DKIM tag-list all share the empty form, and
+    records the scanner does not handle are returned unchanged.
+    """
+    scanned = scan_tag_list(record)
+    if scanned is None:
+        return record
+    success, tag_list, tag_spec_list = scanned
+    if not success:
+        return ""
+    lower_tag_list = [tag.lower() for tag in tag_list]
+    if len(set(tag_list)) == len(set(lower_tag_list)):
+        tag_list = lower_tag_list
+    canonical_tags = []
+    for tag, lower_tag, tag_spec in zip(tag_list, lower_tag_list, tag_spec_list):
+        if lower_tag not in VALID_DMARC_TAGS_SET:
+            value = ""
+        else:
+            value = SKIP_WSP_REGEX.sub("", tag_spec[tag_spec.index("=") + 1 :])
+            if lower_tag != DMARC1Tag.name():
+                value = value.lower()
+        canonical_tags.append(f"{tag}={value}")
+    return ";".join(canonical_tags)
 
-    @staticmethod
-    def _parser_cb(res, tag_list: list):
-        if res["state"] == MATCH:
-            value = DmarcParser.extract_value(res)
-            tag_list.append(value)
-
-    def _check_tag_list_syntax(self, record: str):
-        tag_list = []
-        tag_spec_list = []
-        tag_list_parser = APGParser(self.tag_grammar)
-        tag_list_parser.add_callbacks(
+
+def txt_string(txt_record: Union[TRecord, Iterable[TRecord]]) -> str:
+    """A TXT record as one string, its character-strings concatenated and
+    bytes decoded as latin-1."""
+    if isinstance(txt_record, str):
+        return txt_record
+    if isinstance(txt_record, bytes):
+        return txt_record.decode("latin-1")
+    return "".join(
+        string.decode("latin-1") if isinstance(string, bytes) else string
+        for string in txt_record
+    )
+
+
+def select_dmarc_record(
+    txt_records: Iterable[Union[TRecord, Iterable[TRecord]]],
+) -> Optional[str]:
+    """The DMARC record of an RRset of TXT records, following RFC 7489 6.6.3.
+
+    Each TXT record is a string or the sequence of its character-strings, which
+    are concatenated, as str or bytes (decoded as latin-1, see DmarcParser.parse).
+    Records not starting with `v=DMARC1` are discarded. Returns None if no
+    record is left and raises DmarcException if several are.
+    """
+    candidates = [
+        txt_record
+        for txt_record in map(txt_string, txt_records)
+        if DMARC_CANDIDATE_REGEX.match(txt_record) is not None
+    ]
+    if len(candidates) > 1:
+        raise DmarcException(
+            DmarcException.MULTIPLE_RECORDS, "RRset contains several DMARC records"
+        )
+    return candidates[0] if candidates else None
+
+
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def code_points(text: str) -> Sequence[int]:
+    """APG parser input for `text`, without building a tuple of ints.
+
+    The bytes of an ASCII string, a view of its UTF-32 encoding otherwise: both
+    index to the code point of each character, which is all the APG parser
+    needs, and the phrase offsets it reports are offsets in `text`. Lone
+    surrogates keep their code point, which no grammar rule accepts.
+    """
+    if text.isascii():
+        return text.encode("ascii")
+    return memoryview(text.encode(_UTF32, "surrogatepass")).cast("I")
+
+
+def _check_txt(chunks: Sequence[TRecord]) -> Optional[ParseOutcome]:
+    """Failed outcome if a chunk of a TXT record has a NUL or non-ASCII character."""
+    for chunk in chunks:
+        if (b"\0" if isinstance(chunk, bytes) else "\0") in chunk:
+            return ParseOutcome.error(
+                DmarcException.BACKSLAH_ZERO,
+                DmarcException.ErrorString[DmarcException.BACKSLAH_ZERO],
+            )
+    for chunk in chunks:
+        if not chunk.isascii():
+            return ParseOutcome.error(99, "record is not DKIM-defined list of tags")
+    return None
+
+
+class _APGParsers(threading.local):
+    """APG parsers of a DmarcParser, with their callbacks, built once per thread.
+
+    A parse resets the state of an APG parser, the lists a parse fills are
+    passed as `user_data`, so the parsers are reused across calls; a thread
+    sharing the DmarcParser gets its own parsers on first use.
+
+    `nodes_left` and `deadline` hold what remains of the budget of the record
+    being parsed by the thread, None when unlimited; `deadline_exceeded` tells
+    whether its parse ran out of time.
+    """
+
+    def __init__(self, tag_grammar: "Grammar", dmarc_grammar: "Grammar"):
+        from apg_py.lib.parser import Parser as APGParser
+
+        self.nodes_left: Optional[int] = None
+        self.deadline: Optional[float] = None
+        self.deadline_exceeded = False
+        self.tag_list_parser = APGParser(tag_grammar)
+        self.tag_list_parser.add_callbacks(
             {
-                "tag-spec": functools.partial(self._parser_cb, tag_list=tag_spec_list),
-                "tag-name": functools.partial(self._parser_cb, tag_list=tag_list),
+                "tag-name": functools.partial(DmarcParser._parser_cb, list_index=0),
+                "tag-spec": functools.partial(DmarcParser._parser_cb, list_index=1),
             }
         )
-        result = tag_list_parser.parse(
-            apg_util.string_to_tuple(record), start_rule="tag-list"
+        # each DMARC tag is parsed on its own, without callbacks
+        self.dmarc_tag_parser = APGParser(dmarc_grammar)
+        self.dmarc_record_parser = APGParser(dmarc_grammar)
+        self.dmarc_record_parser.add_callbacks(
+            {
+                abnf_tag_name: functools.partial(
+                    DmarcParser._dmarc_tag_handler, abnf_tag_name=abnf_tag_name
+                )
+                for abnf_tag_name in ABNF_to_option.keys()
+            }
         )
-        return result, tag_list, tag_spec_list
 
-    def _check_tag_semantics(self, tag_list: list) -> None:
-        if len(tag_list) != len(set(tag_list)):
+
+def _compiled_parsers() -> Dict[str, tuple]:
+    """`parse` function and callback table of the recognizer standing for each
+    parser of _APGParsers, the callbacks collecting the same offsets."""
+    from dmarcparser.codegen import load_recognizer
+
+    tag_list = load_recognizer(GrammarType.DKIM_TAG_LIST_ABNF)
+    dmarc = load_recognizer(GrammarType.DMARC_ABNF)
+
+    def offsets_cb(user_data, phrase_index, phrase_length, list_index):
+        user_data[list_index].append((phrase_index, phrase_length))
+
+    def dmarc_tag_cb(user_data, phrase_index, phrase_length, abnf_tag_name):
+        user_data.append((abnf_tag_name, phrase_index, phrase_length))
+
+    return {
+        "tag_list_parser": (
+            tag_list.parse,
+            tag_list.callback_table(
+                {
+                    "tag-name": functools.partial(offsets_cb, list_index=0),
+                    "tag-spec": functools.partial(offsets_cb, list_index=1),
+                }
+            ),
+        ),
+        "dmarc_tag_parser": (dmarc.parse, dmarc.NO_CALLBACKS),
+        "dmarc_record_parser": (
+            dmarc.parse,
+            dmarc.callback_table(
+                {
+                    abnf_tag_name: functools.partial(
+                        dmarc_tag_cb, abnf_tag_name=abnf_tag_name
+                    )
+                    for abnf_tag_name in ABNF_to_option.keys()
+                }
+            ),
+        ),
+    }
+
+
+def _validators_email(email: str) -> bool:
+    import validators
+
+    return validators.email(email) is True
+
+
+class DmarcParser:
+    def __init__(
+        self,
+        fast_tag_list: bool = True,
+        cache_size: int = 0,
+        canonical_cache: bool = False,
+        observer: Optional[ParseObserver] = None,
+        compact_results: bool = False,
+        mailto_cache_size: int = 1024,
+        builtin_email_validator: bool = False,
+        max_record_length: int = 0,
+        node_budget: int = 0,
+        time_budget: float = 0,
+        engine: str = "apg",
+    ):
+        """
+        :param fast_tag_list: tokenize the DKIM tag-list with the hand-written
+            scanner, the APG parser is then only used for the records the scanner
+            cannot classify.
+        :param cache_size: keep the outcome of the last `cache_size` distinct
+            `(record, follow_downgrade)` parsed, valid or not. Disabled with 0.
+        :param canonical_cache: key the cache on the canonical form of the record
+            (see `canonicalize`) so that whitespace and case variants share an
+            entry.
+        :param observer: receives the duration of each phase and the outcome of
+            each record parsed by this parser (not by parse_many workers).
+        :param compact_results: return read-only DmarcResult instead of
+            DmarcObject, cached results are then shared instead of copied.
+        :param mailto_cache_size: keep the EmailObj (or the rejection) of the last
+            `mailto_cache_size` distinct `rua`/`ruf` URIs, the same reporting
+            addresses then share one EmailObj. Disabled with 0.
+        :param builtin_email_validator: validate addresses with the compiled
+            equivalent of `validators.email` in `dmarcparser.mailto`, which
+            follows validators 0.36 whatever version is installed.
+        :param max_record_length: reject longer records (code LIMIT_EXCEEDED)
+            before any parsing. Disabled with 0.
+        :param node_budget: maximum number of APG parse tree nodes visited for a
+            record, over all its grammar parses (code LIMIT_EXCEEDED). Disabled
+            with 0.
+        :param time_budget: maximum time in seconds spent parsing a record (code
+            LIMIT_EXCEEDED), checked before each grammar parse and before the
+            semantic check. Disabled with 0.
+        :param engine: "apg" to run the grammars with the APG parser, "compiled"
+            with the recognizers generated from them by `dmarcparser.codegen`,
+            which accept the same records an order of magnitude faster but
+            do not support `node_budget` (ValueError).
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"unknown engine {engine}")
+        if node_budget > 0 and engine != "apg":
+            # the recognizers do not count the nodes they visit
+            raise ValueError("node_budget is only supported by the apg engine")
+        self.observer = observer
+        self.compact_results = compact_results
+        self.canonical_cache = canonical_cache
+        self.fast_tag_list = fast_tag_list
+        self.cache_size = cache_size
+        self._cache = LRUCache(cache_size) if cache_size > 0 else None
+        self.mailto_cache_size = mailto_cache_size
+        self._mailto_cache = (
+            LRUCache(mailto_cache_size) if mailto_cache_size > 0 else None
+        )
+        self.builtin_email_validator = builtin_email_validator
+        self._is_valid_email = (
+            is_valid_email if builtin_email_validator else _validators_email
+        )
+        self.max_record_length = max_record_length
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.tag_grammar: "Grammar" = load_grammar(GrammarType.DKIM_TAG_LIST_ABNF)
+        self.dmarc_grammar: "Grammar" = load_grammar(GrammarType.DMARC_ABNF)
+        self._apg = _APGParsers(self.tag_grammar, self.dmarc_grammar)
+        self.engine = engine
+        self._compiled = _compiled_parsers() if engine == "compiled" else None
+
+    @staticmethod
+    def _parser_cb(res, list_index: int):
+        # user_data holds the offset lists of the current parse, the phrases are
+        # sliced from the input string once the parse is over
+        if res["state"] == MATCH:
+            res["user_data"][list_index].append(
+                (res["phrase_index"], res["phrase_length"])
+            )
+
+    def _start_budget(self) -> None:
+        """Grant the node and time budgets to the record about to be parsed."""
+        apg = self._apg
+        apg.nodes_left = self.node_budget if self.node_budget > 0 else None
+        apg.deadline = (
+            time.perf_counter() + self.time_budget if self.time_budget > 0 else None
+        )
+        apg.deadline_exceeded = False
+
+    def _check_deadline(self) -> None:
+        deadline = self._apg.deadline
+        if deadline is not None and time.perf_counter() > deadline:
+            self._apg.deadline_exceeded = True
             raise DmarcException(
+                DmarcException.LIMIT_EXCEEDED,
+                f"time budget of {self.time_budget}s exceeded",
+            )
+
+    def _grammar_parse(
+        self, parser_name: str, text: str, start_rule: str, user_data=None
+    ) -> bool:
+        """Whether `text` matches `start_rule` with one of the parsers of
+        _APGParsers, or its compiled recognizer, within the remaining budget.
+
+        Raises DmarcException LIMIT_EXCEEDED once the budget is exhausted, the
+        node budget is only granted with the APG engine.
+        """
+        self._check_deadline()
+        if self._compiled is not None:
+            parse, callbacks = self._compiled[parser_name]
+            return parse(text, start_rule, callbacks, user_data)
+        apg = self._apg
+        apg_parser = getattr(apg, parser_name)
+        nodes_left = apg.nodes_left
+        apg_parser.set_node_hit_limit(sys.maxsize if nodes_left is None else nodes_left)
+        try:
+            result = apg_parser.parse(
+                code_points(text), start_rule=start_rule, user_data=user_data
+            )
+        except Exception:
+            # APG raises a bare Exception when the node limit is reached
+            if nodes_left is None or apg_parser.node_hits < nodes_left:
+                raise
+            raise DmarcException(
+                DmarcException.LIMIT_EXCEEDED,
+                f"node budget of {self.node_budget} exceeded",
+            )
+        if nodes_left is not None:
+            apg.nodes_left = nodes_left - result.node_hits
+        return result.success
+
+    def _check_tag_list_syntax(self, record: str) -> Tuple[bool, list, list]:
+        if self.fast_tag_list:
+            scanned = scan_tag_list(record)
+            if scanned is not None:
+                return scanned
+        return self._apg_check_tag_list_syntax(record)
+
+    def _apg_check_tag_list_syntax(self, record: str) -> Tuple[bool, list, list]:
+        tag_offsets = []
+        tag_spec_offsets = []
+        success = self._grammar_parse(
+            "tag_list_parser", record, "tag-list", (tag_offsets, tag_spec_offsets)
+        )
+        tag_list = [record[index : index + length] for index, length in tag_offsets]
+        tag_spec_list = [
+            record[index : index + length] for index, length in tag_spec_offsets
+        ]
+        return success, tag_list, tag_spec_list
+
+    def _check_tag_semantics(self, tag_list: list) -> Optional[ParseOutcome]:
+        if len(tag_list) != len(set(tag_list)):
+            return ParseOutcome.error(
                 98, "record is DKIM-defined list of tags contains duplicate tags"
             )
+        return None
 
-    @staticmethod
-    def retrieve_mail_list(tag_value: str) -> Tuple[List[EmailObj], List[str]]:
+    def retrieve_mail_list(self, tag_value: str) -> Tuple[List[EmailObj], List[str]]:
         values = tag_value.split(",")
         values = [value.strip(";") for value in values]
         valid_mailto = []
         other_uris = []
+        mailto_cache = self._mailto_cache
         for value in values:
-            if value.startswith("mailto:"):
-                limit_in_byte = None
-                limit_org = None
-                match = SIZE_LIMIT_REGEX.search(value)
-                if match is not None:
-                    email = value[: match.start()]
-                    limit_org = value[match.start() + 1 :]
-                    limit = match.groupdict().get("limit", None)
-                    if limit is None:
-                        # should never happen
-                        limit = 0
-                    int_limit = int(limit)
-                    byte_char = match.groupdict().get("mult_byte", None)
-                    byte_char = CHAR_TO_BYTE_MAP.get(byte_char, 1)
-                    limit_in_byte = int_limit * byte_char
-                else:
-                    email = value
-                if email.startswith("mailto:"):
-                    email = email[len("mailto:") :]
-                if validators.email(email) is True:
-                    valid_mailto.append(
-                        EmailObj(
-                            email=email.strip(),
-                            limit=limit_in_byte,
-                            limit_org=limit_org,
-                        )
-                    )
-                else:
-                    other_uris.append(value)
+            if mailto_cache is None:
+                email_obj = self._parse_mailto(value)
             else:
+                email_obj = mailto_cache.get(value)
+                if email_obj is MISSING:
+                    email_obj = self._parse_mailto(value)
+                    mailto_cache.put(value, email_obj)
+            if email_obj is None:
                 other_uris.append(value)
+            else:
+                valid_mailto.append(email_obj)
         return valid_mailto, other_uris
 
+    def _parse_mailto(self, value: str) -> Optional[EmailObj]:
+        """EmailObj of a valid `mailto:` URI, None for any other URI."""
+        if not value.startswith("mailto:"):
+            return None
+        limit_in_byte = None
+        limit_org = None
+        match = SIZE_LIMIT_REGEX.search(value)
+        if match is not None:
+            email = value[: match.start()]
+            limit_org = value[match.start() + 1 :]
+            limit = match.groupdict().get("limit", None)
+            if limit is None:
+                # should never happen
+                limit = 0
+            int_limit = int(limit)
+            byte_char = match.groupdict().get("mult_byte", None)
+            byte_char = CHAR_TO_BYTE_MAP.get(byte_char, 1)
+            limit_in_byte = int_limit * byte_char
+        else:
+            email = value
+        if email.startswith("mailto:"):
+            email = email[len("mailto:") :]
+        if not self._is_valid_email(email):
+            return None
+        return EmailObj(
+            email=sys.intern(email.strip()),
+            limit=limit_in_byte,
+            limit_org=limit_org,
+        )
+
     def _process(self, dmarc_tag_parsed: list, dmarc_obj: DmarcObject):
         for i, (abnf_tag_name, tag_value) in enumerate(dmarc_tag_parsed):
             tag_name = ABNF_to_option.get(abnf_tag_name, None)
@@ -261,53 +798,112 @@ class DmarcParser:
         return dmarc_obj
 
     @staticmethod
-    def _dmarc_tag_handler(res, abnf_tag_name: str, dmarc_tag_parsed: list):
+    def _dmarc_tag_handler(res, abnf_tag_name: str):
+        # user_data is the offset list of the current parse
         if res["state"] == MATCH:
-            value = DmarcParser.extract_value(res)
-            dmarc_tag_parsed.append((abnf_tag_name, value))
+            res["user_data"].append(
+                (abnf_tag_name, res["phrase_index"], res["phrase_length"])
+            )
 
-    def _check_dmarc_syntax(
-        self, tag_list: list, tag_spec_list: list, original_record: str
-    ):
-        dmarc_tag_parsed = []
-        dmarc_parser = APGParser(self.dmarc_grammar)
-        dmarc_obj = DmarcObject(original_record=original_record)
+    @staticmethod
+    def _has_dmarc_version(tag_list: list, tag_spec_list: list) -> bool:
+        """Whether the first DMARC tag can match the dmarc-version rule.
+
+        Only looks at the tags up to the first DMARC one, usually the first tag,
+        so that non-DMARC records (SPF, site verifications...) are rejected
+        before any grammar work.
+        """
+        for tag, tag_spec in zip(tag_list, tag_spec_list):
+            if tag.lower() in VALID_DMARC_TAGS_SET:
+                # dmarc-version = "v" *WSP "=" *WSP %x44.4d.41.52.43.31
+                return (
+                    tag.lower() == DMARC1Tag.name()
+                    and SKIP_WSP_REGEX.sub("", tag_spec)[1:] == "=DMARC1"
+                )
+        return False
+
+    @staticmethod
+    def _accept_tags(
+        tag_list: list, tag_spec_list: list
+    ) -> Tuple[List[Tuple[str, str]], List[str], str]:
+        """Split the tag-specs in accepted and ignored tags, whitespace removed.
+
+        Returns the accepted `(tag name, tag)`, the ignored tags and the effective
+        value made of the accepted tags.
+        """
         accepted_tags = []
+        ignored_tags = []
         for tag, tag_value in zip(tag_list, tag_spec_list):
             stripped = SKIP_WSP_REGEX.sub("", tag_value)
             if tag.lower() in VALID_DMARC_TAGS_SET:
-                accepted_tags.append(stripped)
+                accepted_tags.append((tag.lower(), stripped))
             else:
-                dmarc_obj.ignored_tags.append(stripped)
-        effective_value = "".join(f"{accepted};" for accepted in accepted_tags)
+                ignored_tags.append(stripped)
+        effective_value = "".join(f"{accepted};" for _, accepted in accepted_tags)
+        return accepted_tags, ignored_tags, effective_value
+
+    def _check_dmarc_syntax(
+        self, tag_list: list, tag_spec_list: list, original_record: str
+    ) -> Tuple[bool, list, Optional[DmarcObject]]:
+        """Validate each accepted tag against its own dmarc-* rule.
+
+        Equivalent to parsing the effective value with the dmarc-record rule:
+        with the whitespace stripped, each alternative of dmarc-record only
+        matches the tag of the same name, dmarc-version only in first position.
+        Records without the version tag fail without a DmarcObject.
+        """
+        dmarc_tag_parsed = []
+        if not self._has_dmarc_version(tag_list, tag_spec_list):
+            return False, dmarc_tag_parsed, None
+        dmarc_obj = DmarcObject(original_record=original_record)
+        accepted_tags, dmarc_obj.ignored_tags, dmarc_obj.effective_value = (
+            self._accept_tags(tag_list, tag_spec_list)
+        )
+        if len(accepted_tags) == 0:
+            return False, dmarc_tag_parsed, dmarc_obj
+        for i, (tag, stripped) in enumerate(accepted_tags):
+            if (i == 0) != (tag == DMARC1Tag.name()):
+                return False, dmarc_tag_parsed, dmarc_obj
+            abnf_tag_name = OPTION_to_ABNF[tag]
+            if not self._grammar_parse("dmarc_tag_parser", stripped, abnf_tag_name):
+                return False, dmarc_tag_parsed, dmarc_obj
+            dmarc_tag_parsed.append((abnf_tag_name, stripped))
+        return True, dmarc_tag_parsed, dmarc_obj
+
+    def _apg_check_dmarc_record_syntax(
+        self, tag_list: list, tag_spec_list: list, original_record: str
+    ) -> Tuple[bool, list, DmarcObject]:
+        dmarc_tag_offsets = []
+        dmarc_obj = DmarcObject(original_record=original_record)
+        _, dmarc_obj.ignored_tags, effective_value = self._accept_tags(
+            tag_list, tag_spec_list
+        )
         dmarc_obj.effective_value = effective_value
-        cb_dict = {
-            abnf_tag_name: functools.partial(
-                self._dmarc_tag_handler,
-                abnf_tag_name=abnf_tag_name,
-                dmarc_tag_parsed=dmarc_tag_parsed,
-            )
-            for abnf_tag_name in ABNF_to_option.keys()
-        }
-        dmarc_parser.add_callbacks(cb_dict)
-        result = dmarc_parser.parse(
-            apg_util.string_to_tuple(effective_value), start_rule="dmarc-record"
+        success = self._grammar_parse(
+            "dmarc_record_parser", effective_value, "dmarc-record", dmarc_tag_offsets
         )
-        return result, dmarc_tag_parsed, dmarc_obj
+        dmarc_tag_parsed = [
+            (abnf_tag_name, effective_value[index : index + length])
+            for abnf_tag_name, index, length in dmarc_tag_offsets
+        ]
+        return success, dmarc_tag_parsed, dmarc_obj
 
-    def _dmarc_semantic_check(self, dmarc_obj: DmarcObject, follow_downgrade: bool):
+    def _dmarc_semantic_check(
+        self, dmarc_obj: DmarcObject, follow_downgrade: bool
+    ) -> Optional[ParseOutcome]:
+        """Check and complete `dmarc_obj`, returns the failed outcome if invalid."""
         if dmarc_obj.v.index != 0:
             # should never happen thanks to abnf
-            raise DmarcException(97, "version must appear as the first tag")
+            return ParseOutcome.error(97, "version must appear as the first tag")
 
         if not dmarc_obj.p.provided and not follow_downgrade:
-            raise DmarcException(97, "p not provided")
+            return ParseOutcome.error(97, "p not provided")
 
         if dmarc_obj.p.provided and dmarc_obj.p.index != 1:
-            raise DmarcException(
+            return ParseOutcome.error(
                 97,
-                f"p provided but appeared in other than second "
-                f"position (i={dmarc_obj.p.index}",
+                "p provided but appeared in other than second position (i={}",
+                dmarc_obj.p.index,
             )
 
         if not dmarc_obj.sp.provided and dmarc_obj.p.effective_value in POLICY_VALUES:
@@ -318,8 +914,8 @@ class DmarcParser:
             or dmarc_obj.pct.effective_value < 0
             or dmarc_obj.pct.effective_value > 100
         ):
-            raise DmarcException(
-                95, f"pct value {dmarc_obj.pct.effective_value} is not valid"
+            return ParseOutcome.error(
+                95, "pct value {} is not valid", dmarc_obj.pct.effective_value
             )
 
         p_provided_and_invalid = (
@@ -342,30 +938,485 @@ class DmarcParser:
 
         if not p_downgrade:
             if not dmarc_obj.p.provided:
-                raise DmarcException(
+                return ParseOutcome.error(
                     99, "Even if downgraded is true, p value was missing and no rua."
                 )
             if p_provided_and_invalid:
-                raise DmarcException(99, f"p value was {dmarc_obj.sp.effective_value}")
+                return ParseOutcome.error(
+                    99, "p value was {}", dmarc_obj.sp.effective_value
+                )
             elif sp_provided_and_invalid:
-                raise DmarcException(99, f"sp value was {dmarc_obj.sp.effective_value}")
-
-    def parse(self, record: str, follow_downgrade: bool = True) -> DmarcObject:
-        tag_result, tag_list, tag_spec_list = self._check_tag_list_syntax(record)
-        if tag_result.success:
-            self._check_tag_semantics(tag_list)
-            dmarc_result, dmarc_tag_parsed, dmarc_obj = self._check_dmarc_syntax(
-                tag_list, tag_spec_list, record
+                return ParseOutcome.error(
+                    99, "sp value was {}", dmarc_obj.sp.effective_value
+                )
+        return None
+
+    def cache_info(self) -> CacheInfo:
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def parse(self, record: TRecord, follow_downgrade: bool = True) -> TDmarcResult:
+        """Parse a DMARC record, raises DmarcException if it is invalid.
+
+        The record can be the bytes of a TXT record, as DNS libraries return it.
+        They are decoded as latin-1: one character per byte, any non-ASCII byte
+        then failing the grammar like a non-ASCII character does.
+        """
+        outcome = self._parse_cached(record, follow_downgrade)
+        observer = self.observer
+        if isinstance(outcome, ParseOutcome):
+            if observer is not None:
+                observer.on_outcome(outcome.error_code)
+            raise outcome.exception()
+        if observer is not None:
+            observer.on_outcome(None)
+        return outcome
+
+    def parse_result(
+        self, record: TRecord, follow_downgrade: bool = True
+    ) -> ParseOutcome:
+        """Same as `parse`, but never raises.
+
+        Returns a ParseOutcome holding the result, or the error code and message
+        `parse` would raise. A failure costs neither an exception nor the
+        formatting of its message, which suits inputs that are mostly invalid.
+        """
+        outcome = self._parse_cached(record, follow_downgrade)
+        observer = self.observer
+        if isinstance(outcome, ParseOutcome):
+            if observer is not None:
+                observer.on_outcome(outcome.error_code)
+            return outcome
+        if observer is not None:
+            observer.on_outcome(None)
+        return ParseOutcome(outcome)
+
+    def parse_outcome(
+        self, record: TRecord, follow_downgrade: bool = True
+    ) -> Union[TDmarcResult, DmarcException]:
+        """Same as `parse`, but returns the DmarcException instead of raising it."""
+        outcome = self.parse_result(record, follow_downgrade)
+        if outcome.error_code is not None:
+            return outcome.exception()
+        return outcome.result
+
+    def check_tag_list(self, record: TRecord) -> bool:
+        """Whether `record` is a DKIM-defined tag-list, whatever its tags.
+
+        A record exceeding the limits of the parser is not. Never raises.
+        """
+        if isinstance(record, bytes):
+            record = record.decode("latin-1")
+        if self._length_error(record) is not None:
+            return False
+        self._start_budget()
+        try:
+            return self._check_tag_list_syntax(record)[0]
+        except DmarcException:
+            return False
+
+    def _parse_cached(
+        self, record: TRecord, follow_downgrade: bool
+    ) -> Union[TDmarcResult, ParseOutcome]:
+        """Result of `record` or its failed ParseOutcome."""
+        if isinstance(record, bytes):
+            record = record.decode("latin-1")
+        error = self._length_error(record)
+        if error is not None:
+            return error
+        if self._cache is None:
+            outcome = self._parse_checked(record, follow_downgrade)
+            if self.compact_results and isinstance(outcome, DmarcObject):
+                return outcome.freeze()
+            return outcome
+        if self.canonical_cache:
+            key = (canonicalize(record), follow_downgrade)
+        else:
+            key = (record, follow_downgrade)
+        outcome = self._cache.get(key)
+        if outcome is MISSING:
+            outcome = self._parse_checked(record, follow_downgrade)
+            if self.compact_results and isinstance(outcome, DmarcObject):
+                outcome = outcome.freeze()
+            # running out of time depends on the load, not on the record
+            if not self._apg.deadline_exceeded:
+                self._cache.put(key, outcome)
+        if isinstance(outcome, ParseOutcome):
+            return outcome
+        # a mutable cached outcome is never handed out, callers may modify their copy
+        result = outcome.copy()
+        if result.original_record != record:
+            # cached from another variant of the record
+            return self._replace_record(result, record)
+        return result
+
+    def _length_error(self, record: str) -> Optional[ParseOutcome]:
+        if 0 < self.max_record_length < len(record):
+            return ParseOutcome.error(
+                DmarcException.LIMIT_EXCEEDED,
+                "record of {} characters is longer than {}",
+                len(record),
+                self.max_record_length,
             )
-            if dmarc_result.success:
-                self._process(dmarc_tag_parsed, dmarc_obj)
-                self._dmarc_semantic_check(dmarc_obj, follow_downgrade)
-                return dmarc_obj
-            else:
-                raise DmarcException(
+        return None
+
+    def _replace_record(self, result: TDmarcResult, record: str) -> TDmarcResult:
+        """Result of `record`, a variant of `result.original_record` with the same
+        canonical form, only the raw strings differ. A DmarcObject is modified."""
+        # the raw strings are only split, the budgets do not apply
+        self._apg.nodes_left = self._apg.deadline = None
+        _, tag_list, tag_spec_list = self._check_tag_list_syntax(record)
+        _, ignored_tags, effective_value = self._accept_tags(tag_list, tag_spec_list)
+        if isinstance(result, DmarcResult):
+            return result.replace_record(record, effective_value, tuple(ignored_tags))
+        result.original_record = record
+        result.ignored_tags = ignored_tags
+        result.effective_value = effective_value
+        return result
+
+    def _phase(self, phase: str, func, *args):
+        observer = self.observer
+        if observer is None:
+            return func(*args)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            observer.on_phase(phase, time.perf_counter() - start)
+
+    def _parse_checked(
+        self, record: str, follow_downgrade: bool
+    ) -> Union[DmarcObject, ParseOutcome]:
+        try:
+            self._start_budget()
+            tag_success, tag_list, tag_spec_list = self._phase(
+                PHASE_TAG_LIST_SYNTAX, self._check_tag_list_syntax, record
+            )
+            if not tag_success:
+                return ParseOutcome.error(99, "record is not DKIM-defined list of tags")
+            error = self._check_tag_semantics(tag_list)
+            if error is not None:
+                return error
+            dmarc_success, dmarc_tag_parsed, dmarc_obj = self._phase(
+                PHASE_DMARC_SYNTAX,
+                self._check_dmarc_syntax,
+                tag_list,
+                tag_spec_list,
+                record,
+            )
+            if not dmarc_success:
+                return ParseOutcome.error(
                     98,
                     "record is DKIM-defined list of tags but not a valid DMARC record",
                 )
+            self._phase(PHASE_PROCESS, self._process, dmarc_tag_parsed, dmarc_obj)
+            self._check_deadline()
+            error = self._phase(
+                PHASE_SEMANTIC_CHECK,
+                self._dmarc_semantic_check,
+                dmarc_obj,
+                follow_downgrade,
+            )
+            return dmarc_obj if error is None else error
+        except DmarcException as e:
+            # a budget exceeded, or raised by _process for inconsistencies that
+            # should never happen
+            return ParseOutcome.error(e.code, e.value)
+
+    def parse_columns(
+        self,
+        records: Iterable[TRecord],
+        follow_downgrade: bool = True,
+        workers: int = 1,
+        chunksize: int = 64,
+        use_numpy: Optional[bool] = None,
+    ) -> "DmarcColumns":
+        """Parse records into one column per field, see DmarcColumns.
 
+        No result object is kept: each outcome is appended to the column
+        buffers as soon as parsed. `workers` and `chunksize` are those of
+        `parse_many`, `use_numpy` those of `ColumnBuilder.build`.
+        """
+        from dmarcparser.columnar import ColumnBuilder
+
+        builder = ColumnBuilder()
+        if workers <= 1:
+            for record in records:
+                outcome = self.parse_result(record, follow_downgrade)
+                if outcome.error_code is None:
+                    builder.add_result(outcome.result)
+                else:
+                    builder.add_error(outcome.error_code)
         else:
-            raise DmarcException(99, "record is not DKIM-defined list of tags")
+            for outcome in self.parse_many(
+                records, follow_downgrade, workers=workers, chunksize=chunksize
+            ):
+                if isinstance(outcome, DmarcException):
+                    builder.add_error(outcome.code)
+                else:
+                    builder.add_result(outcome)
+        return builder.build(use_numpy)
+
+    def parse_batch(
+        self,
+        records: Iterable[TRecord],
+        follow_downgrade: bool = True,
+        canonical: bool = False,
+        workers: int = 1,
+        chunksize: int = 64,
+    ) -> Tuple[List[Union[DmarcResult, DmarcException]], "BatchStats"]:
+        """Parse each distinct record once and return the outcomes in input order.
+
+        Records are grouped by exact string, or by canonical form (see
+        `canonicalize`) if `canonical` is set. The outcome of each group, a
+        DmarcResult or DmarcException, is shared by all its records; with
+        `canonical`, variants get their own DmarcResult sharing the tags, with
+        their raw strings. Distinct records are parsed with `parse_many`.
+        """
+        start = time.perf_counter()
+        slots = {}
+        slot_of_records = []
+        group_of_slots = []
+        groups = {}
+        representatives = []
+        for record in records:
+            if isinstance(record, bytes):
+                record = record.decode("latin-1")
+            slot = slots.get(record)
+            if slot is None:
+                slot = slots[record] = len(slots)
+                if canonical and self._length_error(record) is None:
+                    key = canonicalize(record)
+                else:
+                    # a record too long is not a variant of a shorter one
+                    key = record
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = len(representatives)
+                    representatives.append(record)
+                group_of_slots.append(group)
+            slot_of_records.append(slot)
+        group_outcomes = []
+        for outcome in self.parse_many(
+            representatives, follow_downgrade, workers=workers, chunksize=chunksize
+        ):
+            if isinstance(outcome, DmarcObject):
+                outcome = outcome.freeze()
+            group_outcomes.append(outcome)
+        slot_outcomes = []
+        for record, group in zip(slots, group_of_slots):
+            outcome = group_outcomes[group]
+            if isinstance(outcome, DmarcResult) and outcome.original_record != record:
+                outcome = self._replace_record(outcome, record)
+            slot_outcomes.append(outcome)
+        outcomes = [slot_outcomes[slot] for slot in slot_of_records]
+        invalid = sum(isinstance(outcome, DmarcException) for outcome in outcomes)
+        stats = BatchStats(
+            records=len(outcomes),
+            distinct=len(slots),
+            parsed=len(representatives),
+            valid=len(outcomes) - invalid,
+            invalid=invalid,
+            elapsed=time.perf_counter() - start,
+        )
+        return outcomes, stats
+
+    def parse_rrset(
+        self,
+        txt_records: Iterable[Union[TRecord, Iterable[TRecord]]],
+        follow_downgrade: bool = True,
+    ) -> Optional[TDmarcResult]:
+        """Parse the DMARC record of an RRset, None if there is none.
+
+        See `select_dmarc_record`, raises DmarcException if the RRset contains
+        several DMARC records or if the DMARC record is invalid.
+        """
+        record = select_dmarc_record(txt_records)
+        if record is None:
+            return None
+        return self.parse(record, follow_downgrade)
+
+    def parse_txt(
+        self, chunks: Sequence[TRecord], follow_downgrade: bool = True
+    ) -> TDmarcResult:
+        """Parse the character-strings of a TXT record as one record.
+
+        Chunks with a NUL (code BACKSLAH_ZERO) or a non-ASCII character (code 99,
+        as `parse` reports it) are rejected before being joined or decoded.
+        """
+        error = _check_txt(chunks)
+        if error is not None:
+            if self.observer is not None:
+                self.observer.on_outcome(error.error_code)
+            raise error.exception()
+        if len(chunks) == 1:
+            record = chunks[0]
+        elif all(isinstance(chunk, bytes) for chunk in chunks):
+            record = b"".join(chunks)
+        else:
+            record = "".join(
+                chunk.decode("latin-1") if isinstance(chunk, bytes) else chunk
+                for chunk in chunks
+            )
+        return self.parse(record, follow_downgrade)
+
+    def parse_txt_rrsets(
+        self,
+        rrsets: Iterable[Iterable[Union[TRecord, Sequence[TRecord]]]],
+        follow_downgrade: bool = True,
+        workers: int = 1,
+        chunksize: int = 64,
+    ) -> List[Optional[Union[TDmarcResult, DmarcException]]]:
+        """Parse the DMARC record of each RRset, as `parse_rrset` and `parse_txt`.
+
+        Returns one outcome per RRset, in order: None when it has no DMARC
+        record, the DmarcException for several DMARC records or an invalid one.
+        The selected records are parsed with `parse_many`.
+        """
+        outcomes = []
+        positions = []
+        records = []
+        for rrset in rrsets:
+            try:
+                record = select_dmarc_record(rrset)
+            except DmarcException as e:
+                outcomes.append(e)
+                continue
+            error = None if record is None else _check_txt((record,))
+            if error is not None:
+                outcomes.append(error.exception())
+                continue
+            if record is not None:
+                positions.append(len(outcomes))
+                records.append(record)
+            outcomes.append(None)
+        parsed = self.parse_many(
+            records, follow_downgrade, workers=workers, chunksize=chunksize
+        )
+        for position, outcome in zip(positions, parsed):
+            outcomes[position] = outcome
+        return outcomes
+
+    def parse_many(
+        self,
+        records: Iterable[TRecord],
+        follow_downgrade: bool = True,
+        workers: int = 1,
+        chunksize: int = 64,
+    ) -> Iterator[Union[TDmarcResult, DmarcException]]:
+        """Parse records lazily, yielding one outcome per record in input order.
+
+        The outcome is the DmarcObject, or the DmarcException raised for an invalid
+        record. With `workers` > 1, chunks of `chunksize` records are parsed in a
+        pool of processes each holding its own parser configured like this one;
+        only a few chunks per worker are in flight so that `records` can be a
+        stream.
+        """
+        if workers <= 1:
+            for record in records:
+                yield self.parse_outcome(record, follow_downgrade)
+            return
+        parser_options = {
+            "fast_tag_list": self.fast_tag_list,
+            "cache_size": self.cache_size,
+            "canonical_cache": self.canonical_cache,
+            "compact_results": self.compact_results,
+            "mailto_cache_size": self.mailto_cache_size,
+            "builtin_email_validator": self.builtin_email_validator,
+            "max_record_length": self.max_record_length,
+            "node_budget": self.node_budget,
+            "time_budget": self.time_budget,
+            "engine": self.engine,
+        }
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_parser,
+            initargs=(parser_options,),
+        ) as executor:
+            pending = deque()
+            iter_records = iter(records)
+            while True:
+                chunk = list(itertools.islice(iter_records, chunksize))
+                if len(chunk) == 0:
+                    break
+                pending.append(executor.submit(_parse_chunk, chunk, follow_downgrade))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+class BatchStats(NamedTuple):
+    """Counts of a DmarcParser.parse_batch call."""
+
+    records: int
+    distinct: int
+    parsed: int
+    valid: int
+    invalid: int
+    elapsed: float
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Records per record actually parsed."""
+        return self.records / self.parsed if self.parsed else 1.0
+
+
+_worker_parser: Optional[DmarcParser] = None
+
+
+def _init_worker_parser(parser_options: dict) -> None:
+    # grammars are loaded once per worker process
+    global _worker_parser
+    _worker_parser = DmarcParser(**parser_options)
+
+
+def _parse_chunk(
+    records: List[str], follow_downgrade: bool
+) -> List[Union[TDmarcResult, DmarcException]]:
+    if _worker_parser is None:
+        # executor created without _init_worker_parser as initializer
+        _init_worker_parser({})
+    return [
+        _worker_parser.parse_outcome(record, follow_downgrade) for record in records
+    ]
+
+
+# exercises every lazily imported module and every lazily built table
+_PRELOAD_RECORD = (
+    "v=DMARC1; p=reject; sp=none; pct=50; adkim=s; aspf=r; fo=0:1:d:s; rf=afrf;"
+    " ri=3600; rua=https://example.com/r!10m,mailto:a@example.com;"
+    " ruf=mailto:b@example.com"
+)
+
+
+def preload(engines: Sequence[str] = ENGINES, freeze: bool = True) -> None:
+    """Load the grammars and parser state of this process before forking.
+
+    Loads the grammars and the recognizers of `engines`, imports the APG parser
+    and validators, and parses a record with each engine so that every lazy
+    import and table is in place. Processes forked afterwards, such as the
+    `parse_many` workers or the children of a prefork server, then share this
+    memory copy-on-write instead of each loading their own copy.
+
+    With `freeze`, the objects of the process are moved to the permanent
+    generation of the garbage collector (`gc.freeze`) so that collections in the
+    children never write to the pages holding them. Call it last, right before
+    forking. Ignored by interpreters without `gc.freeze` (PyPy).
+    """
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"unknown engine {engine}")
+    for engine in engines:
+        DmarcParser(engine=engine).parse_outcome(_PRELOAD_RECORD)
+    if freeze and hasattr(gc, "freeze"):
+        # collect first, the garbage of the loading would be frozen with the rest
+        gc.collect()
+        gc.freeze()
@@ -0,0 +1,199 @@
+"""Verification of external report destinations, RFC 7489 7.1.
+
+A `mailto:` URI of `rua` or `ruf` whose host is outside the organizational
+domain of the policy domain only receives reports if the destination publishes
+a DMARC record at `<policy domain>._report._dmarc.<destination host>`.
+`ReportVerifier` runs these lookups for batches of parsed records, once per
+distinct (policy domain, destination host) pair, concurrently through a
+`dmarcparser.discovery.Resolver`, and caches their outcome for its TTL.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from dmarcparser.cache import CacheInfo
+from dmarcparser.discovery import (
+    PublicSuffixList,
+    Resolver,
+    ResolverError,
+    TOutcome,
+    TxtAnswer,
+    _TxtLookups,
+    normalize_domain,
+)
+from dmarcparser.parser import (
+    DMARC_CANDIDATE_REGEX,
+    VALID_DMARC_TAGS,
+    DmarcException,
+    DmarcParser,
+    DmarcResult,
+    txt_string,
+)
+from dmarcparser.tags import EmailObj, RUTag
+
+
+class ReportVerifier:
+    """Annotate the `rua`/`ruf` addresses of parsed records with `authorized`.
+
+    An address is authorized when its host shares the organizational domain of
+    the policy domain, or when a TXT record starting with `v=DMARC1` and forming
+    a valid tag-list is published at `<policy domain>._report._dmarc.<host>`.
+    It is not authorized when no such record exists, and left unknown (None)
+    after a ResolverError, which is not cached.
+    """
+
+    def __init__(
+        self,
+        resolver: Resolver,
+        public_suffixes: Optional[PublicSuffixList] = None,
+        parser: Optional[DmarcParser] = None,
+        max_concurrency: int = 100,
+        cache_size: int = 100_000,
+        min_ttl: float = 0,
+        max_ttl: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param public_suffixes: determines the organizational domains, by default
+            the last two labels of a domain (see PublicSuffixList).
+        :param parser: checks the tag-list syntax of the authorization records.
+        :param max_concurrency: maximum number of lookups in flight.
+        :param cache_size: number of (policy domain, destination host) pairs
+            cached. Disabled with 0.
+        """
+        self.public_suffixes = public_suffixes or PublicSuffixList()
+        self.parser = parser or DmarcParser()
+        self._lookups = _TxtLookups(
+            resolver,
+            self._interpret,
+            max_concurrency,
+            cache_size,
+            min_ttl,
+            max_ttl,
+            clock,
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """Hits and misses of the lookups, expired entries count as misses."""
+        return self._lookups.cache_info()
+
+    def cache_clear(self) -> None:
+        self._lookups.cache_clear()
+
+    def is_external(self, policy_domain: str, host: str) -> bool:
+        """Whether reports for `policy_domain` sent to `host` need authorization."""
+        policy_domain = normalize_domain(policy_domain)
+        host = normalize_domain(host)
+        policy_org = self.public_suffixes.organizational_domain(policy_domain)
+        host_org = self.public_suffixes.organizational_domain(host)
+        return (policy_org or policy_domain) != (host_org or host)
+
+    async def is_authorized(self, policy_domain: str, host: str) -> Optional[bool]:
+        """Whether `host` accepts the reports of `policy_domain`, None if unknown."""
+        policy_domain = normalize_domain(policy_domain)
+        host = normalize_domain(host)
+        if not self.is_external(policy_domain, host):
+            return True
+        if host.startswith("["):
+            # address literal, there is no name to query
+            return False
+        try:
+            return await self._lookups.get(f"{policy_domain}._report._dmarc.{host}")
+        except ResolverError:
+            return None
+
+    async def verify(
+        self, batch: Iterable[Tuple[str, Optional[TOutcome]]]
+    ) -> List[Optional[TOutcome]]:
+        """Annotate the outcomes of a batch of (policy domain, outcome) pairs.
+
+        Returns the outcomes in order. The addresses of a DmarcObject are
+        replaced in place by annotated copies, a DmarcResult is replaced by a
+        new result; exceptions and None are returned unchanged. The annotated
+        copies of an address are shared within the batch. An error other than
+        ResolverError cancels the remaining lookups and is raised.
+        """
+        batch = list(batch)
+        pairs = list(
+            {
+                (normalize_domain(policy_domain), normalize_domain(email_obj.host))
+                for policy_domain, outcome in batch
+                for tag in _report_tags(outcome)
+                for email_obj in tag.valid
+            }
+        )
+        lookups = [
+            asyncio.ensure_future(self.is_authorized(policy_domain, host))
+            for policy_domain, host in pairs
+        ]
+        try:
+            results = await asyncio.gather(*lookups)
+        except BaseException:
+            # an unexpected error of the resolver, or the caller was cancelled
+            for lookup in lookups:
+                lookup.cancel()
+            raise
+        authorized = dict(zip(pairs, results))
+        annotated: Dict[Tuple[EmailObj, Optional[bool]], EmailObj] = {}
+        return [
+            self._annotate(
+                normalize_domain(policy_domain), outcome, authorized, annotated
+            )
+            for policy_domain, outcome in batch
+        ]
+
+    def _annotate(
+        self,
+        policy_domain: str,
+        outcome: Optional[TOutcome],
+        authorized: Dict[Tuple[str, str], Optional[bool]],
+        annotated: Dict[Tuple[EmailObj, Optional[bool]], EmailObj],
+    ) -> Optional[TOutcome]:
+        tags = _report_tags(outcome)
+        if not tags:
+            return outcome
+        valid = {}
+        for tag in tags:
+            valid[tag.name()] = emails = []
+            for email_obj in tag.valid:
+                key = (
+                    email_obj,
+                    authorized[policy_domain, normalize_domain(email_obj.host)],
+                )
+                if key not in annotated:
+                    annotated[key] = email_obj.with_authorized(key[1])
+                emails.append(annotated[key])
+        if not isinstance(outcome, DmarcResult):
+            for tag in tags:
+                tag.valid[:] = valid[tag.name()]
+            return outcome
+        frozen_tags = []
+        for tag_name in VALID_DMARC_TAGS:
+            tag = outcome[tag_name]
+            if tag_name in valid:
+                tag = tag.copy()
+                tag.valid = valid[tag_name]
+                tag = tag.freeze()
+            frozen_tags.append(tag)
+        return DmarcResult(
+            frozen_tags,
+            outcome.ignored_tags,
+            outcome.original_record,
+            outcome.effective_value,
+        )
+
+    def _interpret(self, answer: TxtAnswer) -> bool:
+        for txt_record in map(txt_string, answer.records):
+            if DMARC_CANDIDATE_REGEX.match(txt_record) is None:
+                continue
+            if self.parser.check_tag_list(txt_record):
+                return True
+        return False
+
+
+def _report_tags(outcome: Union[TOutcome, None]) -> List[RUTag]:
+    """The `rua` and `ruf` tags of an outcome with addresses."""
+    if outcome is None or isinstance(outcome, DmarcException):
+        return []
+    return [tag for tag in (outcome.rua, outcome.ruf) if tag.valid]
@@ -1,9 +1,19 @@
-from typing import List, Generic, TypeVar, Union, Optional
+import sys
+from functools import lru_cache
+from typing import List, Generic, TypeVar, Union, Optional, Tuple
 
 TTag = TypeVar("TTag", str, None, int, List[str])
 
 
+@lru_cache(maxsize=None)
+def _slot_names(cls) -> Tuple[str, ...]:
+    return tuple(
+        slot for klass in cls.__mro__ for slot in klass.__dict__.get("__slots__", ())
+    )
+
+
 class DmarcTag(Generic[TTag]):
+    __slots__ = ("_value", "_index")
     _name: str
     _default_value: TTag
     _optional: bool
@@ -60,6 +70,38 @@ class DmarcTag(Generic[TTag]):
     def provided(self) -> bool:
         return self._value is not None
 
+    def is_default(self) -> bool:
+        """True if the tag is in the state of a tag not found in the record."""
+        return self._value is None and self._index is None
+
+    def copy(self):
+        """Modifiable copy of the tag, including of a frozen tag."""
+        cls = getattr(self, "_thawed_class", type(self))
+        tag = cls.__new__(cls)
+        for slot in _slot_names(cls):
+            setattr(tag, slot, getattr(self, slot))
+        if isinstance(self._value, (list, tuple)):
+            tag._value = list(self._value)
+        return tag
+
+    def freeze(self):
+        """Make the tag read-only, list values become tuples.
+
+        String values come from a handful of keywords and are interned so that
+        frozen tags share them.
+        """
+        if isinstance(self, FrozenDmarcTag):
+            return self
+        if isinstance(self._value, str):
+            self._value = sys.intern(self._value)
+        elif isinstance(self._value, list):
+            self._value = tuple(
+                sys.intern(value) if isinstance(value, str) else value
+                for value in self._value
+            )
+        object.__setattr__(self, "__class__", _frozen_class(type(self)))
+        return self
+
     def provided_same_as_default(self) -> bool:
         if not self.provided:
             return True
@@ -67,15 +109,53 @@ class DmarcTag(Generic[TTag]):
             return self.default_value() == self.value
 
 
+class FrozenDmarcTag:
+    """Mixin of the read-only variant of each tag class, see DmarcTag.freeze."""
+
+    __slots__ = ()
+    _thawed_class: type
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self._thawed_class.__name__} is frozen")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self._thawed_class.__name__} is frozen")
+
+    def __reduce__(self):
+        state = tuple(getattr(self, slot) for slot in _slot_names(self._thawed_class))
+        return _unpickle_frozen_tag, (self._thawed_class, state)
+
+
+@lru_cache(maxsize=None)
+def _frozen_class(cls):
+    if issubclass(cls, FrozenDmarcTag):
+        return cls
+    return type(
+        f"Frozen{cls.__name__}",
+        (FrozenDmarcTag, cls),
+        {"__slots__": (), "_thawed_class": cls, "__module__": cls.__module__},
+    )
+
+
+def _unpickle_frozen_tag(cls, state):
+    tag = cls.__new__(cls)
+    for slot, value in zip(_slot_names(cls), state):
+        setattr(tag, slot, value)
+    return tag.freeze()
+
+
 class OptionalDmarcTag(DmarcTag[TTag]):
+    __slots__ = ()
     _optional = True
 
 
 class RequiredDmarcTag(DmarcTag[TTag]):
+    __slots__ = ()
     _optional = False
 
 
 class DMARC1Tag(RequiredDmarcTag[str]):
+    __slots__ = ()
     _name = "v"
 
     def __str__(self):
@@ -87,6 +167,7 @@ class DMARC1Tag(RequiredDmarcTag[str]):
 
 
 class PTag(RequiredDmarcTag[str]):
+    __slots__ = ("_downgraded",)
     _name = "p"
     _default_value = "none"
 
@@ -94,6 +175,9 @@ class PTag(RequiredDmarcTag[str]):
         super().__init__()
         self.downgraded = False
 
+    def is_default(self) -> bool:
+        return super().is_default() and not self._downgraded
+
     @property
     def downgraded(self):
         return self._downgraded
@@ -114,6 +198,7 @@ class PTag(RequiredDmarcTag[str]):
 
 
 class SPTag(OptionalDmarcTag[str]):
+    __slots__ = ("_inherited_value",)
     _name = "sp"
     _default_value = None
 
@@ -121,6 +206,9 @@ class SPTag(OptionalDmarcTag[str]):
         super().__init__()
         self.inherited = None
 
+    def is_default(self) -> bool:
+        return super().is_default() and self._inherited_value is None
+
     @property
     def inherited(self):
         return self._inherited_value
@@ -138,16 +226,19 @@ class SPTag(OptionalDmarcTag[str]):
 
 
 class ADKIMTag(OptionalDmarcTag[str]):
+    __slots__ = ()
     _name = "adkim"
     _default_value = "r"
 
 
 class ASPFTag(OptionalDmarcTag[str]):
+    __slots__ = ()
     _name = "aspf"
     _default_value = "r"
 
 
 class FOTag(OptionalDmarcTag[List[str]]):
+    __slots__ = ()
     _name = "fo"
     _default_value = ["0"]
 
@@ -158,20 +249,46 @@ class FOTag(OptionalDmarcTag[List[str]]):
 
 
 class RFTag(OptionalDmarcTag[str]):
+    __slots__ = ()
     _name = "rf"
     _default_value = "afrf"
 
 
 class RITag(OptionalDmarcTag[int]):
+    __slots__ = ()
     _name = "ri"
     _default_value = 86400
 
 
 class EmailObj:
-    def __init__(self, email: str, limit: Optional[int], limit_org: Optional[str]):
-        self._email = email
-        self._limit = limit
-        self._limit_org = limit_org
+    """Read-only, instances are shared between the tags using the same address.
+
+    `authorized` is None until the address is verified as a report destination
+    of a policy domain (see `dmarcparser.reporting`), which annotates copies.
+    """
+
+    __slots__ = ("_email", "_limit", "_limit_org", "_authorized")
+
+    def __init__(
+        self,
+        email: str,
+        limit: Optional[int],
+        limit_org: Optional[str],
+        authorized: Optional[bool] = None,
+    ):
+        object.__setattr__(self, "_email", email)
+        object.__setattr__(self, "_limit", limit)
+        object.__setattr__(self, "_limit_org", limit_org)
+        object.__setattr__(self, "_authorized", authorized)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EmailObj is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("EmailObj is read-only")
+
+    def __reduce__(self):
+        return EmailObj, (self._email, self._limit, self._limit_org, self._authorized)
 
     @property
     def email(self) -> str:
@@ -185,6 +302,19 @@ class EmailObj:
     def limit_org(self) -> str:
         return self._limit_org
 
+    @property
+    def authorized(self) -> Optional[bool]:
+        return self._authorized
+
+    @property
+    def host(self) -> str:
+        """Domain part of the address, the destination host of RFC 7489 7.1."""
+        return self._email.rpartition("@")[2]
+
+    def with_authorized(self, authorized: Optional[bool]) -> "EmailObj":
+        """Copy of the address with the `authorized` annotation."""
+        return EmailObj(self._email, self._limit, self._limit_org, authorized)
+
     def __str__(self):
         if self.limit is None:
             return self.email
@@ -196,6 +326,7 @@ class EmailObj:
 
 
 class RUTag(OptionalDmarcTag[List[str]]):
+    __slots__ = ("valid", "other")
     _default_value = []
 
     def __init__(self):
@@ -203,6 +334,23 @@ class RUTag(OptionalDmarcTag[List[str]]):
         self.valid: List[EmailObj] = []
         self.other: List[str] = []
 
+    def is_default(self) -> bool:
+        return super().is_default() and not self.valid and not self.other
+
+    def copy(self):
+        tag = super().copy()
+        # EmailObj are not modifiable and can be shared
+        tag.valid = list(self.valid)
+        tag.other = list(self.other)
+        return tag
+
+    def freeze(self):
+        if isinstance(self, FrozenDmarcTag):
+            return self
+        self.valid = tuple(self.valid)
+        self.other = tuple(self.other)
+        return super().freeze()
+
     def value_to_str(self):
         if len(self.valid) == 0:
             return None
@@ -214,14 +362,17 @@ class RUTag(OptionalDmarcTag[List[str]]):
 
 
 class RUATag(RUTag):
+    __slots__ = ()
     _name = "rua"
 
 
 class RUFTag(RUTag):
+    __slots__ = ()
     _name = "ruf"
 
 
 class PCTTag(OptionalDmarcTag[int]):
+    __slots__ = ()
     _name = "pct"
     _default_value = 100
 
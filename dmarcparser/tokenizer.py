@@ -0,0 +1,40 @@
+import re
+from typing import List, Optional, Tuple
+
+# Restricted to printable ASCII, SP and HTAB, the DKIM tag-list grammar reduces to:
+#   tag-list = tag-spec *( ";" tag-spec ) [ ";" *WSP ]
+#   tag-spec = *WSP tag-name *WSP "=" *( VALCHAR / WSP )
+# since FWSDKIM can only match 1*WSP without CRLF, and VALCHAR / WSP then covers
+# every character except ";". Anything else (folding whitespace, control
+# characters, non-ASCII) is left to the APG parser.
+UNCLASSIFIABLE_REGEX = re.compile(r"[^\t\x20-\x7e]")
+TAG_SPEC_REGEX = re.compile(r"[ \t]*(?P<name>[A-Za-z][A-Za-z0-9_]*)[ \t]*=[^;]*")
+TRAILING_WSP_REGEX = re.compile(r"[ \t]*")
+
+
+def scan_tag_list(record: str) -> Optional[Tuple[bool, List[str], List[str]]]:
+    """Linear time equivalent of parsing `record` with the `tag-list` rule.
+
+    Returns `(success, tag_list, tag_spec_list)` with the tag names and tag specs
+    the APG callbacks would have collected, or None if the record contains
+    characters the scanner does not handle and must be parsed with APG instead.
+    """
+    if UNCLASSIFIABLE_REGEX.search(record) is not None:
+        return None
+    tag_list = []
+    tag_spec_list = []
+    pos = 0
+    end = len(record)
+    while True:
+        match = TAG_SPEC_REGEX.match(record, pos)
+        if match is None:
+            return False, tag_list, tag_spec_list
+        tag_list.append(match.group("name"))
+        tag_spec_list.append(match.group(0))
+        pos = match.end()
+        if pos == end:
+            return True, tag_list, tag_spec_list
+        # record[pos] is necessarily the ";" separator
+        pos += 1
+        if TRAILING_WSP_REGEX.match(record, pos).end() == end:
+            return True, tag_list, tag_spec_list
@@ -0,0 +1,228 @@
+import random
+from typing import List
+
+RECORDS = [
+    "v=DMARC1; p=reject; rua=mailto:bob@example.com; ruf=mailto:bob@example.com; fo=0; adkim=r; aspf=r",
+    "v=DMARC1;p=none;pct=100;adkim=r;aspf=r;ruf=mailto:dmarc-ruf@univ.com;fo=1;rua=mailto:dmarc-rua@univ.com",
+    "v=DMARC1; p=none; rf=afrf; rua=mailto:dmarc-a@abuse.net; ruf=mailto:dmarc-f@abuse.net",
+    "v=DMARC1; p=none;",
+    "v=DMARC1; p=none; ruf=mailto://abuse.com; foo=bar; buzz=happy;",
+    "v=DMARC1; p=none; ruf=mailto:test@test.com!2G,mailto:test2@test.com!3m;",
+    "v=DMARC1;p=reject;sp=reject;rua=mailto:me@example.com!1G;fo=1:0:s:d:d:1:0:0:1",
+    "v = DMARC1;p=reject;",
+    "V=DMARC1;P=reject;",
+    "v=DMARC1; p=reject; ",
+    "v=DMARC1;p=reject;;",
+    "v=DMARC1; p=reject; ; ",
+    "v=DMARC1; p=reject; p=quarantine",
+    "v=DMARC1; p=none; rua=mailto:a@[IPv6:2001:db8::1],mailto:b@example.com",
+    "v=DMARC1; p=none; rua=mailto:a@example.com , mailto:b@example.com",
+    "v=DMARC1;\tp=none;\tsp=quarantine\t",
+    "v=DMARC1; p=; sp=none",
+    "v=DMARC1; p=none; x_y1=a b c",
+    "v=DMARC1; p=none; 1x=bad",
+    "v=DMARC1; p=none; foo",
+    "v=DMARC1; p=none; =bar",
+    "v=DMARC1; p==none",
+    "v=DMARC1;\r\n p=none",
+    "v=DMARC1; p=none\r\n\r\n ",
+    "v=DMARC1; p=n\x00ne",
+    "v=DMARC1; p=nöne",
+    ";v=DMARC1",
+    "   v=DMARC1",
+    "v=spf1 include:_spf.example.com ~all",
+    "google-site-verification=abcdefghijklmnopqrstuvwxyz0123456789",
+    "p=none;v=DMARC1;",
+    "V=BOB",
+    "",
+    " ",
+    ";",
+]
+
+FUZZ_TOKENS = [
+    "v",
+    "p",
+    "sp",
+    "rua",
+    "ruf",
+    "pct",
+    "fo",
+    "ri",
+    "adkim",
+    "aspf",
+    "rf",
+    "x_1",
+    "=",
+    ";",
+    ";",
+    " ",
+    "\t",
+    ",",
+    ":",
+    "!",
+    "DMARC1",
+    "none",
+    "reject",
+    "quarantine",
+    "mailto:",
+    "a@example.com",
+    "100",
+    "10m",
+    "_",
+    "-",
+    "1",
+    "[",
+    "]",
+    "%20",
+    "//",
+]
+# characters only the APG parser handles, drawn rarely so that most fuzzed
+# records stay within what the fast-path scanner classifies
+RARE_FUZZ_TOKENS = ["\r\n", "\r", "\n", "\x00", "é"]
+
+
+FUZZ_TAG_NAMES = "v p sp rua ruf pct fo ri adkim aspf rf x_1 Foo P 1x".split() + [""]
+FUZZ_TAG_VALUES = [
+    "DMARC1",
+    "none",
+    "reject",
+    "quarantine",
+    "mailto:a@example.com",
+    "mailto:a@example.com!10m,mailto:b@example.org",
+    "100",
+    "0:1:d",
+    "r",
+    "s",
+    "afrf",
+    "86400",
+    "",
+    "a b",
+    "x=y",
+    "https://[::1]/",
+]
+FUZZ_WSP = ["", "", "", " ", "  ", "\t"]
+
+
+FUZZ_VALID_TAGS = [
+    ("p", "none"),
+    ("p", "Reject"),
+    ("sp", "quarantine"),
+    ("rua", "mailto:a@example.com,mailto:b@example.org!10m"),
+    ("ruf", "mailto:a@example.com!1"),
+    ("pct", "50"),
+    ("fo", "0:1:d:s"),
+    ("ri", "3600"),
+    ("adkim", "s"),
+    ("aspf", "r"),
+    ("rf", "afrf"),
+]
+
+
+def _fuzz_tag_spec(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        name, value = rng.choice(FUZZ_VALID_TAGS)
+    else:
+        name, value = rng.choice(FUZZ_TAG_NAMES), rng.choice(FUZZ_TAG_VALUES)
+    return "".join(
+        [
+            rng.choice(FUZZ_WSP),
+            name,
+            rng.choice(FUZZ_WSP),
+            "=",
+            rng.choice(FUZZ_WSP),
+            value,
+            rng.choice(FUZZ_WSP),
+        ]
+    )
+
+
+def fuzz_records(count: int, seed: int = 7489) -> List[str]:
+    """Random records, reproducible for a seed.
+
+    Half of them are lists of tag-specs built from DMARC-like names and values,
+    the other half random sequences of DMARC-like tokens.
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        if i % 2 == 0:
+            tag_specs = [_fuzz_tag_spec(rng) for _ in range(rng.randint(1, 8))]
+            if rng.random() < 0.6:
+                tag_specs.insert(0, rng.choice(["v=DMARC1", "v = DMARC1", "V=DMARC1"]))
+            suffix = rng.choice(["", ";", "; ", ";;", rng.choice(FUZZ_TOKENS)])
+            records.append(";".join(tag_specs) + suffix)
+            continue
+        length = rng.randint(0, 20)
+        prefix = rng.choice(["", "v=DMARC1;", "v=DMARC1; p=none;"])
+        tokens = [
+            rng.choice(RARE_FUZZ_TOKENS if rng.random() < 0.01 else FUZZ_TOKENS)
+            for _ in range(length)
+        ]
+        records.append(prefix + "".join(tokens))
+    return records
+
+
+FUZZ_EMAIL_PARTS = [
+    "a",
+    "bob",
+    "dmarc-rua",
+    "example",
+    "com",
+    "org",
+    "xn--bcher-kva",
+    "1",
+    "0",
+    ".",
+    ".",
+    "..",
+    "@",
+    "@",
+    "-",
+    "_",
+    "__",
+    "+",
+    "!",
+    '"',
+    "\\",
+    " ",
+    "\n",
+    "[",
+    "]",
+    ":",
+    "é",
+    "ā",
+    "ü",
+    "中",
+    "a" * 63,
+    "b" * 70,
+]
+
+
+def fuzz_emails(count: int, seed: int = 7489) -> List[str]:
+    """Random email-like strings, reproducible for a seed.
+
+    Half of them are `local@domain` with a dotted domain, the other half random
+    sequences of address parts.
+    """
+    rng = random.Random(seed)
+    emails = []
+    for i in range(count):
+        if i % 2 == 0:
+            local = "".join(rng.choices(FUZZ_EMAIL_PARTS[:9], k=rng.randint(1, 3)))
+            labels = [
+                "".join(
+                    rng.choices(
+                        (
+                            FUZZ_EMAIL_PARTS[:9]
+                            if rng.random() < 0.8
+                            else FUZZ_EMAIL_PARTS
+                        ),
+                        k=rng.randint(1, 2),
+                    )
+                )
+                for _ in range(rng.randint(1, 4))
+            ]
+            emails.append(f"{local}@{'.'.join(labels)}")
+            continue
+        emails.append("".join(rng.choices(FUZZ_EMAIL_PARTS, k=rng.randint(0, 8))))
+    return emails
@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.aio import AsyncDmarcParser
+from tests.corpus import RECORDS, fuzz_records
+
+RECORDS_AND_FUZZ = [*RECORDS, *fuzz_records(100)]
+
+
+def summary(outcome):
+    if isinstance(outcome, DmarcException):
+        return outcome.code, outcome.value
+    return outcome.original_record, outcome.effective_value, outcome.p.effective_value
+
+
+def test_parse():
+    async def main():
+        async with AsyncDmarcParser() as parser:
+            result = await parser.parse("v=DMARC1; p=reject")
+            assert result.p.effective_value == "reject"
+            result = await parser.parse("v=DMARC1; rua=mailto:a@b.com", 1)
+            assert result.p.downgraded
+            with pytest.raises(DmarcException):
+                await parser.parse("p=reject")
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_many(executor: str):
+    async def main():
+        async with AsyncDmarcParser(executor, workers=2, max_pending=16) as parser:
+            return [outcome async for outcome in parser.parse_many(RECORDS_AND_FUZZ)]
+
+    outcomes = asyncio.run(main())
+    parser = DmarcParser()
+    assert [summary(outcome) for outcome in outcomes] == [
+        summary(parser.parse_outcome(record)) for record in RECORDS_AND_FUZZ
+    ]
+
+
+def test_micro_batching():
+    class CountingExecutor(ThreadPoolExecutor):
+        calls = 0
+
+        def submit(self, *args, **kwargs):
+            CountingExecutor.calls += 1
+            return super().submit(*args, **kwargs)
+
+    async def main():
+        executor = CountingExecutor(max_workers=1)
+        parser = AsyncDmarcParser(executor, batch_size=50, batch_delay=0.05)
+        results = await asyncio.gather(
+            *(parser.parse("v=DMARC1; p=none") for _ in range(100))
+        )
+        await parser.aclose()
+        executor.shutdown()
+        return results
+
+    results = asyncio.run(main())
+    assert len(results) == 100
+    assert CountingExecutor.calls <= 4
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        AsyncDmarcParser("fork")
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            AsyncDmarcParser(executor, compact_results=True)
+        AsyncDmarcParser(executor)
+
+
+def test_aclose_cancels_pending():
+    async def main():
+        parser = AsyncDmarcParser(batch_size=32, batch_delay=60)
+        tasks = [
+            asyncio.ensure_future(parser.parse("v=DMARC1; p=none")) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(parser.aclose(), 5)
+        done, _ = await asyncio.wait(tasks, timeout=5)
+        return [task.cancelled() for task in done]
+
+    assert asyncio.run(main()) == [True] * 3
+
+
+def test_reused_across_loops():
+    parser = AsyncDmarcParser()
+
+    async def main():
+        return (await parser.parse("v=DMARC1; p=reject")).p.effective_value
+
+    assert asyncio.run(main()) == asyncio.run(main()) == "reject"
+    asyncio.run(parser.aclose())
+
+
+def test_executor_errors_forwarded():
+    async def main():
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        async with AsyncDmarcParser(executor) as parser:
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(parser.parse("v=DMARC1; p=none"), 5)
+
+    asyncio.run(main())
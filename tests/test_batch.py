@@ -0,0 +1,31 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from tests.corpus import RECORDS, fuzz_records
+
+RECORDS_AND_FUZZ = [*RECORDS, *fuzz_records(200)]
+
+
+def summary(outcome):
+    if isinstance(outcome, DmarcException):
+        return outcome.code, outcome.value
+    return outcome.original_record, outcome.effective_value, outcome.p.effective_value
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many(workers: int):
+    parser = DmarcParser()
+    outcomes = list(parser.parse_many(RECORDS_AND_FUZZ, workers=workers, chunksize=7))
+    assert len(outcomes) == len(RECORDS_AND_FUZZ)
+    assert [summary(outcome) for outcome in outcomes] == [
+        summary(parser.parse_outcome(record)) for record in RECORDS_AND_FUZZ
+    ]
+
+
+def test_parse_many_exceptions_in_place():
+    records = ["v=DMARC1; p=none", "p=none", "v=DMARC1; p=reject"]
+    outcomes = list(DmarcParser().parse_many(iter(records), workers=2, chunksize=1))
+    assert outcomes[0].p.effective_value == "none"
+    assert isinstance(outcomes[1], DmarcException)
+    assert outcomes[1].code == 98
+    assert outcomes[2].p.effective_value == "reject"
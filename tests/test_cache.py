@@ -0,0 +1,62 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.cache import LRUCache
+
+RECORD = "v=DMARC1; p=reject; rua=mailto:bob@example.com; fo=1"
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b", None) is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == (3, 1, 2, 2)
+
+
+def test_cache_disabled_by_default():
+    parser = DmarcParser()
+    parser.parse(RECORD)
+    parser.parse(RECORD)
+    assert parser.cache_info() == (0, 0, 0, 0)
+
+
+def test_cache_hits_and_misses():
+    parser = DmarcParser(cache_size=10)
+    parser.parse(RECORD)
+    parser.parse(RECORD)
+    parser.parse(RECORD, follow_downgrade=False)
+    info = parser.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 2, 10, 2)
+    parser.cache_clear()
+    assert parser.cache_info() == (0, 0, 10, 0)
+
+
+def test_cached_result_is_copied():
+    parser = DmarcParser(cache_size=10)
+    first = parser.parse(RECORD)
+    first.p.value = "none"
+    first.rua.valid.clear()
+    second = parser.parse(RECORD)
+    assert second is not first
+    assert second.p.effective_value == "reject"
+    assert second.rua.valid[0]["email"] == "bob@example.com"
+    assert second.fo.value == ["1"]
+
+
+def test_cached_exception():
+    parser = DmarcParser(cache_size=10)
+    with pytest.raises(DmarcException) as first:
+        parser.parse("v=DMARC1; p=bob;", follow_downgrade=False)
+    with pytest.raises(DmarcException) as second:
+        parser.parse("v=DMARC1; p=bob;", follow_downgrade=False)
+    assert second.value is not first.value
+    assert (second.value.code, second.value.value) == (
+        first.value.code,
+        first.value.value,
+    )
+    assert parser.cache_info().hits == 1
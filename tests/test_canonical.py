@@ -0,0 +1,96 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser, canonicalize
+from dmarcparser.parser import VALID_DMARC_TAGS
+from tests.corpus import RECORDS, fuzz_records
+
+
+def variants(record: str, rng: random.Random, count: int = 4):
+    """Copies of the record with random case changes and whitespace insertions."""
+    for _ in range(count):
+        chars = []
+        for char in record:
+            if rng.random() < (0.4 if char in "=;" else 0.02):
+                chars.append(rng.choice([" ", "\t", "  "]))
+            if rng.random() < 0.1:
+                char = char.swapcase()
+            chars.append(char)
+        yield "".join(chars)
+
+
+def outcome(parser: DmarcParser, record: str):
+    try:
+        dmarc_obj = parser.parse(record)
+    except DmarcException as e:
+        return e.code, e.value
+    tags = []
+    for tag_name in VALID_DMARC_TAGS:
+        tag = dmarc_obj[tag_name]
+        tags.append((tag_name, tag.value, tag.index, tag.to_tag()))
+    tags.append((dmarc_obj.p.downgraded, dmarc_obj.sp.inherited))
+    tags.append(([str(email) for email in dmarc_obj.rua.valid], dmarc_obj.rua.other))
+    tags.append(([str(email) for email in dmarc_obj.ruf.valid], dmarc_obj.ruf.other))
+    return tags
+
+
+def raw_fields(parser: DmarcParser, record: str):
+    try:
+        dmarc_obj = parser.parse(record)
+    except DmarcException:
+        return None
+    return (
+        dmarc_obj.original_record,
+        dmarc_obj.effective_value,
+        dmarc_obj.ignored_tags,
+    )
+
+
+def corpus():
+    rng = random.Random(5)
+    records = []
+    for record in [*RECORDS, *fuzz_records(600)]:
+        records.append(record)
+        records.extend(variants(record, rng))
+    return records
+
+
+@pytest.fixture(scope="module")
+def parser() -> DmarcParser:
+    return DmarcParser()
+
+
+def test_equal_keys_equal_outcomes(parser: DmarcParser):
+    groups = defaultdict(set)
+    for record in corpus():
+        groups[canonicalize(record)].add(record)
+    assert len(groups) < len(corpus()) / 2
+    for key, records in groups.items():
+        outcomes = {repr(outcome(parser, record)) for record in records}
+        assert len(outcomes) == 1, (key, records)
+
+
+@pytest.mark.parametrize(
+    "record,key",
+    [
+        ("v = DMARC1 ; P=ReJect ;\t", "v=DMARC1;p=reject"),
+        ("v=DMARC1; p=none; Foo=Bar", "v=DMARC1;p=none;foo="),
+        ("v=dmarc1; p=none", "v=dmarc1;p=none"),
+        ("v=DMARC1; p=none; P=reject", "v=DMARC1;p=none;P=reject"),
+        ("v=DMARC1; p n=none", ""),
+        ("v=DMARC1;\r\n p=none", "v=DMARC1;\r\n p=none"),
+    ],
+)
+def test_canonicalize(record: str, key: str):
+    assert canonicalize(record) == key
+
+
+def test_canonical_cache(parser: DmarcParser):
+    cached_parser = DmarcParser(cache_size=10000, canonical_cache=True)
+    records = corpus()
+    for record in records:
+        assert outcome(cached_parser, record) == outcome(parser, record)
+        assert raw_fields(cached_parser, record) == raw_fields(parser, record)
+    assert cached_parser.cache_info().hits > len(records) / 2
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from dmarcparser import DmarcParser, cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INPUT = (
+    "example.com\tv=DMARC1; p=reject; rua=mailto:a@example.com!10m\n"
+    "v=DMARC1;\tp=none\n"
+    "\n"
+    "foo.org\tv=spf1 -all\r\n"
+)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cli(tmp_path, capsys, workers: int):
+    input_path = tmp_path / "records.txt"
+    output_path = tmp_path / "results.jsonl"
+    input_path.write_text(INPUT)
+    assert cli.main([str(input_path), "-o", str(output_path), "-w", str(workers)]) == 0
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert len(results) == 3
+    assert results[0]["domain"] == "example.com"
+    assert results[0]["tags"]["p"] == "reject"
+    assert results[0]["tags"]["rua"]["valid"] == [
+        {"email": "a@example.com", "limit": 10485760}
+    ]
+    assert "domain" not in results[1]
+    assert results[1]["record"] == "v=DMARC1;\tp=none"
+    assert results[1]["valid"] is True
+    assert results[2]["domain"] == "foo.org"
+    assert results[2]["valid"] is False
+    assert results[2]["error"]["code"] == 98
+    assert "3 records (2 valid, 1 invalid)" in capsys.readouterr().err
+
+
+def test_validate_is_lazy():
+    def pairs():
+        yield None, "v=DMARC1; p=none"
+        raise AssertionError("input consumed ahead of the output")
+
+    results = cli.validate(DmarcParser(), pairs())
+    assert next(results)["valid"] is True
+
+
+def test_cli_not_utf8(tmp_path, capsys):
+    input_path = tmp_path / "records.txt"
+    input_path.write_bytes(b"\xff\xfe bad\nexample.com\tv=DMARC1; p=n\xffne\n")
+    assert cli.main([str(input_path)]) == 0
+    captured = capsys.readouterr()
+    results = [json.loads(line) for line in captured.out.splitlines()]
+    assert [result["valid"] for result in results] == [False, False]
+    assert results[1]["domain"] == "example.com"
+    assert "2 records (0 valid, 2 invalid)" in captured.err
+
+
+def test_cli_missing_input(tmp_path, capsys):
+    assert cli.main([str(tmp_path / "missing.txt")]) == 1
+    err = capsys.readouterr().err
+    assert err.startswith("dmarcparser: ") and "missing.txt" in err
+    assert len(err.splitlines()) == 1
+
+
+def test_cli_broken_pipe():
+    read_end, write_end = os.pipe()
+    os.close(read_end)
+    with os.fdopen(write_end, "wb") as stdout:
+        completed = subprocess.run(
+            [sys.executable, "-m", "dmarcparser.cli"],
+            input=b"v=DMARC1; p=none\n" * 1000,
+            stdout=stdout,
+            stderr=subprocess.PIPE,
+            cwd=ROOT,
+        )
+    assert completed.returncode == 1
+    assert completed.stderr == b""
@@ -0,0 +1,177 @@
+import random
+
+import pytest
+from apg_py.lib.identifiers import MATCH
+from apg_py.lib.parser import Parser as APGParser
+
+from dmarcparser import DmarcParser, codegen
+from dmarcparser.codegen import generate_recognizer, load_recognizer
+from dmarcparser.grammars import (
+    GrammarType,
+    generate_parser,
+    grammar_digest,
+    grammar_source,
+    load_grammar,
+)
+from dmarcparser.parser import SKIP_WSP_REGEX, OPTION_to_ABNF, code_points
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(3000)]
+DMARC_RULES = sorted(set(OPTION_to_ABNF.values()))
+URI_RULES = ["URI", "dmarc-uri", "IPv6address", "IPv4address", "host", "authority"]
+URI_ALPHABET = "0123456789abcdefxyzABCDEF:.[]/%@!?#=,+-_~ \tmailto"
+
+
+def fuzz_uris(count: int, seed: int = 3986) -> list:
+    rng = random.Random(seed)
+    uris = []
+    for _ in range(count):
+        prefix = rng.choice(["", "mailto:", "https://", "https://[", "a@", "::"])
+        length = rng.randint(0, 24)
+        uris.append(prefix + "".join(rng.choices(URI_ALPHABET, k=length)))
+    return uris
+
+
+class Differential:
+    """Runs a rule with APG and the recognizer, recording the same matches."""
+
+    def __init__(self, grammar_type: GrammarType, callback_rules: list):
+        self.apg_parser = APGParser(load_grammar(grammar_type))
+        self.apg_parser.add_callbacks(
+            {name: self._apg_callback(name) for name in callback_rules}
+        )
+        self.recognizer = load_recognizer(grammar_type)
+        self.callbacks = self.recognizer.callback_table(
+            {name: self._callback(name) for name in callback_rules}
+        )
+
+    @staticmethod
+    def _apg_callback(name):
+        def callback(res):
+            if res["state"] == MATCH:
+                res["user_data"].append(
+                    (name, res["phrase_index"], res["phrase_length"])
+                )
+
+        return callback
+
+    @staticmethod
+    def _callback(name):
+        def callback(user_data, phrase_index, phrase_length):
+            user_data.append((name, phrase_index, phrase_length))
+
+        return callback
+
+    def check(self, text: str, rule: str):
+        apg_matches = []
+        matches = []
+        result = self.apg_parser.parse(
+            code_points(text), start_rule=rule, user_data=apg_matches
+        )
+        success = self.recognizer.parse(text, rule, self.callbacks, matches)
+        assert (success, matches) == (result.success, apg_matches), (rule, text)
+
+
+@pytest.mark.parametrize("grammar_type", list(GrammarType))
+def test_recognizers_up_to_date(grammar_type: GrammarType):
+    # run `python -m dmarcparser.grammars` if this fails
+    abnf_str = grammar_source(grammar_type)
+    digest = grammar_digest(abnf_str)
+    module_name = codegen.RECOGNIZER_MODULES[grammar_type]
+    module = load_recognizer(grammar_type)
+    assert module.__name__ == f"dmarcparser.{module_name}"
+    assert module.DIGEST == digest
+    with open(module.__file__) as f:
+        assert f.read() == generate_recognizer(
+            generate_parser(abnf_str), grammar_type.value, digest
+        )
+
+
+def test_outdated_recognizer_compiled(monkeypatch):
+    module = load_recognizer(GrammarType.DMARC_ABNF)
+    monkeypatch.setattr(module, "DIGEST", "outdated")
+    compiled = load_recognizer.__wrapped__(GrammarType.DMARC_ABNF)
+    assert compiled is not module
+    assert compiled.parse("p=none", "dmarc-request")
+    assert not compiled.parse("p", "dmarc-request")
+
+
+def test_differential_tag_list():
+    differential = Differential(
+        GrammarType.DKIM_TAG_LIST_ABNF, ["tag-name", "tag-spec", "tag-value"]
+    )
+    for record in CORPUS:
+        differential.check(record, "tag-list")
+
+
+def test_differential_dmarc_record():
+    differential = Differential(GrammarType.DMARC_ABNF, [*DMARC_RULES, "URI"])
+    for record in CORPUS:
+        differential.check(record, "dmarc-record")
+
+
+def test_differential_dmarc_tags():
+    differential = Differential(GrammarType.DMARC_ABNF, ["dmarc-uri", "host"])
+    tags = {
+        SKIP_WSP_REGEX.sub("", spec) for record in CORPUS for spec in record.split(";")
+    }
+    for tag in sorted(tags):
+        for rule in DMARC_RULES:
+            differential.check(tag, rule)
+
+
+def test_differential_uris():
+    differential = Differential(GrammarType.DMARC_ABNF, ["h16", "ls32", "reg-name"])
+    for uri in fuzz_uris(2000):
+        for rule in URI_RULES:
+            differential.check(uri, rule)
+
+
+def test_compiled_engine_outcomes():
+    apg = DmarcParser(fast_tag_list=False)
+    compiled = DmarcParser(fast_tag_list=False, engine="compiled")
+    for record in CORPUS:
+        expected = apg.parse_result(record)
+        outcome = compiled.parse_result(record)
+        assert outcome.error_code == expected.error_code, record
+        if outcome.ok:
+            assert outcome.result.effective_value == expected.result.effective_value
+            assert outcome.result.ignored_tags == expected.result.ignored_tags
+    outcomes = list(compiled.parse_many(RECORDS, workers=2, chunksize=4))
+    assert [getattr(outcome, "code", None) for outcome in outcomes] == [
+        apg.parse_result(record).error_code for record in RECORDS
+    ]
+
+
+def test_compiled_engine_record_syntax():
+    apg = DmarcParser()
+    compiled = DmarcParser(engine="compiled")
+    for record in RECORDS:
+        _, tag_list, tag_spec_list = apg._check_tag_list_syntax(record)
+        success, parsed, _ = apg._apg_check_dmarc_record_syntax(
+            tag_list, tag_spec_list, record
+        )
+        assert compiled._apg_check_dmarc_record_syntax(tag_list, tag_spec_list, record)[
+            :2
+        ] == (success, parsed)
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        DmarcParser(engine="regex")
+    # the recognizers do not count nodes
+    with pytest.raises(ValueError):
+        DmarcParser(engine="compiled", node_budget=100)
+    DmarcParser(engine="compiled", max_record_length=100, time_budget=1)
+    recognizer = load_recognizer(GrammarType.DMARC_ABNF)
+    with pytest.raises(ValueError):
+        recognizer.callback_table({"ALPHA": print})
+    with pytest.raises(ValueError):
+        recognizer.parse("p=none", "no-such-rule")
+
+
+def test_unsupported_opcode():
+    # user-defined terminals have no equivalent in the recognizers
+    grammar = generate_parser("rule = u_terminal\n")
+    with pytest.raises(ValueError):
+        generate_recognizer(grammar, "udt", grammar_digest("rule = u_terminal\n"))
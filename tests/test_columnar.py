@@ -0,0 +1,75 @@
+import pytest
+
+from dmarcparser import DmarcParser
+from dmarcparser.columnar import CATEGORIES, FO_FLAGS
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(500)]
+
+
+def check_columns(parser: DmarcParser, columns):
+    assert len(columns) == len(CORPUS)
+    for i, record in enumerate(CORPUS):
+        outcome = parser.parse_result(record)
+        if not outcome.ok:
+            assert columns["error"][i] == outcome.error_code
+            assert columns["rua_count"][i] == 0
+            continue
+        result = outcome.result
+        assert columns["error"][i] == 0
+        assert bool(columns["p_downgraded"][i]) == result.p.downgraded
+        for name, category in CATEGORIES.items():
+            assert category[columns[name][i]] == result[name].effective_value
+        assert columns["pct"][i] == result.pct.effective_value
+        assert columns["ri"][i] == result.ri.effective_value
+        fo = {flag for bit, flag in enumerate(FO_FLAGS) if columns["fo"][i] >> bit & 1}
+        assert fo == set(result.fo.effective_value)
+        for tag in ("rua", "ruf"):
+            start, end = columns[f"{tag}_offsets"][i : i + 2]
+            assert columns[f"{tag}_count"][i] == end - start
+            assert list(columns[f"{tag}_address"][start:end]) == [
+                email.email for email in result[tag].valid
+            ]
+            assert list(columns[f"{tag}_limit"][start:end]) == [
+                -1 if email.limit is None else email.limit
+                for email in result[tag].valid
+            ]
+
+
+def test_columns_array():
+    parser = DmarcParser()
+    columns = parser.parse_columns(CORPUS, use_numpy=False)
+    check_columns(parser, columns)
+    assert columns["p"].typecode == "B"
+    assert sum(columns.distribution("p").values()) == columns["error"].count(0)
+
+
+def test_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    parser = DmarcParser()
+    columns = parser.parse_columns(CORPUS, use_numpy=True)
+    check_columns(parser, columns)
+    assert isinstance(columns["p"], numpy.ndarray)
+    assert columns["p_downgraded"].dtype == bool
+    valid = columns["error"] == 0
+    assert columns.distribution("p") == {
+        value: int(numpy.count_nonzero(valid & (columns["p"] == code)))
+        for code, value in enumerate(CATEGORIES["p"])
+        if code
+    }
+
+
+def test_columns_workers():
+    parser = DmarcParser()
+    columns = parser.parse_columns(CORPUS[:50], use_numpy=False, workers=2)
+    expected = parser.parse_columns(CORPUS[:50], use_numpy=False)
+    for name in expected:
+        assert list(columns[name]) == list(expected[name])
+
+
+def test_columns_decode():
+    columns = DmarcParser().parse_columns(
+        ["v=DMARC1; p=reject; sp=none", "v=spf1 -all"], use_numpy=False
+    )
+    assert columns.decode("sp") == ["none", ""]
+    assert columns.distribution("p") == {"none": 0, "quarantine": 0, "reject": 1}
@@ -0,0 +1,54 @@
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.parser import DmarcResult
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(300)]
+
+
+def signature(outcome):
+    if isinstance(outcome, DmarcException):
+        return outcome.code, outcome.value
+    return (
+        outcome.original_record,
+        outcome.effective_value,
+        tuple(outcome.ignored_tags),
+        outcome.p.effective_value,
+        outcome.sp.effective_value,
+        tuple(str(email) for email in outcome.rua.valid),
+    )
+
+
+def test_parse_batch_matches_parse():
+    parser = DmarcParser()
+    records = CORPUS * 3
+    for canonical in (False, True):
+        outcomes, stats = parser.parse_batch(records, canonical=canonical)
+        assert [signature(outcome) for outcome in outcomes] == [
+            signature(parser.parse_outcome(record)) for record in records
+        ]
+        assert stats.records == len(records)
+        assert stats.distinct == len(set(CORPUS))
+        assert stats.valid + stats.invalid == len(records)
+        assert stats.dedup_ratio >= 3
+
+
+def test_parse_batch_shares_outcomes():
+    records = ["v=DMARC1; p=none", "v=spf1 -all", "V=DMARC1;P=NONE", "v=DMARC1; p=none"]
+    outcomes, stats = DmarcParser().parse_batch(records, canonical=True)
+    assert isinstance(outcomes[0], DmarcResult)
+    assert outcomes[3] is outcomes[0]
+    assert outcomes[2] is not outcomes[0]
+    assert outcomes[2].p is outcomes[0].p
+    assert outcomes[2].original_record == records[2]
+    assert isinstance(outcomes[1], DmarcException)
+    assert (stats.distinct, stats.parsed) == (3, 2)
+    assert stats.dedup_ratio == 2
+
+
+def test_parse_batch_workers():
+    parser = DmarcParser()
+    outcomes, stats = parser.parse_batch(CORPUS[:40] * 2, workers=2, chunksize=8)
+    assert [signature(outcome) for outcome in outcomes] == [
+        signature(parser.parse_outcome(record)) for record in CORPUS[:40] * 2
+    ]
+    assert stats.parsed == len(set(CORPUS[:40]))
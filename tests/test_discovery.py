@@ -0,0 +1,324 @@
+import asyncio
+
+import pytest
+
+from dmarcparser import DmarcException
+from dmarcparser.discovery import (
+    STATUS_INVALID,
+    STATUS_NONE,
+    STATUS_POLICY,
+    STATUS_TEMPERROR,
+    DmarcDiscovery,
+    PublicSuffixList,
+    ResolverError,
+    TxtAnswer,
+    ZoneResolver,
+)
+
+ZONE = """
+$ORIGIN example.com.
+$TTL 600
+@           IN SOA ns hostmaster 1 7200 3600 86400 300
+_dmarc      IN TXT "v=DMARC1; p=reject; sp=quarantine; " "rua=mailto:a@example.com"
+_dmarc.sub  60 IN TXT ( "v=DMARC1; p=none" ; split over two lines
+                      )
+            IN TXT "v=spf1 -all"
+_dmarc.twice.example.com. TXT "v=DMARC1; p=none"
+                          TXT "v=DMARC1; p=reject"
+_dmarc.bad  TXT "v=DMARC1; p=bogus"
+escaped     TXT "a\\"b\\059c" unquoted
+$ORIGIN example.net.
+_dmarc      TXT "v=DMARC1; p=none"
+"""
+PSL = """// comment
+com
+net
+uk
+co.uk
+*.ck
+!www.ck
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def discover_all(discovery: DmarcDiscovery, domains: list) -> list:
+    async def main():
+        return [result async for result in discovery.discover_many(domains)]
+
+    return run(main())
+
+
+def test_zone_file():
+    resolver = ZoneResolver.from_zone_file(ZONE)
+    answer = run(resolver.resolve_txt("_dmarc.example.com"))
+    assert answer == TxtAnswer(
+        ((b"v=DMARC1; p=reject; sp=quarantine; ", b"rua=mailto:a@example.com"),),
+        600,
+    )
+    answer = run(resolver.resolve_txt("_DMARC.Sub.Example.com."))
+    assert answer == TxtAnswer(((b"v=DMARC1; p=none",), (b"v=spf1 -all",)), 60)
+    answer = run(resolver.resolve_txt("escaped.example.com"))
+    assert answer.records == ((b'a"b;c', b"unquoted"),)
+    assert run(resolver.resolve_txt("_dmarc.example.net")).records
+    assert run(resolver.resolve_txt("example.com")) == TxtAnswer((), 300)
+
+
+def test_discover():
+    discovery = DmarcDiscovery(ZoneResolver.from_zone_file(ZONE))
+    results = discover_all(
+        discovery,
+        [
+            "example.com",
+            "a.b.Example.COM.",
+            "sub.example.com",
+            "twice.example.com",
+            "bad.example.com",
+            "example.org",
+            "com",
+        ],
+    )
+    assert [
+        (result.domain, result.policy_domain, result.status, result.policy)
+        for result in results
+    ] == [
+        ("example.com", "example.com", STATUS_POLICY, "reject"),
+        ("a.b.example.com", "example.com", STATUS_POLICY, "quarantine"),
+        ("sub.example.com", "sub.example.com", STATUS_POLICY, "none"),
+        ("twice.example.com", "twice.example.com", STATUS_INVALID, None),
+        ("bad.example.com", "bad.example.com", STATUS_INVALID, None),
+        ("example.org", None, STATUS_NONE, None),
+        ("com", None, STATUS_NONE, None),
+    ]
+    assert results[1].org_domain == "example.com"
+    assert results[1].record == (
+        "v=DMARC1; p=reject; sp=quarantine; rua=mailto:a@example.com"
+    )
+    assert results[3].outcome.code == 94
+    assert isinstance(results[4].outcome, DmarcException)
+    assert results[6].org_domain is None
+
+
+def test_sp_inherits_p():
+    resolver = ZoneResolver({"_dmarc.example.com": ["v=DMARC1; p=reject"]})
+    result = run(DmarcDiscovery(resolver).discover("mail.example.com"))
+    assert result.policy_domain == "example.com"
+    assert result.policy == "reject"
+
+
+def test_in_flight_queries_deduplicated():
+    resolver = ZoneResolver.from_zone_file(ZONE, delay=0.01)
+    discovery = DmarcDiscovery(resolver)
+    domains = [f"host{i % 10}.example.com" for i in range(100)]
+
+    async def main():
+        return await asyncio.gather(*(discovery.discover(d) for d in domains))
+
+    results = run(main())
+    assert {result.policy for result in results} == {"quarantine"}
+    assert resolver.queries["_dmarc.example.com"] == 1
+    assert sum(resolver.queries.values()) == 11
+
+
+def test_concurrency_limit():
+    class CountingResolver(ZoneResolver):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def resolve_txt(self, name):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                return await super().resolve_txt(name)
+            finally:
+                self.in_flight -= 1
+
+    resolver = CountingResolver(delay=0.001)
+    discovery = DmarcDiscovery(resolver, max_concurrency=5, max_pending=50)
+    results = discover_all(discovery, [f"d{i}.example" for i in range(200)])
+    assert len(results) == 200
+    assert resolver.max_in_flight == 5
+
+
+def test_ttl_cache():
+    clock = FakeClock()
+    resolver = ZoneResolver.from_zone_file(ZONE)
+    discovery = DmarcDiscovery(resolver, clock=clock)
+    run(discovery.discover("sub.example.com"))
+    run(discovery.discover("missing.example.net"))
+    run(discovery.discover("sub.example.com"))
+    assert resolver.queries["_dmarc.sub.example.com"] == 1
+    assert discovery.cache_info()[:2] == (1, 3)
+    # the RRset TTL of 60s has expired, the NXDOMAIN TTL of 300s not yet
+    clock.now = 61
+    run(discovery.discover("sub.example.com"))
+    run(discovery.discover("missing.example.net"))
+    assert resolver.queries["_dmarc.sub.example.com"] == 2
+    assert resolver.queries["_dmarc.missing.example.net"] == 1
+    clock.now = 301
+    run(discovery.discover("missing.example.net"))
+    assert resolver.queries["_dmarc.missing.example.net"] == 2
+    discovery.cache_clear()
+    assert discovery.cache_info().currsize == 0
+
+
+def test_ttl_bounds():
+    clock = FakeClock()
+    resolver = ZoneResolver({"_dmarc.example.com": ["v=DMARC1; p=none"]}, ttl=0)
+    discovery = DmarcDiscovery(resolver, clock=clock, min_ttl=10, max_ttl=20)
+    run(discovery.discover("example.com"))
+    clock.now = 9
+    run(discovery.discover("example.com"))
+    assert resolver.queries["_dmarc.example.com"] == 1
+    resolver = ZoneResolver({"_dmarc.example.com": ["v=DMARC1; p=none"]})
+    discovery = DmarcDiscovery(resolver, clock=clock, max_ttl=20)
+    run(discovery.discover("example.com"))
+    clock.now = 30
+    run(discovery.discover("example.com"))
+    assert resolver.queries["_dmarc.example.com"] == 2
+
+
+def test_temporary_errors_not_cached():
+    class FailingResolver(ZoneResolver):
+        failures = 1
+
+        async def resolve_txt(self, name):
+            if self.failures > 0:
+                self.failures -= 1
+                raise ResolverError("SERVFAIL")
+            return await super().resolve_txt(name)
+
+    resolver = FailingResolver({"_dmarc.example.com": ["v=DMARC1; p=none"]})
+    discovery = DmarcDiscovery(resolver)
+    result = run(discovery.discover("mail.example.com"))
+    assert result.status == STATUS_TEMPERROR
+    assert str(result.dns_error) == "SERVFAIL"
+    # no fallback to the organizational domain after a transient failure
+    assert resolver.queries["_dmarc.example.com"] == 0
+    result = run(discovery.discover("mail.example.com"))
+    assert result.status == STATUS_POLICY
+
+
+def test_discover_many_order():
+    resolver = ZoneResolver.from_zone_file(ZONE, delay=0.001)
+    discovery = DmarcDiscovery(resolver, max_pending=3)
+    domains = ["example.com", "example.org", "sub.example.com"] * 5
+
+    async def stream():
+        for domain in domains:
+            yield domain
+
+    async def main():
+        return [result.domain async for result in discovery.discover_many(stream())]
+
+    assert run(main()) == domains
+
+
+def test_discover_many_cancels_pending():
+    class BlockingResolver(ZoneResolver):
+        async def resolve_txt(self, name):
+            if name.startswith("_dmarc.fail."):
+                raise RuntimeError(name)
+            if not name.startswith("_dmarc.first."):
+                await asyncio.Event().wait()
+            return await super().resolve_txt(name)
+
+    discovery = DmarcDiscovery(BlockingResolver(), max_pending=4)
+
+    async def pending_tasks():
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    async def stop_early():
+        results = discovery.discover_many(
+            ["first.example", "a.example", "b.example", "c.example"]
+        )
+        assert (await results.__anext__()).domain == "first.example"
+        await results.aclose()
+        return await pending_tasks()
+
+    async def task_raises():
+        with pytest.raises(RuntimeError):
+            async for _ in discovery.discover_many(
+                ["fail.example", "a.example", "b.example"]
+            ):
+                pass
+        return await pending_tasks()
+
+    assert run(stop_early()) == set()
+    assert run(task_raises()) == set()
+
+
+def test_shared_lookup_survives_cancelled_caller():
+    discovery = DmarcDiscovery(ZoneResolver.from_zone_file(ZONE, delay=0.01))
+
+    async def main():
+        cancelled = asyncio.ensure_future(discovery.discover("example.com"))
+        waiting = asyncio.ensure_future(discovery.discover("example.com"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return (await waiting).status
+
+    assert run(main()) == STATUS_POLICY
+
+
+@pytest.mark.parametrize(
+    "domain, public_suffix, org_domain",
+    [
+        ("a.b.example.co.uk", "co.uk", "example.co.uk"),
+        ("co.uk", "co.uk", None),
+        ("example.com", "com", "example.com"),
+        ("x.y.ck", "y.ck", "x.y.ck"),
+        ("y.ck", "y.ck", None),
+        ("a.www.ck", "ck", "www.ck"),
+        ("a.example.test", "test", "example.test"),
+    ],
+)
+def test_public_suffix_list(domain: str, public_suffix: str, org_domain: str):
+    psl = PublicSuffixList.parse(PSL)
+    assert psl.public_suffix(domain) == public_suffix
+    assert psl.organizational_domain(domain) == org_domain
+
+
+def test_default_organizational_domain():
+    psl = PublicSuffixList()
+    assert psl.organizational_domain("a.b.example.co.uk") == "co.uk"
+    assert psl.organizational_domain("uk") is None
+
+
+def test_cancelled_lookup_not_joined():
+    resolver = ZoneResolver.from_zone_file(ZONE, delay=0.01)
+    discovery = DmarcDiscovery(resolver)
+
+    async def main():
+        cancelled = asyncio.ensure_future(discovery.discover("example.com"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        return (await discovery.discover("example.com")).status
+
+    assert run(main()) == STATUS_POLICY
+    assert resolver.queries["_dmarc.example.com"] == 2
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_discovery_reused_across_loops(cache_size: int):
+    resolver = ZoneResolver.from_zone_file(ZONE, delay=0.001)
+    discovery = DmarcDiscovery(resolver, cache_size=cache_size, max_concurrency=2)
+    domains = ["example.com", "sub.example.com", "example.net"] * 3
+
+    async def main():
+        return [result.status async for result in discovery.discover_many(domains)]
+
+    assert run(main()) == run(main()) == [STATUS_POLICY] * len(domains)
@@ -3,7 +3,7 @@ import pytest
 
 from dmarcparser import DmarcException
 from dmarcparser import DmarcParser
-from dmarcparser.parser import DmarcObject
+from dmarcparser.parser import ENGINES, DmarcObject
 
 
 def assert_error(record: str, follow_downgrade: bool = False):
@@ -249,3 +249,19 @@ class NewTests(DmarcTest):
 )
 def test_failing(record):
     assert_error(record)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "record",
+    [
+        "v=DMARC1; p=n\udcffne",
+        "v=DMARC1; p=none; rua=mailto:a\ud800@example.com",
+        "\udcff",
+        "v=DMARC1; p=none; x=\U0001f600",
+    ],
+)
+def test_failing_not_ascii(record: str, engine: str):
+    with pytest.raises(DmarcException) as e:
+        DmarcParser(engine=engine).parse(record)
+    assert e.value.code == 99
@@ -0,0 +1,45 @@
+import pytest
+
+from dmarcparser import DmarcParser
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(2000)]
+
+
+@pytest.fixture(scope="module")
+def parser() -> DmarcParser:
+    return DmarcParser()
+
+
+@pytest.mark.parametrize("record", CORPUS)
+def test_per_tag_matches_dmarc_record(parser: DmarcParser, record: str):
+    tag_success, tag_list, tag_spec_list = parser._check_tag_list_syntax(record)
+    if not tag_success:
+        return
+    success, dmarc_tag_parsed, dmarc_obj = parser._check_dmarc_syntax(
+        tag_list, tag_spec_list, record
+    )
+    (
+        apg_success,
+        apg_dmarc_tag_parsed,
+        apg_dmarc_obj,
+    ) = parser._apg_check_dmarc_record_syntax(tag_list, tag_spec_list, record)
+    assert success == apg_success
+    if dmarc_obj is None:
+        # rejected by the version prefilter
+        assert not success
+        return
+    assert dmarc_obj.effective_value == apg_dmarc_obj.effective_value
+    assert dmarc_obj.ignored_tags == apg_dmarc_obj.ignored_tags
+    if success:
+        assert dmarc_tag_parsed == apg_dmarc_tag_parsed
+
+
+def test_check_tag_list():
+    parser = DmarcParser(max_record_length=64)
+    assert parser.check_tag_list("v=DMARC1; p=bogus")
+    assert parser.check_tag_list(b"v=DMARC1; x=y;")
+    assert not parser.check_tag_list("v=DMARC1; =bad")
+    assert not parser.check_tag_list("v=DMARC1; p=n\0ne")
+    assert not parser.check_tag_list("v=DMARC1; p=n\udcffne")
+    assert not parser.check_tag_list("v=DMARC1; x=" + "y" * 64)
@@ -0,0 +1,30 @@
+import pytest
+
+from dmarcparser import _grammar_tables, grammars
+from dmarcparser.grammars import GrammarType
+
+
+@pytest.mark.parametrize("grammar_type", list(GrammarType))
+def test_grammar_tables_up_to_date(grammar_type: GrammarType):
+    # run `python -m dmarcparser.grammars` if this fails
+    abnf_str = grammars.grammar_source(grammar_type)
+    table = _grammar_tables.GRAMMARS[grammar_type.value]
+    assert table["digest"] == grammars.grammar_digest(abnf_str)
+    assert table["rules"] == grammars.generate_parser(abnf_str).rules
+
+
+@pytest.mark.parametrize("grammar_type", list(GrammarType))
+def test_precompiled_grammar_used(grammar_type: GrammarType, monkeypatch):
+    def fail(abnf_str):
+        raise AssertionError("grammar should not be generated")
+
+    monkeypatch.setattr(grammars, "generate_parser", fail)
+    abnf_str = grammars.grammar_source(grammar_type)
+    grammar = grammars._load_precompiled_grammar(grammar_type, abnf_str)
+    assert grammar is not None
+    assert grammar.source == abnf_str
+
+
+def test_outdated_grammar_tables_ignored():
+    abnf_str = grammars.grammar_source(GrammarType.DMARC_ABNF) + "extra = ALPHA\n"
+    assert grammars._load_precompiled_grammar(GrammarType.DMARC_ABNF, abnf_str) is None
@@ -0,0 +1,81 @@
+import os
+import platform
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# only imported once a DmarcParser is built or used
+HEAVY_MODULES = [
+    "apg_py.api.api",
+    "apg_py.lib.parser",
+    "validators",
+    "numpy",
+    "concurrent.futures",
+    "multiprocessing",
+    "dmarcparser.codegen",
+    "dmarcparser.columnar",
+]
+# cumulative `python -X importtime` time of `import dmarcparser`, best of a few
+# runs; importing the dependencies above takes several times as long. Wall-clock
+# checks are flaky on loaded machines, the sys.modules checks are the guard.
+IMPORT_TIME_THRESHOLD_US = 75_000
+RUNS = 3
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def import_time_us(module: str) -> int:
+    """Cumulative import time of `module` in a fresh interpreter."""
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in:\n{stderr}")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import dmarcparser",
+        "from dmarcparser import DmarcException, ParseOutcome",
+        "from dmarcparser.parser import DmarcResult, DEFAULT_TAGS",
+        "import dmarcparser.tags, dmarcparser.cli",
+    ],
+)
+def test_import_is_lazy(statement: str):
+    code = f"{statement}; import sys; print(' '.join(sys.modules))"
+    modules = set(run_python("-c", code).stdout.split())
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+def test_parse_imports_dependencies():
+    code = (
+        "import sys, dmarcparser; dmarcparser.DmarcParser().parse('v=DMARC1; p=none')"
+        "; print(' '.join(sys.modules))"
+    )
+    modules = set(run_python("-c", code).stdout.split())
+    assert {"apg_py.api.api", "apg_py.lib.parser"} <= modules
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="-X importtime is CPython only",
+)
+@pytest.mark.skipif(
+    not os.environ.get("DMARCPARSER_TIMING_TESTS"),
+    reason="wall-clock check, set DMARCPARSER_TIMING_TESTS=1 to run it",
+)
+def test_import_time():
+    best = min(import_time_us("dmarcparser") for _ in range(RUNS))
+    assert best < IMPORT_TIME_THRESHOLD_US, f"import dmarcparser took {best} us"
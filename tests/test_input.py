@@ -0,0 +1,44 @@
+from apg_py.lib import utilities as apg_util
+
+from dmarcparser import DmarcParser
+from dmarcparser.parser import code_points, select_dmarc_record
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(500)]
+
+
+def test_code_points():
+    for text in ["", "v=DMARC1; p=none", "p=nöne", "\x00\r\n", "中文", "😀 x"]:
+        assert list(code_points(text)) == list(apg_util.string_to_tuple(text))
+
+
+def test_apg_tag_list_offsets():
+    parser = DmarcParser(fast_tag_list=False)
+    success, tag_list, tag_spec_list = parser._check_tag_list_syntax(
+        "v=DMARC1;\r\n p=nöne ; é=x"
+    )
+    assert not success
+    success, tag_list, tag_spec_list = parser._check_tag_list_syntax(
+        "v=DMARC1;\r\n p=none ; x=y"
+    )
+    assert success
+    assert tag_list == ["v", "p", "x"]
+    assert tag_spec_list == ["v=DMARC1", "\r\n p=none ", " x=y"]
+
+
+def test_bytes_input():
+    parser = DmarcParser()
+    for record in CORPUS:
+        expected = parser.parse_result(record)
+        for data in (record.encode("utf-8"), record.encode("latin-1", "replace")):
+            outcome = parser.parse_result(data)
+            assert outcome.error_code == expected.error_code
+            if outcome.ok:
+                assert outcome.result.original_record == record
+                assert outcome.result.effective_value == expected.result.effective_value
+
+
+def test_bytes_rrset():
+    rrset = [(b"v=DMARC1; ", b"p=none"), b"v=spf1 -all"]
+    assert select_dmarc_record(rrset) == "v=DMARC1; p=none"
+    assert DmarcParser().parse_rrset(rrset).p.value == "none"
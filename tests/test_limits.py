@@ -0,0 +1,94 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+
+RECORD = "v=DMARC1; p=reject; rua=https://[1:2:3:4:5:6:7::],mailto:a@example.com"
+FOLDED = "v=DMARC1;\r\n p=none; rua=mailto:a@example.com"
+LIMIT_EXCEEDED = DmarcException.LIMIT_EXCEEDED
+
+
+def test_max_record_length():
+    parser = DmarcParser(max_record_length=len(RECORD))
+    assert parser.parse(RECORD).p.value == "reject"
+    for record in (RECORD + " ", (RECORD + " ").encode("ascii")):
+        outcome = parser.parse_result(record)
+        assert outcome.error_code == LIMIT_EXCEEDED
+        assert str(len(RECORD) + 1) in outcome.message
+    assert DmarcParser().parse(RECORD + " " * 10000).p.value == "reject"
+
+
+def test_max_record_length_cached_variant():
+    parser = DmarcParser(
+        max_record_length=len(RECORD), cache_size=10, canonical_cache=True
+    )
+    parser.parse(RECORD)
+    with pytest.raises(DmarcException) as e:
+        parser.parse(RECORD.replace("; ", ";   "))
+    assert e.value.code == LIMIT_EXCEEDED
+    outcomes, stats = parser.parse_batch(
+        [RECORD, RECORD.replace("; ", ";   ")], canonical=True
+    )
+    assert outcomes[0].p.value == "reject"
+    assert outcomes[1].code == LIMIT_EXCEEDED
+    assert stats.parsed == 2
+
+
+def test_node_budget():
+    for record in (RECORD, FOLDED):
+        with pytest.raises(DmarcException) as e:
+            DmarcParser(node_budget=100, fast_tag_list=False).parse(record)
+        assert e.value.code == LIMIT_EXCEEDED
+        assert "node budget of 100" in e.value.value
+    parser = DmarcParser(node_budget=1000000)
+    # the budget is granted to each record
+    for _ in range(3):
+        assert parser.parse(RECORD).p.value == "reject"
+
+
+def test_node_budget_boundary():
+    parser = DmarcParser(node_budget=10**9, fast_tag_list=False)
+    parser.parse(FOLDED)
+    # the nodes visited by the record, over the tag-list and per-tag parses
+    used = 10**9 - parser._apg.nodes_left
+    # APG stops once a parse reaches its limit, hence one more node
+    assert DmarcParser(node_budget=used + 1, fast_tag_list=False).parse(FOLDED)
+    with pytest.raises(DmarcException):
+        DmarcParser(node_budget=used, fast_tag_list=False).parse(FOLDED)
+
+
+def test_time_budget():
+    record = "v=DMARC1; p=none; rua=mailto:a@example.com; fo=1"
+    parser = DmarcParser(time_budget=1e-9)
+    with pytest.raises(DmarcException) as e:
+        parser.parse(record)
+    assert e.value.code == LIMIT_EXCEEDED
+    assert DmarcParser(time_budget=60).parse(record).fo.value == ["1"]
+
+
+def test_time_budget_not_cached():
+    record = "v=DMARC1; p=none; rua=mailto:a@example.com; fo=1"
+    parser = DmarcParser(time_budget=1e-9, cache_size=16)
+    assert parser.parse_result(record).error_code == LIMIT_EXCEEDED
+    parser.time_budget = 60
+    assert parser.parse(record).fo.value == ["1"]
+    # the node budget does not depend on the load, its failures are cached
+    parser = DmarcParser(node_budget=50, cache_size=16)
+    assert parser.parse_result(RECORD).error_code == LIMIT_EXCEEDED
+    parser.node_budget = 0
+    assert parser.parse_result(RECORD).error_code == LIMIT_EXCEEDED
+
+
+def test_budget_exceeded_parser_reusable():
+    parser = DmarcParser(node_budget=50)
+    assert parser.parse_result(RECORD).error_code == LIMIT_EXCEEDED
+    parser.node_budget = 0
+    assert parser.parse(RECORD).p.value == "reject"
+
+
+def test_limits_in_workers():
+    parser = DmarcParser(max_record_length=100, node_budget=100000)
+    outcomes = list(
+        parser.parse_many([RECORD, RECORD + " " * 100], workers=2, chunksize=1)
+    )
+    assert outcomes[0].p.value == "reject"
+    assert outcomes[1].code == LIMIT_EXCEEDED
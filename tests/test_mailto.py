@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+import validators
+
+from dmarcparser import DmarcParser
+from dmarcparser.mailto import is_valid_email
+from dmarcparser.tags import EmailObj
+from tests.corpus import RECORDS, fuzz_emails, fuzz_records
+
+EMAILS = [
+    "bob@example.com",
+    "Bob.Smith+dmarc@Example.COM",
+    '"quoted local"@example.com',
+    "éa@example.com",
+    "a\n@example.com",
+    "bob@xn--bcher-kva.example",
+    "bob@bücher.example",
+    "bob@example.com.",
+    "bob@_dmarc.example.com",
+    "bob@ex__ample.com",
+    "bob@[127.0.0.1]",
+    "bob@localhost",
+    "bob@@example.com",
+    "a" * 65 + "@example.com",
+    "bob@" + "a" * 63 + ".com",
+    "bob@" + "a" * 64 + ".com",
+    "bob@" + ".".join(["a" * 60] * 5) + ".com",
+    "bob@a..com",
+    "",
+    "@",
+]
+# the builtin validator follows validators 0.36
+requires_validators_036 = pytest.mark.skipif(
+    tuple(map(int, validators.__version__.split(".")[:2])) < (0, 36),
+    reason="needs validators>=0.36",
+)
+
+
+@requires_validators_036
+def test_builtin_validator_matches_validators():
+    for email in [*EMAILS, *fuzz_emails(5000)]:
+        assert is_valid_email(email) == (validators.email(email) is True), email
+
+
+@requires_validators_036
+def test_builtin_validator_parse():
+    default = DmarcParser(mailto_cache_size=0)
+    builtin = DmarcParser(builtin_email_validator=True)
+    for record in [*RECORDS, *fuzz_records(1000)]:
+        expected = default.parse_outcome(record)
+        outcome = builtin.parse_outcome(record)
+        assert type(outcome) is type(expected)
+        if not isinstance(expected, Exception):
+            assert [str(email) for email in outcome.rua.valid] == [
+                str(email) for email in expected.rua.valid
+            ]
+            assert outcome.ruf.other == expected.ruf.other
+
+
+def test_mailto_shared():
+    parser = DmarcParser()
+    first = parser.parse("v=DMARC1; p=none; rua=mailto:a@example.com!10m")
+    second = parser.parse(
+        "v=DMARC1; p=none; rua=mailto:b@example.com,mailto:a@example.com!10m"
+    )
+    assert second.rua.valid[1] is first.rua.valid[0]
+    assert first.rua.valid[0].limit == 10 * 2**20
+    assert parser.retrieve_mail_list("mailto:a@example.com!10m,https://x") == (
+        [first.rua.valid[0]],
+        ["https://x"],
+    )
+
+
+def test_mailto_cache_disabled():
+    parser = DmarcParser(mailto_cache_size=0)
+    record = "v=DMARC1; p=none; rua=mailto:a@example.com"
+    first = parser.parse(record)
+    second = parser.parse(record)
+    assert first.rua.valid[0] is not second.rua.valid[0]
+    assert str(first.rua.valid[0]) == str(second.rua.valid[0])
+
+
+def test_email_obj_read_only():
+    email = EmailObj("a@example.com", 1024, "1k")
+    with pytest.raises(AttributeError):
+        email._limit = 0
+    clone = pickle.loads(pickle.dumps(email))
+    assert (clone.email, clone.limit, clone.limit_org) == ("a@example.com", 1024, "1k")
@@ -0,0 +1,66 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.observers import PHASES, ParseObserver, PrometheusObserver
+
+
+class RecordingObserver(ParseObserver):
+    def __init__(self):
+        self.phases = []
+        self.outcomes = []
+
+    def on_phase(self, phase, duration):
+        assert duration >= 0
+        self.phases.append(phase)
+
+    def on_outcome(self, code):
+        self.outcomes.append(code)
+
+
+@pytest.mark.parametrize(
+    "record,phases,code",
+    [
+        ("v=DMARC1; p=reject", PHASES, None),
+        ("v=DMARC1; p=none; pct=500", PHASES, 95),
+        ("v=DMARC1; pct=100", PHASES, 97),
+        ("v=DMARC1; p=none; p=reject", PHASES[:1], 98),
+        ("v=DMARC1; p=bob", PHASES, 99),
+        ("v=DMARC1 p=none", PHASES[:2], 98),
+        ("p", PHASES[:1], 99),
+    ],
+)
+def test_observer_events(record, phases, code):
+    observer = RecordingObserver()
+    parser = DmarcParser(observer=observer)
+    parser.parse_outcome(record, follow_downgrade=False)
+    assert tuple(observer.phases) == tuple(phases)
+    assert observer.outcomes == [code]
+
+
+def test_cache_hits_observed():
+    observer = RecordingObserver()
+    parser = DmarcParser(cache_size=10, observer=observer)
+    parser.parse("v=DMARC1; p=reject")
+    parser.parse("v=DMARC1; p=reject")
+    assert observer.outcomes == [None, None]
+    assert len(observer.phases) == len(PHASES)
+
+
+def test_prometheus_observer():
+    observer = PrometheusObserver(buckets=(0.5, 1000))
+    parser = DmarcParser(observer=observer)
+    parser.parse("v=DMARC1; p=reject")
+    with pytest.raises(DmarcException):
+        parser.parse("p=reject")
+    text = observer.to_prometheus()
+    assert "# TYPE dmarcparser_phase_duration_seconds histogram" in text
+    assert (
+        'dmarcparser_phase_duration_seconds_bucket{phase="tag_list_syntax",le="1000"} 2'
+        in text
+    )
+    assert (
+        'dmarcparser_phase_duration_seconds_bucket{phase="process",le="+Inf"} 1' in text
+    )
+    assert 'dmarcparser_phase_duration_seconds_count{phase="dmarc_syntax"} 2' in text
+    assert 'dmarcparser_records_total{outcome="valid"} 1' in text
+    assert 'dmarcparser_records_total{outcome="error",code="98"} 1' in text
@@ -0,0 +1,70 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser, ParseOutcome
+from dmarcparser.observers import PrometheusObserver
+from dmarcparser.parser import ENGINES
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(1000)]
+
+
+@pytest.mark.parametrize("follow_downgrade", [True, False])
+@pytest.mark.parametrize("cache_size", [0, 64])
+def test_parse_result_matches_parse(follow_downgrade: bool, cache_size: int):
+    parser = DmarcParser(cache_size=cache_size)
+    for record in [*CORPUS, *CORPUS[:100]]:
+        outcome = parser.parse_result(record, follow_downgrade)
+        assert isinstance(outcome, ParseOutcome)
+        try:
+            expected = parser.parse(record, follow_downgrade)
+        except DmarcException as e:
+            assert not outcome.ok
+            assert not outcome
+            assert outcome.result is None
+            assert (outcome.error_code, outcome.message) == (e.code, e.value)
+            assert str(outcome.exception()) == str(e)
+        else:
+            assert outcome.ok
+            assert outcome.error_code is None and outcome.message is None
+            assert outcome.result.effective_value == expected.effective_value
+
+
+HOSTILE_RECORDS = [
+    "v=DMARC1; p=n\u00f6ne",
+    "v=DMARC1; p=none; rua=mailto:\u00e9@example.com",
+    "v=DMARC1; p=n\udcffne",
+    "\ud800",
+    "v=DMARC1; p=none\0",
+    "\0",
+    b"v=DMARC1; p=n\xffne",
+    b"v=DMARC1; p=none\0",
+    "v=DMARC1; p=none; " + "rua=mailto:a@example.com," * 5000,
+    "v=DMARC1; p=none; x=" + "\U0001f600" * 5000,
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("max_record_length", [0, 1024])
+def test_parse_result_never_raises(engine: str, max_record_length: int):
+    parser = DmarcParser(engine=engine, max_record_length=max_record_length)
+    for record in HOSTILE_RECORDS:
+        outcome = parser.parse_result(record)
+        assert isinstance(outcome, ParseOutcome)
+        assert outcome.ok != isinstance(parser.parse_outcome(record), DmarcException)
+
+
+def test_parse_result_message_lazy():
+    outcome = DmarcParser().parse_result("v=DMARC1; p=none; pct=101")
+    assert outcome.error_code == 95
+    assert outcome._args == (101,)
+    assert outcome.message == "pct value 101 is not valid"
+
+
+def test_parse_result_observer():
+    observer = PrometheusObserver()
+    parser = DmarcParser(observer=observer)
+    parser.parse_result("v=DMARC1; p=none")
+    parser.parse_result("v=spf1 -all")
+    metrics = observer.to_prometheus()
+    assert 'dmarcparser_records_total{outcome="valid"} 1' in metrics
+    assert 'dmarcparser_records_total{outcome="error",code="98"} 1' in metrics
@@ -0,0 +1,101 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import dmarcparser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKERS = 4
+# forks WORKERS children, each building a parser as a parse_many worker does,
+# parsing the corpus and running a full collection, then reporting the memory
+# of the child not shared with the parent (Private_Clean + Private_Dirty)
+WORKER_MEMORY_SCRIPT = """
+import gc, json, multiprocessing, sys
+import dmarcparser
+from tests.corpus import RECORDS
+
+def private_kib():
+    with open("/proc/self/smaps_rollup") as f:
+        fields = dict(line.split(":", 1) for line in f if ":" in line)
+    return sum(int(fields[name].split()[0]) for name in ("Private_Clean", "Private_Dirty"))
+
+def worker(engine, queue):
+    parser = dmarcparser.DmarcParser(engine=engine)
+    for record in RECORDS:
+        parser.parse_outcome(record)
+    gc.collect()
+    queue.put(private_kib())
+
+preload, engine, workers = sys.argv[1] == "preload", sys.argv[2], int(sys.argv[3])
+if preload:
+    dmarcparser.preload(engines=[engine])
+context = multiprocessing.get_context("fork")
+queue = context.Queue()
+children = [context.Process(target=worker, args=(engine, queue)) for _ in range(workers)]
+for child in children:
+    child.start()
+print(json.dumps([queue.get() for _ in children]))
+for child in children:
+    child.join()
+"""
+# memory each worker saves, a parser and its imports take several times as much
+MIN_SAVED_KIB = 2048
+
+
+def worker_private_kib(mode: str, engine: str) -> list:
+    completed = subprocess.run(
+        [sys.executable, "-c", WORKER_MEMORY_SCRIPT, mode, engine, str(WORKERS)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup"), reason="needs Linux smaps_rollup"
+)
+@pytest.mark.parametrize("engine", dmarcparser.parser.ENGINES)
+def test_worker_memory(engine: str):
+    cold = worker_private_kib("cold", engine)
+    preloaded = worker_private_kib("preload", engine)
+    assert len(cold) == len(preloaded) == WORKERS
+    assert max(preloaded) + MIN_SAVED_KIB < min(cold), (preloaded, cold)
+
+
+@pytest.mark.skipif(not hasattr(gc, "freeze"), reason="needs gc.freeze")
+def test_preload():
+    code = (
+        "import gc, sys, dmarcparser; dmarcparser.preload()"
+        "; print(gc.get_freeze_count() > 0, ' '.join(sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    frozen, *modules = completed.stdout.split()
+    assert frozen == "True"
+    assert {
+        "apg_py.lib.parser",
+        "validators",
+        "dmarcparser._recognizer_dmarc",
+        "dmarcparser._recognizer_tag_list",
+    } <= set(modules)
+
+
+def test_preload_invalid_engine():
+    with pytest.raises(ValueError):
+        dmarcparser.preload(engines=["regex"], freeze=False)
+
+
+def test_preload_without_gc_freeze(monkeypatch):
+    monkeypatch.delattr(gc, "freeze")
+    dmarcparser.preload(engines=["apg"])
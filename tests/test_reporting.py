@@ -0,0 +1,193 @@
+import asyncio
+import pickle
+
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.discovery import (
+    DmarcDiscovery,
+    PublicSuffixList,
+    ResolverError,
+    ZoneResolver,
+)
+from dmarcparser.reporting import ReportVerifier
+from dmarcparser.tags import EmailObj
+
+VENDOR_RECORD = "v=DMARC1; p=none; rua=mailto:dmarc@vendor.net,mailto:d@example.com"
+AUTHORIZATIONS = {
+    "example.com._report._dmarc.vendor.net": ["v=DMARC1"],
+    "other.org._report._dmarc.vendor.net": ["v=spf1 -all"],
+    "bad.org._report._dmarc.vendor.net": ["v=DMARC1; =bad"],
+    "split.org._report._dmarc.vendor.net": [(b"v=DMA", b"RC1;")],
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def authorized(outcome) -> list:
+    return [
+        (email_obj.email, email_obj.authorized)
+        for tag in (outcome.rua, outcome.ruf)
+        for email_obj in tag.valid
+    ]
+
+
+def test_email_obj_annotation():
+    email_obj = EmailObj("a@Example.com", 1024, "1k")
+    assert email_obj.authorized is None
+    assert email_obj.host == "Example.com"
+    annotated = email_obj.with_authorized(True)
+    assert (annotated.email, annotated.limit, annotated.authorized) == (
+        "a@Example.com",
+        1024,
+        True,
+    )
+    assert pickle.loads(pickle.dumps(annotated)).authorized is True
+
+
+def test_is_authorized():
+    verifier = ReportVerifier(ZoneResolver(AUTHORIZATIONS))
+
+    async def main():
+        return [
+            await verifier.is_authorized(policy_domain, host)
+            for policy_domain, host in [
+                ("example.com", "vendor.net"),
+                ("Example.COM.", "Vendor.net"),
+                ("sub.example.com", "example.com"),
+                ("other.org", "vendor.net"),
+                ("bad.org", "vendor.net"),
+                ("split.org", "vendor.net"),
+                ("missing.org", "vendor.net"),
+                ("missing.org", "[192.0.2.1]"),
+            ]
+        ]
+
+    assert asyncio.run(main()) == [True, True, True, False, False, True, False, False]
+
+
+def test_external_with_public_suffix_list():
+    verifier = ReportVerifier(
+        ZoneResolver(), public_suffixes=PublicSuffixList(["uk", "co.uk"])
+    )
+    assert not verifier.is_external("mail.example.co.uk", "reports.example.co.uk")
+    assert verifier.is_external("example.co.uk", "vendor.co.uk")
+
+
+def test_verify_batch():
+    resolver = ZoneResolver(AUTHORIZATIONS, delay=0.001)
+    verifier = ReportVerifier(resolver)
+    parser = DmarcParser(mailto_cache_size=1024)
+    compact_parser = DmarcParser(compact_results=True, cache_size=16)
+    domains = ["example.com", "other.org", "missing.org"] * 50
+    batch = [
+        (domain, (compact_parser if i % 2 else parser).parse_outcome(VENDOR_RECORD))
+        for i, domain in enumerate(domains)
+    ]
+    batch.append(("example.com", parser.parse_outcome("v=DMARC1; p=none")))
+    batch.append(("example.com", DmarcException(99, "invalid")))
+    batch.append(("example.com", None))
+    shared = compact_parser.parse_outcome(VENDOR_RECORD)
+
+    outcomes = asyncio.run(verifier.verify(batch))
+    assert len(outcomes) == len(batch)
+    assert [authorized(outcome) for outcome in outcomes[:3]] == [
+        [("dmarc@vendor.net", True), ("d@example.com", True)],
+        [("dmarc@vendor.net", False), ("d@example.com", False)],
+        [("dmarc@vendor.net", False), ("d@example.com", False)],
+    ]
+    for outcome, domain in zip(outcomes, domains):
+        assert authorized(outcome) == authorized(outcomes[domains.index(domain)])
+    assert outcomes[-3:] == [outcome for _, outcome in batch[-3:]]
+    # one lookup per external pair, (example.com, example.com) needs none
+    assert sum(resolver.queries.values()) == 5
+    # DmarcObject annotated in place, cached DmarcResult left untouched
+    assert outcomes[0] is batch[0][1]
+    assert outcomes[1] is not batch[1][1]
+    assert authorized(shared) == [("dmarc@vendor.net", None), ("d@example.com", None)]
+    # annotated copies of the same address shared within the batch
+    assert outcomes[0].rua.valid[0] is outcomes[6].rua.valid[0]
+
+
+def test_verify_discovered_policies():
+    zone = {
+        "_dmarc.example.com": [VENDOR_RECORD],
+        **AUTHORIZATIONS,
+    }
+    resolver = ZoneResolver(zone)
+
+    async def main():
+        discovery = DmarcDiscovery(resolver)
+        verifier = ReportVerifier(resolver)
+        results = [
+            result
+            async for result in discovery.discover_many(
+                ["a.example.com", "b.example.com"]
+            )
+        ]
+        return await verifier.verify(
+            (result.policy_domain, result.outcome) for result in results
+        )
+
+    outcomes = asyncio.run(main())
+    assert [authorized(outcome)[0] for outcome in outcomes] == [
+        ("dmarc@vendor.net", True)
+    ] * 2
+    assert resolver.queries["example.com._report._dmarc.vendor.net"] == 1
+
+
+def test_cache_and_temporary_errors():
+    class FailingResolver(ZoneResolver):
+        failures = 1
+
+        async def resolve_txt(self, name):
+            if self.failures > 0:
+                self.failures -= 1
+                raise ResolverError("timeout")
+            return await super().resolve_txt(name)
+
+    clock = FakeClock()
+    resolver = FailingResolver(AUTHORIZATIONS, ttl=60)
+    verifier = ReportVerifier(resolver, clock=clock)
+
+    def is_authorized():
+        return asyncio.run(verifier.is_authorized("example.com", "vendor.net"))
+
+    assert is_authorized() is None
+    assert is_authorized() is True
+    assert is_authorized() is True
+    assert resolver.queries["example.com._report._dmarc.vendor.net"] == 1
+    assert verifier.cache_info().hits == 1
+    clock.now = 61
+    assert is_authorized() is True
+    assert resolver.queries["example.com._report._dmarc.vendor.net"] == 2
+
+
+def test_verify_unexpected_error():
+    class BrokenResolver(ZoneResolver):
+        async def resolve_txt(self, name):
+            if name.startswith("other.org."):
+                raise RuntimeError(name)
+            await asyncio.Event().wait()
+
+    verifier = ReportVerifier(BrokenResolver())
+    parser = DmarcParser()
+    batch = [
+        (domain, parser.parse_outcome(VENDOR_RECORD))
+        for domain in ("example.com", "other.org", "missing.org")
+    ]
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await verifier.verify(batch)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(main()) == set()
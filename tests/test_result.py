@@ -0,0 +1,91 @@
+import copy
+import pickle
+
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.parser import DEFAULT_TAGS, DmarcObject, DmarcResult
+
+RECORD = "v=DMARC1; p=reject; rua=mailto:bob@example.com!10m; fo=0:d; x=y"
+
+
+def test_compact_result_same_values():
+    dmarc_obj = DmarcParser().parse(RECORD)
+    result = DmarcParser(compact_results=True).parse(RECORD)
+    assert isinstance(result, DmarcResult)
+    for tag_name in ("v", "p", "sp", "adkim", "aspf", "fo", "rf", "ri", "pct"):
+        expected = dmarc_obj[tag_name].effective_value
+        if isinstance(expected, list):
+            expected = tuple(expected)
+        assert result[tag_name].effective_value == expected
+        assert result[tag_name].provided == dmarc_obj[tag_name].provided
+    assert result.rua.valid[0]["email"] == "bob@example.com"
+    assert result.rua.valid[0].limit == 10 * 2**20
+    assert result.fo.value == ("0", "d")
+    assert result.ignored_tags == ("x=y",)
+    assert result.original_record == RECORD
+    assert result.effective_value == dmarc_obj.effective_value
+
+
+def test_compact_result_read_only():
+    result = DmarcParser(compact_results=True).parse(RECORD)
+    with pytest.raises(AttributeError):
+        result.p = None
+    with pytest.raises(AttributeError):
+        result.p.value = "none"
+    with pytest.raises(AttributeError):
+        result.rua.valid.append("alice@example.com")
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(result.p, "__dict__")
+
+
+def test_compact_result_shares_defaults():
+    parser = DmarcParser(compact_results=True)
+    first = parser.parse("v=DMARC1; p=none")
+    second = parser.parse("v=DMARC1; p=reject; aspf=s")
+    assert first.ruf is second.ruf is DEFAULT_TAGS["ruf"]
+    assert first.aspf is DEFAULT_TAGS["aspf"]
+    assert second.aspf is not DEFAULT_TAGS["aspf"]
+    assert first.p.value is parser.parse("v=DMARC1;p=none;").p.value
+
+
+def test_compact_result_cache_shared():
+    parser = DmarcParser(compact_results=True, cache_size=10, canonical_cache=True)
+    result = parser.parse(RECORD)
+    assert parser.parse(RECORD) is result
+    variant = parser.parse(RECORD.replace("; ", ";").replace("p=reject", "P=REJECT"))
+    assert variant is not result
+    assert variant.p is result.p
+    assert variant.original_record != result.original_record
+    with pytest.raises(DmarcException):
+        parser.parse("v=DMARC1; p=bogus")
+
+
+def test_compact_result_pickle():
+    result = DmarcParser(compact_results=True).parse(RECORD)
+    for clone in (pickle.loads(pickle.dumps(result)), copy.deepcopy(result)):
+        assert clone.rua.valid[0]["email"] == "bob@example.com"
+        assert clone.p.value == "reject"
+        assert clone.ruf is DEFAULT_TAGS["ruf"]
+        assert clone.ignored_tags == result.ignored_tags
+
+
+def test_to_dmarc_object():
+    result = DmarcParser(compact_results=True).parse(RECORD)
+    dmarc_obj = result.to_dmarc_object()
+    assert isinstance(dmarc_obj, DmarcObject)
+    dmarc_obj.p.value = "none"
+    dmarc_obj.rua.valid.append("alice@example.com")
+    dmarc_obj.ruf.value = "x"
+    assert result.p.value == "reject"
+    assert len(result.rua.valid) == 1
+    assert DEFAULT_TAGS["ruf"].value is None
+    assert dmarc_obj.fo.value == ["0", "d"]
+
+
+def test_compact_parse_many():
+    parser = DmarcParser(compact_results=True)
+    outcomes = list(parser.parse_many([RECORD, "p=none"], workers=2, chunksize=1))
+    assert isinstance(outcomes[0], DmarcResult)
+    assert outcomes[0].ruf is DEFAULT_TAGS["ruf"]
+    assert isinstance(outcomes[1], DmarcException)
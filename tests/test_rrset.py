@@ -0,0 +1,48 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.parser import select_dmarc_record
+
+SPF = "v=spf1 include:_spf.example.com -all"
+DMARC = "v=DMARC1; p=reject; rua=mailto:bob@example.com"
+
+
+@pytest.mark.parametrize(
+    "record, code",
+    [
+        (SPF, 98),
+        ("google-site-verification=abcdef", 99),
+        ("v=DMARC2; p=none", 98),
+        ("v=dmarc1; p=none", 98),
+        ("p=none; v=DMARC1", 98),
+        ("x=y; p=none", 98),
+        ("", 99),
+    ],
+)
+def test_non_dmarc_codes(record: str, code: int):
+    with pytest.raises(DmarcException) as e:
+        DmarcParser().parse(record)
+    assert e.value.code == code
+
+
+def test_unknown_tags_before_version():
+    assert DmarcParser().parse("x=y; V = DMARC1; p=none").p.value == "none"
+
+
+def test_select_dmarc_record():
+    assert select_dmarc_record([SPF, DMARC, "MS=ms123"]) == DMARC
+    assert select_dmarc_record([SPF, ("v=DMARC1; ", "p=none")]) == "v=DMARC1; p=none"
+    assert select_dmarc_record([SPF, "x=y; v=DMARC1; p=none"]) is None
+    assert select_dmarc_record([" V=DMARC1", "v=DMARC1x"]) == " V=DMARC1"
+    assert select_dmarc_record([]) is None
+    with pytest.raises(DmarcException) as e:
+        select_dmarc_record([DMARC, "v=DMARC1; p=none"])
+    assert e.value.code == DmarcException.MULTIPLE_RECORDS == 94
+
+
+def test_parse_rrset():
+    parser = DmarcParser()
+    assert parser.parse_rrset([SPF, DMARC]).p.value == "reject"
+    assert parser.parse_rrset([SPF]) is None
+    with pytest.raises(DmarcException):
+        parser.parse_rrset(["v=DMARC1; p=bogus", SPF])
@@ -0,0 +1,62 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(400)]
+
+
+def signature(outcome):
+    if isinstance(outcome, DmarcException):
+        return outcome.code, outcome.value
+    return (
+        outcome.effective_value,
+        tuple(outcome.ignored_tags),
+        outcome.p.effective_value,
+        tuple(str(email) for email in outcome.rua.valid),
+    )
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"fast_tag_list": False},
+        {"cache_size": 64, "canonical_cache": True},
+        {"compact_results": True, "mailto_cache_size": 8},
+    ],
+)
+def test_shared_parser_threads(options: dict, switch_often):
+    expected = [signature(DmarcParser().parse_outcome(record)) for record in CORPUS]
+    parser = DmarcParser(**options)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        chunks = [CORPUS[i::8] for i in range(8)]
+        results = executor.map(
+            lambda chunk: [signature(parser.parse_outcome(r)) for r in chunk], chunks
+        )
+        for i, chunk_results in enumerate(results):
+            assert chunk_results == expected[i::8]
+
+
+def test_apg_parsers_per_thread():
+    parser = DmarcParser()
+    main_parsers = parser._apg.tag_list_parser, parser._apg.dmarc_tag_parser
+    assert parser._apg.tag_list_parser is main_parsers[0]
+    other_parsers = []
+    thread = threading.Thread(
+        target=lambda: other_parsers.append(parser._apg.tag_list_parser)
+    )
+    thread.start()
+    thread.join()
+    assert other_parsers[0] is not main_parsers[0]
@@ -0,0 +1,51 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+from dmarcparser.tokenizer import scan_tag_list
+from tests.corpus import RECORDS, fuzz_records
+
+CORPUS = [*RECORDS, *fuzz_records(2000)]
+
+
+@pytest.fixture(scope="module")
+def parser() -> DmarcParser:
+    return DmarcParser()
+
+
+@pytest.mark.parametrize("record", CORPUS)
+def test_scanner_matches_apg(parser: DmarcParser, record: str):
+    scanned = scan_tag_list(record)
+    if scanned is None:
+        # the scanner hands off to apg, nothing to compare
+        return
+    success, tag_list, tag_spec_list = scanned
+    apg_success, apg_tag_list, apg_tag_spec_list = parser._apg_check_tag_list_syntax(
+        record
+    )
+    assert success == apg_success
+    if success:
+        assert tag_list == apg_tag_list
+        assert tag_spec_list == apg_tag_spec_list
+
+
+@pytest.mark.parametrize(
+    "record",
+    ["v=DMARC1;\r\n p=none", "v=DMARC1; p=n\x00ne", "v=DMARC1; p=nöne"],
+)
+def test_scanner_hands_off(record: str):
+    assert scan_tag_list(record) is None
+
+
+def outcome(parser: DmarcParser, record: str):
+    try:
+        result = parser.parse(record)
+    except DmarcException as e:
+        return e.code, e.value
+    return result.effective_value, result.ignored_tags, result.p.effective_value
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_parse_with_and_without_scanner(record: str):
+    assert outcome(DmarcParser(), record) == outcome(
+        DmarcParser(fast_tag_list=False), record
+    )
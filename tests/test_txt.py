@@ -0,0 +1,58 @@
+import pytest
+
+from dmarcparser import DmarcException, DmarcParser
+
+RECORD = "v=DMARC1; p=reject; rua=" + ",".join(
+    f"mailto:report-{i}@example.com" for i in range(12)
+)
+
+
+def test_parse_txt_chunks():
+    parser = DmarcParser()
+    data = RECORD.encode("ascii")
+    assert len(data) > 255
+    chunks = [data[:255], data[255:]]
+    result = parser.parse_txt(chunks)
+    assert result.original_record == RECORD
+    assert len(result.rua.valid) == 12
+    mixed = [RECORD[:100], data[100:255], RECORD[255:]]
+    assert parser.parse_txt(mixed).original_record == RECORD
+    assert parser.parse_txt([RECORD]).original_record == RECORD
+
+
+@pytest.mark.parametrize(
+    "chunks,code",
+    [
+        ([b"v=DMARC1; ", b"p=none\0"], DmarcException.BACKSLAH_ZERO),
+        (["v=DMARC1;\0 p=none"], DmarcException.BACKSLAH_ZERO),
+        ([b"v=DMARC1; ", "p=nöne".encode("utf-8")], 99),
+        (["v=DMARC1; p=nöne"], 99),
+        ([b"v=DMARC1; ", b"p=bogus"], 99),
+    ],
+)
+def test_parse_txt_rejected(chunks, code):
+    with pytest.raises(DmarcException) as e:
+        DmarcParser().parse_txt(chunks)
+    assert e.value.code == code
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_txt_rrsets(workers):
+    rrsets = [
+        [b"v=spf1 -all"],
+        [(b"v=DMARC1; ", b"p=none")],
+        ["v=DMARC1; p=none", "v=DMARC1; p=reject"],
+        [(b"v=DMARC1; p=none", b"\0")],
+        ["v=DMARC1; p=bogus"],
+        [],
+        [RECORD],
+    ]
+    outcomes = DmarcParser().parse_txt_rrsets(rrsets, workers=workers, chunksize=1)
+    assert len(outcomes) == len(rrsets)
+    assert outcomes[0] is None
+    assert outcomes[1].p.value == "none"
+    assert outcomes[2].code == 94
+    assert outcomes[3].code == DmarcException.BACKSLAH_ZERO
+    assert outcomes[4].code == 99
+    assert outcomes[5] is None
+    assert outcomes[6].original_record == RECORD